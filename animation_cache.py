@@ -0,0 +1,52 @@
+import pygame
+
+from assets import assets
+
+# Process-wide cache of sprite sheets and the frames cut from them, keyed by
+# (sheet, frame rect, scale, flip). Player, SlashAttack and the weapons all
+# share it, so attacks, facing changes and new runs reuse the same surfaces
+# instead of cutting, scaling and flipping frames again.
+#
+# Sheets are keyed by the Surface object itself; load_sheet() hands out the
+# asset manager's one Surface per file so every user of it hits the same entries.
+
+_FRAMES = {}
+
+# Frames built (misses) and served from the cache (hits)
+stats = {'hits': 0, 'misses': 0}
+
+
+def load_sheet(path):
+    """The sprite sheet at `path`, loaded and converted once per process (see assets.py)."""
+    return assets.image(path)
+
+
+def frame(sheet, rect, scale=1, flip=False):
+    """One frame: `rect` (x, y, w, h) of `sheet`, scaled, optionally mirrored horizontally."""
+    key = (sheet, rect, scale, flip)
+    image = _FRAMES.get(key)
+    if image is not None:
+        stats['hits'] += 1
+        return image
+    stats['misses'] += 1
+    if flip:
+        # Mirror the cached upright frame rather than cutting and scaling again
+        image = pygame.transform.flip(frame(sheet, rect, scale), True, False)
+    else:
+        image = sheet.subsurface(pygame.Rect(rect)).copy()
+        if scale != 1:
+            width, height = rect[2], rect[3]
+            image = pygame.transform.scale(image, (int(width * scale), int(height * scale)))
+    _FRAMES[key] = image
+    return image
+
+
+def strip(sheet, frame_size, start, end, row=0, scale=1, flip=False):
+    """Frames start..end (inclusive) of one row of equally sized frames, as a tuple."""
+    width, height = frame_size
+    return tuple(frame(sheet, (n * width, row * height, width, height), scale, flip)
+                 for n in range(start, end + 1))
+
+
+def clear():
+    _FRAMES.clear()
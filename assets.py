@@ -0,0 +1,234 @@
+import os
+import time
+import threading
+
+import pygame
+
+# Every image goes through one AssetManager:
+#
+#     from assets import assets
+#     image = assets.image('Rat.png')
+#
+# Names resolve case-insensitively against the files next to the game, so
+# config entries like 'magnet.png' find Magnet.png on case-sensitive
+# filesystems too. Each image is decoded and converted once. preload() does
+# every asset up front; it can decode on a background thread while the main
+# thread keeps running the menu (see Main._warm_up). Small sprites
+# are packed into a shared atlas and handed out as subsurfaces of it.
+# report() lists per-asset load time and memory.
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+# Formats without an alpha channel are converted opaque (faster blits)
+OPAQUE_EXTENSIONS = ('.jpg', '.jpeg')
+
+ASSET_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class AssetManager:
+    def __init__(self, root=ASSET_DIR, atlas_max_sprite=64, atlas_size=512):
+        self.root = root
+        self.atlas_max_sprite = atlas_max_sprite  # sprites up to this size (px) are atlas-packed
+        self.atlas_size = atlas_size
+        self.atlases = []
+        self._index = None            # lowercase file name -> file name on disk
+        self._images = {}             # file name -> converted Surface
+        self._handed_out = set()      # file names already returned by image()
+        self._decoded = {}            # file name -> decoded, not yet converted Surface
+        self._decoding = set()        # file names a thread has claimed and is decoding
+        self.stats = {}               # file name -> {'decode_ms', 'convert_ms', 'bytes', 'size', 'atlas'}
+        self.preload_ms = 0.0
+        # Guards _decoded, _decoding and stats; notified when a decode finishes
+        self._lock = threading.Condition()
+        self._thread = None
+        self._pending = []
+        self._preload_started = 0.0
+
+    # --- Discovery ---
+
+    def discover(self):
+        """Image files in the asset directory, sorted by name."""
+        if self._index is None:
+            index = {}
+            for name in sorted(os.listdir(self.root)):
+                if name.lower().endswith(IMAGE_EXTENSIONS) and os.path.isfile(os.path.join(self.root, name)):
+                    index.setdefault(name.lower(), name)
+            self._index = index
+        return sorted(self._index.values())
+
+    def resolve(self, name):
+        """File name on disk for `name` (case-insensitive); raises FileNotFoundError."""
+        self.discover()
+        found = self._index.get(os.path.basename(name).lower())
+        if found is None:
+            raise FileNotFoundError(f"no asset named {name!r} in {self.root}")
+        return found
+
+    def exists(self, name):
+        try:
+            self.resolve(name)
+        except FileNotFoundError:
+            return False
+        return True
+
+    # --- Loading ---
+
+    def _claim(self, filename):
+        # Call with the lock held. True if the caller should decode `filename`:
+        # nobody has converted, decoded or started decoding it yet
+        if filename in self._images or filename in self._decoded or filename in self._decoding:
+            return False
+        self._decoding.add(filename)
+        return True
+
+    def _decode(self, filename):
+        # Only for a file this thread has claimed
+        try:
+            started = time.perf_counter()
+            surface = pygame.image.load(os.path.join(self.root, filename))
+            decode_ms = (time.perf_counter() - started) * 1000.0
+            with self._lock:
+                self._decoded[filename] = surface
+                self.stats[filename] = {'decode_ms': decode_ms, 'convert_ms': 0.0, 'bytes': 0,
+                                        'size': surface.get_size(), 'atlas': None}
+        finally:
+            with self._lock:
+                self._decoding.discard(filename)
+                self._lock.notify_all()
+
+    def _convert(self, filename):
+        # Main thread only. Takes the decoded surface, waiting for the preload
+        # thread if it is decoding the file right now, or decodes it here
+        with self._lock:
+            while filename in self._decoding:
+                self._lock.wait()
+            if filename in self._images:
+                return self._images[filename]
+            surface = self._decoded.pop(filename, None)
+            claimed = surface is None and self._claim(filename)
+        if claimed:
+            self._decode(filename)
+            with self._lock:
+                surface = self._decoded.pop(filename)
+        started = time.perf_counter()
+        if filename.lower().endswith(OPAQUE_EXTENSIONS):
+            surface = surface.convert()
+        else:
+            surface = surface.convert_alpha()
+        entry = self.stats[filename]
+        entry['convert_ms'] = (time.perf_counter() - started) * 1000.0
+        entry['bytes'] = surface.get_width() * surface.get_height() * surface.get_bytesize()
+        self._images[filename] = surface
+        return surface
+
+    def image(self, name):
+        """The converted image for `name`, loaded on first use unless preloaded."""
+        filename = self.resolve(name)
+        surface = self._images.get(filename)
+        if surface is None:
+            surface = self._convert(filename)
+        self._handed_out.add(filename)
+        return surface
+
+    # --- Preloading ---
+
+    def preload(self, names=None, background=False):
+        """Decode and convert `names` (every discovered asset if None), then pack the atlas.
+
+        With background=True only the decoding runs, on a thread; poll
+        `ready()` and call `finish_preload()` on the main thread once it is
+        (converting needs the display and must stay on the main thread).
+        """
+        filenames = [self.resolve(name) for name in names] if names is not None else self.discover()
+        pending = [f for f in filenames if f not in self._images]
+        self._preload_started = time.perf_counter()
+        self._pending = pending
+        if background:
+            self._thread = threading.Thread(target=self._decode_all, args=(pending,),
+                                            name='asset-preload', daemon=True)
+            self._thread.start()
+            return
+        self._decode_all(pending)
+        self.finish_preload()
+
+    def _decode_all(self, filenames):
+        for filename in filenames:
+            # The main thread may have needed (and claimed) it first
+            with self._lock:
+                claimed = self._claim(filename)
+            if claimed:
+                self._decode(filename)
+
+    def ready(self):
+        return self._thread is None or not self._thread.is_alive()
+
+    def finish_preload(self):
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        for filename in self._pending:
+            if filename not in self._images:
+                self._convert(filename)
+        self._pack_atlas(self._pending)
+        self._pending = []
+        self._decoded.clear()
+        self.preload_ms = (time.perf_counter() - self._preload_started) * 1000.0
+
+    # --- Atlas ---
+
+    def _pack_atlas(self, filenames):
+        # Shelf packing, tallest first; each packed image is replaced by a
+        # subsurface so every small sprite blits from the same texture.
+        # Images already handed out stay standalone so users share one copy
+        limit = self.atlas_max_sprite
+        small = [f for f in filenames
+                 if f not in self._handed_out
+                 and not f.lower().endswith(OPAQUE_EXTENSIONS)
+                 and self.stats[f]['atlas'] is None
+                 and max(self._images[f].get_size()) <= limit]
+        small.sort(key=lambda f: (-self._images[f].get_height(), f))
+        size = self.atlas_size
+        placements = []
+        x = y = shelf = 0
+        for filename in small:
+            w, h = self._images[filename].get_size()
+            if x + w > size:
+                x, y, shelf = 0, y + shelf, 0
+            if y + h > size:
+                break  # Atlas full; the rest stay standalone
+            placements.append((filename, pygame.Rect(x, y, w, h)))
+            x += w
+            shelf = max(shelf, h)
+        if not placements:
+            return
+        used_h = max(rect.bottom for _, rect in placements)
+        used_w = max(rect.right for _, rect in placements)
+        atlas = pygame.Surface((used_w, used_h), pygame.SRCALPHA).convert_alpha()
+        atlas.fill((0, 0, 0, 0))
+        index = len(self.atlases)
+        for filename, rect in placements:
+            atlas.blit(self._images[filename], rect, special_flags=pygame.BLEND_RGBA_MAX)
+            self._images[filename] = atlas.subsurface(rect)
+            self.stats[filename]['atlas'] = (index, tuple(rect))
+        self.atlases.append(atlas)
+
+    # --- Reporting ---
+
+    def memory_bytes(self):
+        standalone = sum(entry['bytes'] for entry in self.stats.values() if entry['atlas'] is None)
+        packed = sum(atlas.get_width() * atlas.get_height() * atlas.get_bytesize() for atlas in self.atlases)
+        return standalone + packed
+
+    def report(self):
+        """Lines describing every loaded asset, slowest first."""
+        lines = [f"assets: {len(self.stats)} images, {self.memory_bytes() / 1024:.0f} KiB, "
+                 f"{len(self.atlases)} atlas(es), preload {self.preload_ms:.1f} ms"]
+        for filename, entry in sorted(self.stats.items(),
+                                      key=lambda item: -(item[1]['decode_ms'] + item[1]['convert_ms'])):
+            w, h = entry['size']
+            where = f" atlas {entry['atlas'][0]} @ {entry['atlas'][1][:2]}" if entry['atlas'] else ''
+            lines.append(f"  {filename:<28} {entry['decode_ms']:7.2f} ms decode {entry['convert_ms']:6.2f} ms convert"
+                         f"  {w}x{h} {entry['bytes'] / 1024:7.1f} KiB{where}")
+        return lines
+
+
+assets = AssetManager()
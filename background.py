@@ -0,0 +1,26 @@
+import pygame
+
+
+class BackgroundRenderer:
+    """Scrolling tiled background drawn with a single blit per frame.
+
+    The tile is composed once into a surface one tile larger than the view in
+    each direction. Because the pattern repeats every tile, any camera offset
+    maps (modulo the tile size) to a view-sized window inside that surface.
+    """
+
+    def __init__(self, tile: pygame.Surface, view_size):
+        self.tile = tile
+        self.tile_w, self.tile_h = tile.get_size()
+        self.view_w, self.view_h = view_size
+        self.chunk = pygame.Surface((self.view_w + self.tile_w, self.view_h + self.tile_h)).convert()
+        for y in range(0, self.chunk.get_height(), self.tile_h):
+            for x in range(0, self.chunk.get_width(), self.tile_w):
+                self.chunk.blit(tile, (x, y))
+        self._area = pygame.Rect(0, 0, self.view_w, self.view_h)
+
+    def draw(self, surface, offset):
+        area = self._area
+        area.x = int(offset[0]) % self.tile_w
+        area.y = int(offset[1]) % self.tile_h
+        surface.blit(self.chunk, (0, 0), area)
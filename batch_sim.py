@@ -0,0 +1,294 @@
+import os
+import sys
+import copy
+import json
+import time
+import random
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import game_clock
+import game_random
+from settings import *
+from headless import create_headless_level, first_choice
+from benchmark import summarize, environment
+
+# Balance sweeps: many headless games run in parallel worker processes, each
+# from a seed, a config override and a scripted upgrade policy. Results are
+# aggregated per (config, policy) pair so tuning changes can be compared over
+# thousands of runs:
+#
+#   python batch_sim.py --runs 200 --config faster_rats=rats.json \
+#       --policy first --policy prefer:unlock_orb,orb_count_plus --out sweep.json
+#
+# An override file is JSON keyed by table name, deep-merged over the defaults:
+#   {"ENEMY_TYPES": {"rat": {"speed": 60}}, "DEFAULT_DROP": {"chance": 0.4}}
+
+# Tables an override may patch (module, attribute)
+TUNABLES = {
+    'ENEMY_TYPES': ('enemy_config', 'ENEMY_TYPES'),
+    'ENEMY_SPAWN_WEIGHTS': ('enemy_config', 'ENEMY_SPAWN_WEIGHTS'),
+    'DEFAULT_DROP': ('enemy_config', 'DEFAULT_DROP'),
+    'DROP_TYPES': ('enemy_config', 'DROP_TYPES'),
+    'UPGRADE_CHOICES': ('upgrade_system', 'UPGRADE_CHOICES'),
+}
+
+# Scripted movement: held direction per time slice (see Player.read_input)
+MOVEMENTS = ('still', 'kite')
+KITE_SLICE_MS = 1500
+
+
+def _table(name):
+    module_name, attr = TUNABLES[name]
+    return getattr(__import__(module_name), attr)
+
+
+def _merge(target, patch):
+    for key, value in patch.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _merge(target[key], value)
+        else:
+            target[key] = copy.deepcopy(value)
+
+
+def apply_overrides(overrides):
+    """Deep-merge `overrides` into the config tables in place; returns what restore() needs.
+
+    Tables are patched in place because every module imported them by
+    reference; worker processes are reused, so each run restores afterwards.
+    """
+    saved = {}
+    for name, patch in overrides.items():
+        if name not in TUNABLES:
+            raise ValueError(f"unknown config table {name!r} (expected one of {', '.join(TUNABLES)})")
+        table = _table(name)
+        saved[name] = copy.deepcopy(table)
+        _merge(table, patch)
+    return saved
+
+
+def restore_overrides(saved):
+    for name, original in saved.items():
+        table = _table(name)
+        table.clear()
+        table.update(original)
+
+
+def _upgrade_key(choice):
+    from upgrade_system import UPGRADE_CHOICES
+    for key, data in UPGRADE_CHOICES.items():
+        if data['name'] == choice['name']:
+            return key
+    return None
+
+
+def make_policy(spec, seed=0):
+    """Upgrade policy from its spec: 'first', 'random' or 'prefer:key,key,...'.
+
+    'prefer' takes the offered card ranked highest in its UPGRADE_CHOICES key
+    list (unlisted cards rank last, ties go to the first offered).
+    """
+    if spec == 'first':
+        return first_choice
+    if spec == 'random':
+        # Own stream so the policy never shifts the gameplay RNG
+        rng = random.Random(f"{seed}:policy")
+        return lambda choices: rng.randrange(len(choices))
+    if spec.startswith('prefer:'):
+        order = [key.strip() for key in spec[len('prefer:'):].split(',') if key.strip()]
+        rank = {key: i for i, key in enumerate(order)}
+
+        def prefer(choices):
+            ranks = [rank.get(_upgrade_key(choice), len(order)) for choice in choices]
+            return ranks.index(min(ranks))
+        return prefer
+    raise ValueError(f"unknown upgrade policy {spec!r}")
+
+
+def _movement_mask(movement, now_ms):
+    from player import INPUT_LEFT, INPUT_RIGHT, INPUT_UP, INPUT_DOWN
+    if movement == 'kite':
+        return (INPUT_RIGHT, INPUT_DOWN, INPUT_LEFT, INPUT_UP)[int(now_ms // KITE_SLICE_MS) % 4]
+    return 0
+
+
+def run_game(seed, overrides=None, policy='first', movement='still', minutes=10.0, step=SIM_STEP,
+             separation_cell=None):
+    """Play one headless game until the player dies or `minutes` pass; returns its metrics.
+
+    `separation_cell` turns crowd separation on (it is off by default, see
+    ENEMY_SEPARATION_CELL).
+    """
+    saved = apply_overrides(overrides or {})
+    try:
+        level = create_headless_level()
+        level.enemy_manager.set_separation_cell(separation_cell)
+        game_random.seed(seed)
+        level.reset()
+        choose = make_policy(policy, seed)
+        clock = game_clock.get_clock()
+        start_ms = clock.get_ticks()
+        step_ms = step * 1000.0
+        steps = int(round(minutes * 60.0 / step))
+        step_times = []
+        level_times = []   # seconds at which levels 2, 3, ... were reached
+        reached = level.player.level
+        peak_enemies = 0
+        died = False
+        for _ in range(steps):
+            clock.advance(step_ms)
+            now = clock.get_ticks()
+            level.player.input_override = _movement_mask(movement, now - start_ms)
+            started = time.perf_counter()
+            level.step(step)
+            step_times.append((time.perf_counter() - started) * 1000.0)
+            if level.level_up_screen.is_active:
+                level.choose_upgrade(choose(level.level_up_screen.upgrade_choices))
+            while reached < level.player.level:
+                reached += 1
+                level_times.append(round((now - start_ms) / 1000.0, 3))
+            peak_enemies = max(peak_enemies, len(level.enemy_manager.enemy_list))
+            if level.player.current_health <= 0:
+                died = True
+                break
+        survival_s = len(step_times) * step
+        return {
+            'seed': seed,
+            'policy': policy,
+            'movement': movement,
+            'died': died,
+            'survival_s': round(survival_s, 3),
+            'kills': level.kills,
+            'kills_per_s': round(level.kills / survival_s, 4) if survival_s else 0.0,
+            'level': level.player.level,
+            'level_times': level_times,
+            'peak_enemies': peak_enemies,
+            'step_ms': summarize(step_times),
+        }
+    finally:
+        restore_overrides(saved)
+
+
+def _run_job(job):
+    result = run_game(job['seed'], job['overrides'], job['policy'], job['movement'],
+                      job['minutes'], job['step'], job['separation_cell'])
+    result['config'] = job['config']
+    return result
+
+
+def aggregate(runs):
+    """Summary per (config, policy, movement) group of run results."""
+    groups = {}
+    for run in runs:
+        groups.setdefault((run['config'], run['policy'], run['movement']), []).append(run)
+    summary = []
+    for (config, policy, movement), group in sorted(groups.items()):
+        max_level = max(len(run['level_times']) for run in group) + 1
+        xp_curve = {}
+        for lvl in range(2, max_level + 1):
+            times = [run['level_times'][lvl - 2] for run in group if len(run['level_times']) >= lvl - 1]
+            xp_curve[lvl] = {'reached': round(len(times) / len(group), 4), 'seconds': summarize(times)}
+        summary.append({
+            'config': config,
+            'policy': policy,
+            'movement': movement,
+            'runs': len(group),
+            'death_rate': round(sum(run['died'] for run in group) / len(group), 4),
+            'survival_s': summarize([run['survival_s'] for run in group]),
+            'kills_per_s': summarize([run['kills_per_s'] for run in group]),
+            'final_level': summarize([run['level'] for run in group]),
+            'xp_curve': xp_curve,
+            'step_ms_p50': summarize([run['step_ms']['p50'] for run in group]),
+            'step_ms_p99': summarize([run['step_ms']['p99'] for run in group]),
+        })
+    return summary
+
+
+def _parse_config(spec):
+    # NAME=path.json, or a bare path named after its file
+    name, sep, path = spec.partition('=')
+    if not sep:
+        path = name
+        name = os.path.splitext(os.path.basename(path))[0]
+    with open(path) as f:
+        return name, json.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run headless games in parallel for balance sweeps.')
+    parser.add_argument('--runs', type=int, default=20, help='seeds per (config, policy, movement)')
+    parser.add_argument('--seed', type=int, default=1, help='first seed; runs use seed .. seed + runs - 1')
+    parser.add_argument('--minutes', type=float, default=10.0, help='simulated time cap per game')
+    parser.add_argument('--step', type=float, default=SIM_STEP, help='simulation step in seconds')
+    parser.add_argument('--config', action='append', default=[], metavar='[NAME=]PATH',
+                        help='JSON config override to sweep (repeatable); the baseline always runs')
+    parser.add_argument('--policy', action='append', default=[],
+                        help="upgrade policy: first, random or prefer:key,key,... (repeatable)")
+    parser.add_argument('--movement', action='append', default=[], choices=MOVEMENTS,
+                        help='scripted player movement (repeatable)')
+    parser.add_argument('--separation-cell', type=int, default=ENEMY_SEPARATION_CELL, metavar='PX',
+                        help='turn crowd separation on with this grid cell size (off by default)')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(), help='worker processes')
+    parser.add_argument('--out', metavar='PATH', default='batch_results.json', help='results file')
+    args = parser.parse_args(argv)
+
+    configs = [('baseline', {})]
+    for spec in args.config:
+        try:
+            name, overrides = _parse_config(spec)
+        except (OSError, ValueError) as e:
+            parser.error(f"--config {spec}: {e}")
+        unknown = set(overrides) - set(TUNABLES)
+        if unknown:
+            parser.error(f"--config {spec}: unknown tables {', '.join(sorted(unknown))}")
+        configs.append((name, overrides))
+    policies = args.policy or ['first']
+    for spec in policies:
+        try:
+            make_policy(spec)
+        except ValueError as e:
+            parser.error(str(e))
+    movements = args.movement or ['still']
+
+    jobs = [{'seed': seed, 'config': name, 'overrides': overrides, 'policy': policy,
+             'movement': movement, 'minutes': args.minutes, 'step': args.step,
+             'separation_cell': args.separation_cell}
+            for name, overrides in configs for policy in policies for movement in movements
+            for seed in range(args.seed, args.seed + args.runs)]
+
+    started = time.perf_counter()
+    runs = []
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        futures = [pool.submit(_run_job, job) for job in jobs]
+        for done, future in enumerate(as_completed(futures), 1):
+            runs.append(future.result())
+            if done % max(1, len(jobs) // 20) == 0 or done == len(jobs):
+                print(f"{done}/{len(jobs)} games ({time.perf_counter() - started:.1f} s)")
+    elapsed = time.perf_counter() - started
+    runs.sort(key=lambda run: (run['config'], run['policy'], run['movement'], run['seed']))
+
+    summary = aggregate(runs)
+    for group in summary:
+        print(f"{group['config']:<14} {group['policy']:<20} {group['movement']:<6} "
+              f"survival p50 {group['survival_s']['p50']:7.1f} s  deaths {group['death_rate']:5.0%}  "
+              f"kills/s {group['kills_per_s']['mean']:5.2f}  level {group['final_level']['mean']:5.1f}  "
+              f"step p50 {group['step_ms_p50']['p50']:.3f} ms")
+    print(f"{len(runs)} games in {elapsed:.1f} s ({len(runs) * 3600.0 / max(elapsed, 1e-9):.0f} games/hour, "
+          f"{args.jobs} workers)")
+
+    results = {
+        'environment': environment(),
+        'settings': {'runs': args.runs, 'seed': args.seed, 'minutes': args.minutes, 'step': args.step,
+                     'jobs': args.jobs, 'configs': dict(configs), 'policies': policies,
+                     'movements': movements, 'separation_cell': args.separation_cell},
+        'elapsed_s': round(elapsed, 2),
+        'summary': summary,
+        'runs': runs,
+    }
+    with open(args.out, 'w') as f:
+        json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,235 @@
+import sys
+import json
+import math
+import time
+import platform
+import argparse
+import subprocess
+
+import pygame
+
+import game_clock
+import game_random
+from settings import *
+from headless import create_headless_level
+from profiler import profiler
+
+# Scripted horde scenarios driven through the Level simulation core, timed per
+# subsystem with the profiler's scopes. Results are written as JSON so runs on
+# different commits can be compared:  python benchmark.py --json bench.json
+
+# Top-level scopes opened by Level.step / Level.render
+SUBSYSTEMS = ('spawn', 'move', 'collision', 'drops', 'damage_numbers', 'draw')
+
+# Grid cell size (px) the separation scenarios turn crowd separation on with
+SEPARATION_CELL = 40
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(math.ceil(pct / 100.0 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(values):
+    ordered = sorted(values)
+    return {
+        'p50': round(percentile(ordered, 50), 4),
+        'p95': round(percentile(ordered, 95), 4),
+        'p99': round(percentile(ordered, 99), 4),
+        'mean': round(sum(ordered) / len(ordered), 4) if ordered else 0.0,
+    }
+
+
+def timed_frame(level, dt):
+    """One frame as Level.run draws it; returns the profiler's {scope path: ms} for it.
+
+    While the level-up screen is open gameplay is frozen, so only the scene
+    behind it and the overlay are drawn.
+    """
+    if level.level_up_screen.is_active:
+        with profiler.scope('draw'):
+            level.render_level_up()
+    else:
+        level.step(dt)
+        level.render()
+    return profiler.end_frame()
+
+
+# --- Scenario setup ---
+
+def populate_enemies(level, count, inner=150, outer=1400):
+    """Place `count` enemies in a ring around the player (mixed types)."""
+    rng = game_random.rng
+    manager = level.enemy_manager
+    types = list(manager.enemy_spawn_weights.keys())
+    cx, cy = level.player.rect.center
+    for _ in range(count):
+        angle = rng.uniform(0.0, 2.0 * math.pi)
+        radius = rng.uniform(inner, outer)
+        x = int(cx + math.cos(angle) * radius)
+        y = int(cy + math.sin(angle) * radius)
+        manager.enemy_list.add(manager.create_enemy(x, y, rng.choice(types)))
+    manager.spatial_hash.rebuild(manager.enemy_list)
+
+
+def unlock_all_weapons(level):
+    from upgrade_system import apply_upgrade
+    for effect, value in (('unlock_orb', 1), ('orb_count_plus', 4), ('unlock_back_slash', 1)):
+        apply_upgrade(effect, value, level.player, level.weapons)
+
+
+def scatter_drops(level, count, drop_type='exp', radius=1200):
+    rng = game_random.rng
+    cx, cy = level.player.rect.center
+    for _ in range(count):
+        pos = (cx + rng.uniform(-radius, radius), cy + rng.uniform(-radius, radius))
+        level.drops.add(level.drop_pool.acquire(level.display, pos, drop_type, 2))
+
+
+def setup_horde(count):
+    def setup(level):
+        populate_enemies(level, count)
+    return setup
+
+
+def setup_separation(count):
+    # Crowd separation is opt-in (ENEMY_SEPARATION_CELL); turn it on to measure it
+    def setup(level):
+        level.enemy_manager.set_separation_cell(SEPARATION_CELL)
+        populate_enemies(level, count)
+    return setup
+
+
+def setup_all_weapons(level):
+    unlock_all_weapons(level)
+    populate_enemies(level, 2000)
+
+
+def setup_drop_flood(level):
+    populate_enemies(level, 500)
+    scatter_drops(level, 3000)
+    # Same path as picking up a magnet drop: every drop homes in on the player
+    level._effect_magnet(None)
+
+
+def setup_exp_rain(level):
+    populate_enemies(level, 500)
+    level.level_up_screen.particles = True
+
+
+def exp_rain_per_frame(level, frame):
+    # Every 60 frames: 30 under a freshly opened level-up screen (new rain),
+    # then pick a card and play 30 so the horde keeps moving and colliding
+    phase = frame % 60
+    if phase == 0:
+        level.show_level_up_choices()
+    elif phase >= 30 and level.level_up_screen.is_active:
+        level.choose_upgrade(0)
+
+
+SCENARIOS = {
+    'horde_500': (setup_horde(500), None),
+    'horde_2k': (setup_horde(2000), None),
+    'horde_5k': (setup_horde(5000), None),
+    'horde_10k': (setup_horde(10000), None),
+    'separation_2k': (setup_separation(2000), None),
+    'separation_5k': (setup_separation(5000), None),
+    'all_weapons': (setup_all_weapons, None),
+    'drop_flood': (setup_drop_flood, None),
+    'exp_rain': (setup_exp_rain, exp_rain_per_frame),
+}
+
+
+def run_scenario(name, frames=300, warmup=30, step=SIM_STEP, seed=1):
+    setup, per_frame = SCENARIOS[name]
+    level = create_headless_level()
+    game_random.seed(seed)
+    level.reset()
+    level.player.input_override = 0
+    setup(level)
+
+    clock = game_clock.get_clock()
+    profiler.reset()
+    profiler.set_enabled(True)
+    samples = {}
+    try:
+        for frame in range(warmup + frames):
+            clock.advance(step * 1000.0)
+            if per_frame is not None:
+                per_frame(level, frame)
+            elif level.level_up_screen.is_active:
+                level.choose_upgrade(0)
+            totals = timed_frame(level, step)
+            if frame < warmup:
+                continue
+            for path in set(samples) | set(totals):
+                samples.setdefault(path, [0.0] * (frame - warmup)).append(totals.get(path, 0.0))
+    finally:
+        profiler.set_enabled(False)
+
+    frame_totals = [sum(values) for values in zip(*(samples.get(name, [0.0] * frames) for name in SUBSYSTEMS))]
+    return {
+        'frames': frames,
+        'enemies_end': len(level.enemy_manager.enemy_list),
+        'drops_end': len(level.drops),
+        'drops_merged': level.drop_merger.merged,
+        'frame_ms': summarize(frame_totals),
+        'subsystems': {name: summarize(samples.get(name, [0.0] * frames)) for name in SUBSYSTEMS},
+        'scopes': {path: summarize(values) for path, values in sorted(samples.items()) if '/' in path},
+    }
+
+
+def environment():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except Exception:
+        commit = None
+    try:
+        import numpy
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+    return {
+        'commit': commit,
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'numpy': numpy_version,
+        'machine': platform.machine(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Per-subsystem benchmarks over scripted horde scenarios.')
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS),
+                        help='comma-separated subset of: ' + ', '.join(SCENARIOS))
+    parser.add_argument('--frames', type=int, default=300, help='measured frames per scenario')
+    parser.add_argument('--warmup', type=int, default=30, help='unmeasured frames before timing')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--json', metavar='PATH', help='write machine-readable results here')
+    args = parser.parse_args(argv)
+
+    results = {'environment': environment(), 'scenarios': {}}
+    for name in [n.strip() for n in args.scenarios.split(',') if n.strip()]:
+        if name not in SCENARIOS:
+            parser.error(f"unknown scenario {name!r}")
+        result = run_scenario(name, args.frames, args.warmup, seed=args.seed)
+        results['scenarios'][name] = result
+        frame = result['frame_ms']
+        print(f"{name:<12} frame p50 {frame['p50']:7.2f}  p95 {frame['p95']:7.2f}  p99 {frame['p99']:7.2f} ms"
+              f"  (enemies {result['enemies_end']}, drops {result['drops_end']}, merged {result['drops_merged']})")
+        for sub, stats in result['subsystems'].items():
+            print(f"  {sub:<15} p50 {stats['p50']:7.2f}  p95 {stats['p95']:7.2f}  p99 {stats['p99']:7.2f}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,4 +1,5 @@
 import pygame
+from text_cache import text_cache
 
 def adjust_color(color, amount):
     """Adjusts the brightness of the given color by the specified amount."""
@@ -32,7 +33,7 @@ class Button:
             self.draw_text(screen)
 
     def draw_text(self, screen):
-        text_surface = self.font.render(self.text, True, self.text_color)
+        text_surface = text_cache.render(self.font, self.text, True, self.text_color)
         text_rect = text_surface.get_rect(center=self.rect.center)
         screen.blit(text_surface, text_rect)
 
@@ -5,6 +5,10 @@ class Camera:
         self.offset_y = 0
         self.display_width, self.display_height = display_size
 
+    def reset(self):
+        self.offset_x = 0
+        self.offset_y = 0
+
     def update(self):
         self.offset_x = self.player.rect.x - self.display_width // 2
         self.offset_y = self.player.rect.y - self.display_height // 2
@@ -0,0 +1,70 @@
+import math
+
+from enemy_config import DROP_TYPES
+
+# Drops never expire, so long runs pile up idle gems that each cost a draw,
+# a magnet check and a pickup test. DropMerger periodically fuses crowded
+# idle drops of every DROP_TYPES entry with a 'merge' config into a single
+# drop carrying their combined value (drawn with the matching 'tiers' sprite).
+
+
+class DropMerger:
+    def __init__(self, display, drops, pool, store=None, interval_ms=500):
+        self.display = display
+        self.drops = drops
+        self.pool = pool
+        self.store = store
+        self.interval_ms = interval_ms
+        self._last_pass = None
+        # Metrics (kept across runs, like the pool counters)
+        self.passes = 0
+        self.merged = 0    # drops absorbed into fused gems
+        self.created = 0   # fused gems spawned
+
+    def reset(self):
+        self._last_pass = None
+
+    def update(self, now):
+        """Run a merge pass every interval_ms; returns the number of drops absorbed."""
+        if self._last_pass is not None and now - self._last_pass < self.interval_ms:
+            return 0
+        self._last_pass = now
+        self.passes += 1
+        absorbed = 0
+        for drop_type, config in DROP_TYPES.items():
+            merge = config.get('merge')
+            if merge is None:
+                continue
+            for group in self._crowded_cells(drop_type, merge['cell_size'], merge['max_per_cell']):
+                self._fuse(drop_type, group)
+                absorbed += len(group)
+        self.merged += absorbed
+        return absorbed
+
+    def _crowded_cells(self, drop_type, cell_size, max_per_cell):
+        if self.store is not None:
+            return self.store.crowded_cells(drop_type, cell_size, max_per_cell)
+        cells = {}
+        for drop in self.drops:
+            if drop.drop_type != drop_type or drop.state != 'idle' or drop.ready_to_apply:
+                continue
+            key = (math.floor(drop.pos_x / cell_size), math.floor(drop.pos_y / cell_size))
+            cells.setdefault(key, []).append(drop)
+        return [group for group in cells.values() if len(group) > max_per_cell]
+
+    def _fuse(self, drop_type, group):
+        # One gem at the value-weighted center holds the group's total value
+        total = sum(drop.value for drop in group)
+        weight = total or len(group)
+        x = sum(drop.pos_x * (drop.value if total else 1) for drop in group) / weight
+        y = sum(drop.pos_y * (drop.value if total else 1) for drop in group) / weight
+        scale, duration = group[0].scale, group[0].duration
+        for drop in group:
+            drop.kill()
+            self.pool.release(drop)
+        gem = self.pool.acquire(self.display, (int(x), int(y)), drop_type, scale, duration, total)
+        self.drops.add(gem)
+        self.created += 1
+
+    def stats_line(self):
+        return f"drop merge: {self.merged} drops -> {self.created} gems ({self.passes} passes)"
@@ -0,0 +1,329 @@
+try:
+    import numpy as np
+except ImportError:  # Optional: Level falls back to per-sprite drop updates
+    np = None
+
+from enemy_config import DROP_TYPES
+from enemy_drop import (EnemyDrop, ATTRACTION_SPEED, ATTRACTION_ACCELERATION, KB_IMPULSE, KB_DAMPING,
+                        BOUNCE_TIME_MS, MAX_COLLECT_DT, COLLECT_DISTANCE, HIT_RATIO)
+from enemy_store import _array_property
+
+DROP_STORE_AVAILABLE = np is not None
+
+# Collect animation states (EnemyDrop.state strings <-> array codes)
+STATE_IDLE = 0
+STATE_BOUNCE = 1
+STATE_RETURNING = 2
+STATE_NAMES = ('idle', 'bounce', 'returning')
+STATE_CODES = {name: code for code, name in enumerate(STATE_NAMES)}
+
+
+class DropStore:
+    """Struct-of-arrays drop state; the idle -> bounce -> returning collect
+    animation is stepped for every drop as one vectorized batch.
+
+    Slots are packed like EnemyStore's; each has a StoredDrop sprite view that
+    carries the pickup effect. Views' rects are only brought up to date when
+    read; drawing takes positions straight from the arrays (draw_list).
+    """
+
+    def __init__(self, capacity=1024):
+        self.capacity = 0
+        self.count = 0
+        self.type_names = list(DROP_TYPES.keys())
+        self.type_ids = {name: i for i, name in enumerate(self.type_names)}
+        self.views = []
+        self._allocate_arrays(max(16, capacity))
+
+    def _allocate_arrays(self, capacity):
+        old_count = self.count
+        fields = {
+            'pos': ((capacity, 2), np.float64),
+            'vel': ((capacity, 2), np.float64),          # bounce knockback (px/s)
+            'speed': ((capacity,), np.float64),          # homing speed (px/s)
+            'state': ((capacity,), np.uint8),
+            'ready': ((capacity,), np.bool_),
+            'bounce_start': ((capacity,), np.int64),
+            'type_id': ((capacity,), np.int16),
+            'value': ((capacity,), np.int64),
+            'hit_box': ((capacity, 4), np.int64),       # pickup rect: x, y offset from center, w, h
+            'draw_box': ((capacity, 4), np.int64),      # image rect: x, y offset from center, w, h
+        }
+        for name, (shape, dtype) in fields.items():
+            new = np.zeros(shape, dtype=dtype)
+            if old_count:
+                new[:old_count] = getattr(self, name)[:old_count]
+            setattr(self, name, new)
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.count
+
+    def allocate(self, view):
+        """Reserve a zeroed slot for a new sprite view and return its index."""
+        if self.count >= self.capacity:
+            self._allocate_arrays(self.capacity * 2)
+        slot = self.count
+        self.count += 1
+        self.pos[slot] = 0.0
+        self.vel[slot] = 0.0
+        self.speed[slot] = 0.0
+        self.state[slot] = STATE_IDLE
+        self.ready[slot] = False
+        self.views.append(view)
+        return slot
+
+    def release(self, slot):
+        """Free a slot by moving the last live slot into it."""
+        last = self.count - 1
+        if slot != last:
+            for name in ('pos', 'vel', 'speed', 'state', 'ready', 'bounce_start', 'type_id', 'value',
+                         'hit_box', 'draw_box'):
+                array = getattr(self, name)
+                array[slot] = array[last]
+            moved = self.views[last]
+            self.views[slot] = moved
+            moved._slot = slot
+        self.views.pop()
+        self.count = last
+
+    def clear(self):
+        for view in self.views:
+            view._detach()
+        self.views = []
+        self.count = 0
+
+    def _start_collect(self, index, player_center, now):
+        # Vectorized EnemyDrop.start_collect for idle slots in `index`
+        away = self.pos[index] - player_center
+        length = np.sqrt(away[:, 0] * away[:, 0] + away[:, 1] * away[:, 1])
+        zero = length == 0
+        away[zero] = (1.0, 0.0)
+        length[zero] = 1.0
+        away /= length[:, None]
+        self.pos[index] += away * 12
+        self.vel[index] += away * KB_IMPULSE
+        self.bounce_start[index] = now
+        self.state[index] = STATE_BOUNCE
+        self.ready[index] = False
+
+    def attract(self, player_center, radius, now):
+        """Start collecting every idle drop within the player's magnetic radius."""
+        n = self.count
+        if n == 0:
+            return
+        dx = self.pos[:n, 0] - player_center[0]
+        dy = self.pos[:n, 1] - player_center[1]
+        near = (self.state[:n] == STATE_IDLE) & (np.sqrt(dx * dx + dy * dy) <= radius)
+        index = np.flatnonzero(near)
+        if len(index):
+            self._start_collect(index, player_center, now)
+
+    def collide_player(self, player_rect, now):
+        """Start collecting idle drops touching the player (rects shrunk by HIT_RATIO)."""
+        n = self.count
+        if n == 0:
+            return
+        width, height = player_rect.size
+        hit = player_rect.inflate(width * HIT_RATIO - width, height * HIT_RATIO - height)
+        if hit.width == 0 or hit.height == 0:
+            return
+        centers = self.pos[:n].astype(np.int64)
+        box = self.hit_box[:n]
+        left = centers[:, 0] + box[:, 0]
+        top = centers[:, 1] + box[:, 1]
+        touching = ((left < hit.right) & (left + box[:, 2] > hit.left)
+                    & (top < hit.bottom) & (top + box[:, 3] > hit.top)
+                    & (box[:, 2] > 0) & (box[:, 3] > 0))
+        index = np.flatnonzero(touching & (self.state[:n] == STATE_IDLE))
+        if len(index):
+            self._start_collect(index, player_rect.center, now)
+
+    def force_return(self, player_center):
+        """Vectorized EnemyDrop.force_return_to_player for every drop (magnet pickup)."""
+        n = self.count
+        if n == 0:
+            return
+        # Aim from the drawn (integer) center, as the sprite method does
+        toward = (player_center - self.pos[:n].astype(np.int64)).astype(np.float64)
+        length = np.sqrt(toward[:, 0] * toward[:, 0] + toward[:, 1] * toward[:, 1])
+        zero = length == 0
+        toward[zero] = (1.0, 0.0)
+        length[zero] = 1.0
+        toward /= length[:, None]
+        self.pos[:n] += toward * 2
+        self.vel[:n] = 0.0
+        self.speed[:n] = min(300.0, ATTRACTION_SPEED)
+        self.state[:n] = STATE_RETURNING
+        self.ready[:n] = False
+
+    def update(self, player_center, dt, now):
+        """Step bounce and homing for every collecting drop.
+
+        Returns the sprite views that reached the player this step; they are
+        flagged ready_to_apply and left for the caller to apply and remove.
+        """
+        n = self.count
+        if n == 0:
+            return []
+        dt = min(dt, MAX_COLLECT_DT)
+        state = self.state[:n]
+        pos = self.pos[:n]
+
+        bounce = np.flatnonzero(state == STATE_BOUNCE)
+        returning = np.flatnonzero(state == STATE_RETURNING)
+
+        if len(bounce):
+            vel = self.vel[bounce]
+            pos[bounce] += vel * dt
+            self.vel[bounce] = vel * max(0.0, 1.0 - KB_DAMPING * dt)
+            done = bounce[now - self.bounce_start[bounce] >= BOUNCE_TIME_MS]
+            state[done] = STATE_RETURNING
+            # Head start so it doesn't feel stuck
+            self.speed[done] = min(200.0, ATTRACTION_SPEED)
+
+        arrived = returning[:0]
+        if len(returning):
+            toward = player_center - pos[returning]
+            distance = np.sqrt(toward[:, 0] * toward[:, 0] + toward[:, 1] * toward[:, 1])
+            close = distance <= COLLECT_DISTANCE
+            arrived = returning[close]
+            state[arrived] = STATE_IDLE
+            self.ready[arrived] = True
+            moving = ~close
+            homing = returning[moving]
+            speed = np.minimum(self.speed[homing] + ATTRACTION_ACCELERATION * dt, ATTRACTION_SPEED)
+            self.speed[homing] = speed
+            pos[homing] += toward[moving] / distance[moving, None] * speed[:, None] * dt
+
+        views = self.views
+        return [views[i] for i in arrived.tolist()]
+
+    def draw_list(self, view):
+        """(image, screen position) pairs for the drops overlapping `view`, a world-space rect."""
+        n = self.count
+        if n == 0:
+            return []
+        # Same integer center as a view's rect
+        box = self.draw_box[:n]
+        corner = self.pos[:n].astype(np.int64) + box[:, :2]
+        left = corner[:, 0]
+        top = corner[:, 1]
+        visible = np.flatnonzero((left < view.right) & (left + box[:, 2] > view.left)
+                                 & (top < view.bottom) & (top + box[:, 3] > view.top))
+        xs = (left[visible] - view.x).tolist()
+        ys = (top[visible] - view.y).tolist()
+        views = self.views
+        return [(views[i].image, (x, y)) for i, x, y in zip(visible.tolist(), xs, ys)]
+
+    def crowded_cells(self, drop_type, cell_size, max_per_cell):
+        """Idle views of `drop_type` grouped per cell_size grid cell, for cells
+        holding more than max_per_cell of them (see DropMerger)."""
+        n = self.count
+        type_id = self.type_ids.get(drop_type)
+        if type_id is None or n <= max_per_cell:
+            return []
+        candidates = np.flatnonzero((self.type_id[:n] == type_id) & (self.state[:n] == STATE_IDLE)
+                                    & ~self.ready[:n])
+        if len(candidates) <= max_per_cell:
+            return []
+        cells = np.floor_divide(self.pos[candidates], cell_size).astype(np.int64)
+        _, inverse, counts = np.unique(cells, axis=0, return_inverse=True, return_counts=True)
+        inverse = inverse.reshape(-1)
+        views = self.views
+        return [[views[i] for i in candidates[inverse == cell].tolist()]
+                for cell in np.flatnonzero(counts > max_per_cell).tolist()]
+
+
+def _state_property():
+    def getter(self):
+        slot = self._slot
+        if slot is None:
+            return self._detached.get('state', 'idle')
+        return STATE_NAMES[self._store.state[slot]]
+
+    def setter(self, value):
+        slot = self._slot
+        if slot is None:
+            self._detached['state'] = value
+        else:
+            self._store.state[slot] = STATE_CODES[value]
+
+    return property(getter, setter)
+
+
+def _rect_property():
+    # The rect follows the slot's position, updated when read rather than
+    # every step; assigning one moves the slot to its center
+    def getter(self):
+        rect = self._rect
+        slot = self._slot
+        if slot is not None:
+            x, y = self._store.pos[slot]
+            rect.center = (int(x), int(y))
+        return rect
+
+    def setter(self, rect):
+        self._rect = rect
+        if self._slot is not None:
+            self._store.pos[self._slot] = rect.center
+
+    return property(getter, setter)
+
+
+class StoredDrop(EnemyDrop):
+    """EnemyDrop whose position and collect state live in a DropStore slot.
+
+    The per-drop methods still work through the properties; Level steps the
+    whole store in bulk instead of calling them.
+    """
+
+    pos_x = _array_property('pos', 0)
+    pos_y = _array_property('pos', 1)
+    kb_vx = _array_property('vel', 0)
+    kb_vy = _array_property('vel', 1)
+    current_speed = _array_property('speed')
+    ready_to_apply = _array_property('ready', cast=bool)
+    bounce_start_time = _array_property('bounce_start', cast=int)
+    value = _array_property('value', cast=int)
+    state = _state_property()
+    rect = _rect_property()
+
+    def __init__(self, store, display, position, drop_type, scale=1, duration=5000, value=None):
+        self._store = store
+        self._slot = None
+        super().__init__(display, position, drop_type, scale, duration, value)
+
+    def reset(self, display, position, drop_type, scale=1, duration=5000, value=None):
+        # A pooled view is detached; claim a fresh slot before the fields are written
+        store = self._store
+        self._detached = {}
+        self._slot = store.allocate(self)
+        super().reset(display, position, drop_type, scale, duration, value)
+        slot = self._slot
+        store.type_id[slot] = store.type_ids.get(self.drop_type, 0)
+        rect = self.rect
+        hit = rect.inflate(rect.width * HIT_RATIO - rect.width, rect.height * HIT_RATIO - rect.height)
+        store.hit_box[slot] = (hit.x - rect.centerx, hit.y - rect.centery, hit.width, hit.height)
+        store.draw_box[slot] = (rect.x - rect.centerx, rect.y - rect.centery, rect.width, rect.height)
+
+    def _detach(self):
+        """Snapshot slot values onto the sprite so late readers still see sane state."""
+        if self._slot is None:
+            return
+        # Settle the rect on the slot's position before the slot goes
+        self._rect = self.rect
+        for prop_name in ('pos_x', 'pos_y', 'kb_vx', 'kb_vy', 'current_speed', 'ready_to_apply',
+                          'bounce_start_time', 'value', 'state'):
+            value = getattr(self, prop_name)
+            slot, self._slot = self._slot, None
+            setattr(self, prop_name, value)
+            self._slot = slot
+        self._slot = None
+
+    def kill(self):
+        super().kill()
+        if self._slot is not None:
+            slot = self._slot
+            self._detach()
+            self._store.release(slot)
@@ -1,19 +1,26 @@
 import pygame
+import game_clock
 import math
 from enemy_config import ENEMY_TYPES, DEFAULT_DROP
+from assets import assets
 
 class Enemy(pygame.sprite.Sprite):
     def __init__(self, x, y, enemy_type='rat'):
         super().__init__()
-        
+        self.reset(x, y, enemy_type)
+
+    def reset(self, x, y, enemy_type='rat'):
+        """(Re)initialize every per-enemy field; pooled enemies are reused through this."""
         # Get configuration for this enemy type
         if enemy_type not in ENEMY_TYPES:
             enemy_type = 'rat'  # Default fallback
         config = ENEMY_TYPES[enemy_type]
         
-        # Load sprite (cached)
-        self.original_image = _load_image_cached(config['sprite'])
+        # Load sprite and its pre-baked facing/flash/fade frames (cached per type)
+        self.original_image = assets.image(config['sprite'])
+        self.frames = get_enemy_frames(config['sprite'])
         self.image = self.original_image
+        self._facing_left = False
         self.rect = self.image.get_rect(topleft=(x, y))
         # Track precise position as center coordinates for accurate steering
         self.center_x = float(self.rect.centerx)
@@ -28,6 +35,10 @@ class Enemy(pygame.sprite.Sprite):
         self.speed = float(config['speed'])
         self.attack_cooldown = config['attack_cooldown']
         self.xp_value = config['xp_value']
+        # Crowd separation: max push (px/s) and this step's push (set by EnemyManager)
+        self.separation = float(config.get('separation', 0.0))
+        self.separation_vx = 0.0
+        self.separation_vy = 0.0
         # Drop config with global defaults
         self.drop_chance = config.get('drop_chance', DEFAULT_DROP['chance'])
         self.drop_weights = config.get('drop_weights', DEFAULT_DROP['weights'])
@@ -41,8 +52,6 @@ class Enemy(pygame.sprite.Sprite):
         # Damage feedback (white flash)
         self.damage_flash_time = 0
         self.damage_flash_duration = 350  # milliseconds
-        # Precompute white flash overlay once from mask
-        self._flash_overlay = _create_flash_overlay(self.original_image)
 
         # Knockback
         self.knockback_pixels = 10  # small instantaneous push distance
@@ -56,13 +65,20 @@ class Enemy(pygame.sprite.Sprite):
         self.death_start_time = 0
         self.death_duration = 1000  # milliseconds
         self.has_dropped = False
+        self.last_damage_number_ms = 0
+        # Step bookkeeping for Enemy.update; prev_center_* is the position
+        # before the last step, used to interpolate drawing between steps
+        self._dt = 0.0
+        self._lod_pending = 0.0  # time skipped by distant-enemy LOD, applied on the next update
+        self.prev_center_x = self.center_x
+        self.prev_center_y = self.center_y
 
-    def move(self, player_pos):
+    def move(self, player_pos, face_player=True, flow_field=None):
         # Pursuit movement is disabled while colliding/attacking or dying,
         # but knockback sliding should still be applied.
         move_x, move_y = 0.0, 0.0
-        # Per-enemy dt set in update()
-        dt = getattr(self, "_dt", 0.0)
+        # Step dt set in update()
+        dt = self._dt
 
         if not (self.stopped_due_to_attack or self.is_dying):
             target_x, target_y = player_pos  # player center
@@ -70,9 +86,14 @@ class Enemy(pygame.sprite.Sprite):
             distance = math.hypot(dx, dy)
             if distance > 0:
                 ndx, ndy = dx / distance, dy / distance
+                if flow_field is not None:
+                    # Steer by the field's cell direction where it has one
+                    direction = flow_field.direction_at(self.center_x, self.center_y)
+                    if direction is not None:
+                        ndx, ndy = direction
                 # dt-based movement; speed is pixels/second
-                move_x += ndx * self.speed * dt
-                move_y += ndy * self.speed * dt
+                move_x += (ndx * self.speed + self.separation_vx) * dt
+                move_y += (ndy * self.speed + self.separation_vy) * dt
 
         # Apply knockback velocity with simple damping using per-enemy dt
         if self.knockback_vx or self.knockback_vy:
@@ -88,10 +109,13 @@ class Enemy(pygame.sprite.Sprite):
         self.rect.centerx = int(self.center_x)
         self.rect.centery = int(self.center_y)
 
-        if player_pos[0] < self.rect.centerx:  # If player is to the left
-            self.image = pygame.transform.flip(self.original_image, True, False)
-        else:  # If player is to the right
-            self.image = self.original_image
+        if not face_player:
+            return
+        # Face the player; frames.plain is (right, left)
+        facing_left = player_pos[0] < self.rect.centerx
+        if facing_left != self._facing_left:
+            self._facing_left = facing_left
+            self.image = self.frames.plain[facing_left]
 
     def can_attack(self, current_time):
         # Check if enough time has passed since the last attack
@@ -111,7 +135,7 @@ class Enemy(pygame.sprite.Sprite):
             return False
 
         self.health -= amount
-        self.damage_flash_time = pygame.time.get_ticks()  # Start damage flash
+        self.damage_flash_time = game_clock.get_ticks()  # Start damage flash
 
         # Apply knockback impulse away from the hit source if provided
         if hit_source_pos is not None:
@@ -138,65 +162,101 @@ class Enemy(pygame.sprite.Sprite):
 
     def start_death(self):
         self.is_dying = True
-        self.death_start_time = pygame.time.get_ticks()
+        self.death_start_time = game_clock.get_ticks()
+
+    def death_finished(self, current_time):
+        """True once the death fade has fully played out."""
+        return self.is_dying and current_time - self.death_start_time >= self.death_duration
 
     def draw(self, surface, offset):
-        offset_pos = self.rect.topleft - pygame.Vector2(offset)
-        current_time = pygame.time.get_ticks()
-
-        # Base frame (already flipped/set in move())
-        frame = self.image
-
-        # Determine if we need a copy (flash or death fade)
-        do_flash = (current_time - self.damage_flash_time) < self.damage_flash_duration
-        do_death_fade = self.is_dying
-        if do_flash or do_death_fade:
-            frame = frame.copy()
-            if do_flash and self._flash_overlay is not None:
-                # If current frame is flipped relative to original, flip overlay to match
-                is_flipped = (frame.get_bitsize() == self.original_image.get_bitsize()) and (
-                    frame.get_width() == self.original_image.get_width() and frame.get_height() == self.original_image.get_height()
-                ) and (frame.get_locked() == self.original_image.get_locked())
-                # Heuristic is unreliable; simply flip based on player facing: image was flipped in move() when player is left
-                overlay = self._flash_overlay
-                if self.image is not self.original_image:
-                    overlay = pygame.transform.flip(overlay, True, False)
-                frame.blit(overlay, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
-            if do_death_fade:
-                elapsed = current_time - self.death_start_time
-                if elapsed >= self.death_duration:
-                    self.kill()
-                    return
-                alpha = max(0, 255 - int(255 * (elapsed / self.death_duration)))
-                frame.set_alpha(alpha)
-
-        surface.blit(frame, offset_pos)
-        
+        frame = self.current_frame(game_clock.get_ticks())
+        if frame is not None:
+            surface.blit(frame, (self.rect.x - offset[0], self.rect.y - offset[1]))
+
+    def current_frame(self, current_time):
+        """Frame to draw at `current_time`, or None once the death fade has finished."""
+        frames = self.frames
+        facing = self._facing_left
+        flashing = (current_time - self.damage_flash_time) < self.damage_flash_duration
+
+        # Every state maps to a pre-baked frame, so drawing is a single blit
+        if self.is_dying:
+            elapsed = current_time - self.death_start_time
+            if elapsed >= self.death_duration:
+                # Fully faded; EnemyManager removes it on the next update
+                return None
+            step = int(elapsed * frames.fade_steps // self.death_duration)
+            return frames.fade[flashing][facing][step]
+        if flashing:
+            return frames.flash[facing]
+        return self.image
+
+    def defer_update(self, dt):
+        """Skip this step (distant-enemy LOD); its dt is applied on the next update."""
+        self.prev_center_x = self.center_x
+        self.prev_center_y = self.center_y
+        self._lod_pending += dt
+
+    def update(self, player_pos, dt, face_player=True, flow_field=None):
+        """Advance one simulation step of `dt` seconds (owned by the Level's fixed-step clock)."""
+        self.prev_center_x = self.center_x
+        self.prev_center_y = self.center_y
+        self._dt = dt + self._lod_pending
+        self._lod_pending = 0.0
+        self.move(player_pos, face_player, flow_field)
+
 
-    def update(self, player_pos, current_time):
-        # Compute per-enemy dt (seconds) for smooth knockback without changing callers
-        last = getattr(self, "_last_update_time", None)
-        if last is None:
-            dt = 0.0
+# --- Frame cache and helpers ---
+
+def get_sprite_size(enemy_type: str):
+    """Pixel size of an enemy type's sprite (loads through the asset manager)."""
+    config = ENEMY_TYPES.get(enemy_type, ENEMY_TYPES['rat'])
+    return assets.image(config['sprite']).get_size()
+
+class EnemyFrames:
+    """Every surface an enemy sprite can be drawn with, built once per sprite.
+
+    Tuples are indexed by facing (0 = right, 1 = left). `fade` holds a ladder
+    of death-fade frames with the alpha baked into the pixels, indexed as
+    fade[flashing][facing][step].
+    """
+
+    def __init__(self, image: pygame.Surface, fade_steps: int = 16):
+        self.plain = (image, pygame.transform.flip(image, True, False))
+        overlay = _create_flash_overlay(image)
+        if overlay is None:
+            self.flash = self.plain
         else:
-            dt = max(0.0, (current_time - last) / 1000.0)
-        # Clamp dt to avoid large catch-up steps (e.g., after pause)
-        if dt > 0.05:
-            dt = 0.05
-        self._dt = dt
-        self._last_update_time = current_time
-        self.move(player_pos)
-
-
-# --- Module-local image cache and helpers ---
-_IMAGE_CACHE = {}
-
-def _load_image_cached(path: str) -> pygame.Surface:
-    surf = _IMAGE_CACHE.get(path)
-    if surf is None:
-        surf = pygame.image.load(path).convert_alpha()
-        _IMAGE_CACHE[path] = surf
-    return surf
+            flash = image.copy()
+            flash.blit(overlay, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+            self.flash = (flash, pygame.transform.flip(flash, True, False))
+        self.fade_steps = fade_steps
+        # Alpha at the middle of each step of the linear 255 -> 0 fade
+        alphas = [int(255 * (1.0 - (i + 0.5) / fade_steps)) for i in range(fade_steps)]
+        self.fade = tuple(
+            tuple(tuple(_with_alpha(base, alpha) for alpha in alphas) for base in variant)
+            for variant in (self.plain, self.flash)
+        )
+
+
+_FRAME_CACHE = {}
+
+def get_enemy_frames(path: str) -> EnemyFrames:
+    frames = _FRAME_CACHE.get(path)
+    if frames is None:
+        frames = EnemyFrames(assets.image(path))
+        _FRAME_CACHE[path] = frames
+    return frames
+
+def preload_enemy_frames():
+    """Bake the frame sets for every configured enemy type up front."""
+    for config in ENEMY_TYPES.values():
+        get_enemy_frames(config['sprite'])
+
+def _with_alpha(base_surface: pygame.Surface, alpha: int) -> pygame.Surface:
+    frame = base_surface.copy()
+    frame.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+    return frame
 
 def _create_flash_overlay(base_surface: pygame.Surface) -> pygame.Surface:
     try:
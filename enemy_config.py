@@ -25,7 +25,17 @@ DROP_TYPES = {
     'exp': {
         'sprite': 'emerald.png',
         'value': 15,
-        'weight': 0.5
+        'weight': 0.5,
+        # Crowded idle gems fuse into one gem holding their combined value:
+        # more than max_per_cell in one cell_size x cell_size px region merge
+        'merge': {'cell_size': 160, 'max_per_cell': 6},
+        # Sprite by value: (min value, scale factor, RGB tint or None)
+        'tiers': (
+            (0, 1.0, None),
+            (60, 1.25, (140, 210, 255)),
+            (300, 1.5, (255, 140, 230)),
+            (1500, 1.8, (255, 215, 90)),
+        ),
     },
     'money': {
         'sprite': 'money_drop.png',
@@ -61,6 +71,7 @@ ENEMY_TYPES = {
         'speed': 45,
         'attack_cooldown': 100,
         'xp_value': 5,
+        'separation': 40,  # max crowd-avoidance push (px/s), see crowd.py
         'description': 'Basic enemy, instant kill'
         # Overrides example:
         # 'drop_chance': 0.6,
@@ -74,6 +85,7 @@ ENEMY_TYPES = {
         'speed': 27,
         'attack_cooldown': 120,
         'xp_value': 8,
+        'separation': 25,
         'description': 'Zombie, instant kill, rare health drops'
         # Overrides example:
         # 'drop_chance': 0.4,
@@ -86,6 +98,7 @@ ENEMY_TYPES = {
         'speed': 36,
         'attack_cooldown': 150,
         'xp_value': 15,
+        'separation': 30,
         'description': 'Tough skeleton, takes multiple hits'
         # Overrides example:
         # 'drop_chance': 0.7,
@@ -98,6 +111,7 @@ ENEMY_TYPES = {
         'speed': 63,  # Faster than other enemies
         'attack_cooldown': 100,
         'xp_value': 12,
+        'separation': 15,  # ghosts drift through each other
         'description': 'Fast ghost, takes multiple hits'
         # Overrides example:
         # 'drop_chance': 0.55,
@@ -1,33 +1,50 @@
 import pygame
-import random
+import game_clock
 from enemy_config import DROP_TYPES
+from assets import assets
+
+# Collect animation tuning shared with DropStore's bulk step
+ATTRACTION_SPEED = 600.0         # px/sec, homing speed cap
+ATTRACTION_ACCELERATION = 1200.0  # px/sec^2
+KB_IMPULSE = 350                 # px/sec initial push away from the player
+KB_DAMPING = 3.0                 # knockback decay per second
+BOUNCE_TIME_MS = 200
+MAX_COLLECT_DT = 0.033           # collect animation step clamp (s)
+COLLECT_DISTANCE = 8             # px from the player center that counts as picked up
+HIT_RATIO = 0.5                  # player/drop rects are shrunk by this for pickup
+
 
 class EnemyDrop(pygame.sprite.Sprite):
-    def __init__(self, display, position, drop_type, scale=1, duration=5000):
+    def __init__(self, display, position, drop_type, scale=1, duration=5000, value=None):
         super().__init__()
+        self.reset(display, position, drop_type, scale, duration, value)
+
+    def reset(self, display, position, drop_type, scale=1, duration=5000, value=None):
+        """(Re)initialize the drop; pooled drops are reused through this.
+
+        `value` overrides the type's value (fused gems, see drop_merge.py).
+        """
         self.display = display
         self.drop_type = drop_type
         self.scale = scale
         self.duration = duration
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = game_clock.get_ticks()
         
         # Get drop properties from config
         drop_config = DROP_TYPES.get(drop_type, DROP_TYPES['exp'])
-        self.value = drop_config['value']
+        self.value = drop_config['value'] if value is None else value
         self.sprite_path = drop_config['sprite']
         
-        # Load sprite with fallback (cached)
+        # Load sprite with fallback (scaled copy cached per sprite, scale and value tier)
         try:
-            self.image = _load_image_cached(self.sprite_path)
+            tier = _tier_for(drop_config.get('tiers'), self.value)
+            if tier is None:
+                self.image = _load_scaled_cached(self.sprite_path, self.scale)
+            else:
+                self.image = _load_tier_cached(self.sprite_path, self.scale, tier)
         except Exception:
             # Fallback to emerald if sprite not found
-            self.image = _load_image_cached('emerald.png')
-        
-        # Apply scaling
-        if self.scale != 1:
-            image_width = int(self.image.get_width() * self.scale)
-            image_height = int(self.image.get_height() * self.scale)
-            self.image = pygame.transform.scale(self.image, (image_width, image_height))
+            self.image = _load_scaled_cached('emerald.png', self.scale)
         
         # Set rect based on scaled image
         self.rect = self.image.get_rect(center=position)
@@ -36,8 +53,8 @@ class EnemyDrop(pygame.sprite.Sprite):
         self.pos_y = float(self.rect.centery)
         
         # Magnetic attraction properties (px/sec and px/sec^2)
-        self.attraction_speed = 600.0
-        self.attraction_acceleration = 1200.0
+        self.attraction_speed = ATTRACTION_SPEED
+        self.attraction_acceleration = ATTRACTION_ACCELERATION
         self.current_speed = 0.0
 
         # Collect animation state (visual bounce then return)
@@ -46,9 +63,9 @@ class EnemyDrop(pygame.sprite.Sprite):
         self.kb_vx = 0.0
         self.kb_vy = 0.0
         # Match enemy knockback feel
-        self.kb_impulse = 350  # pixels/sec initial push
-        self.kb_damping = 3.0     # slower decay for smooth slide
-        self.bounce_time_ms = 200
+        self.kb_impulse = KB_IMPULSE
+        self.kb_damping = KB_DAMPING
+        self.bounce_time_ms = BOUNCE_TIME_MS
         self.bounce_start_time = 0
 
     def force_return_to_player(self, player_center):
@@ -86,7 +103,7 @@ class EnemyDrop(pygame.sprite.Sprite):
             return
         self.state = 'bounce'
         self.ready_to_apply = False
-        self.bounce_start_time = pygame.time.get_ticks()
+        self.bounce_start_time = game_clock.get_ticks()
         dir_vec = pygame.math.Vector2(self.rect.center) - pygame.math.Vector2(player_center)
         if dir_vec.length_squared() == 0:
             dir_vec = pygame.math.Vector2(1, 0)
@@ -107,14 +124,13 @@ class EnemyDrop(pygame.sprite.Sprite):
             return
         if self.state == 'bounce':
             # Apply knockback slide with damping (use level frame dt if available for consistency)
-            dt = getattr(getattr(self, 'display', None), 'frame_dt', dt) if False else dt
-            dt = min(dt, 0.033)
+            dt = min(dt, MAX_COLLECT_DT)
             self.pos_x += self.kb_vx * dt
             self.pos_y += self.kb_vy * dt
             decay = max(0.0, 1.0 - self.kb_damping * dt)
             self.kb_vx *= decay
             self.kb_vy *= decay
-            if pygame.time.get_ticks() - self.bounce_start_time >= self.bounce_time_ms:
+            if game_clock.get_ticks() - self.bounce_start_time >= self.bounce_time_ms:
                 self.state = 'returning'
                 # Give a head start so it doesn't feel stuck
                 self.current_speed = min(200.0, self.attraction_speed)
@@ -124,14 +140,14 @@ class EnemyDrop(pygame.sprite.Sprite):
             player_center = pygame.math.Vector2(player_rect.center)
             to_player = player_center - drop_center
             distance = to_player.length()
-            if distance <= 8:
+            if distance <= COLLECT_DISTANCE:
                 self.ready_to_apply = True
                 self.state = 'idle'
                 return
             if distance > 0:
                 direction = to_player.normalize()
                 # Reuse attraction parameters (dt-based)
-                dt = min(dt, 0.033)
+                dt = min(dt, MAX_COLLECT_DT)
                 self.current_speed += self.attraction_acceleration * dt
                 self.current_speed = min(self.current_speed, self.attraction_speed)
                 # Move using speed (px/sec) scaled by dt
@@ -141,32 +157,45 @@ class EnemyDrop(pygame.sprite.Sprite):
         self.rect.centerx = int(self.pos_x)
         self.rect.centery = int(self.pos_y)
 
-    @staticmethod
-    def determine_drop_type(enemy_drop_types=None, enemy_drop_weights=None):
-        """Determine drop type based on enemy configuration or random selection."""
-        if enemy_drop_types and enemy_drop_weights:
-            # Use enemy's specific drop types with weights
-            return random.choices(enemy_drop_types, weights=list(enemy_drop_weights.values()))[0]
-        elif enemy_drop_types:
-            # Use enemy's specific drop types (equal chance)
-            return random.choice(enemy_drop_types)
-        else:
-            # Random selection from all available drop types
-            drop_types = list(DROP_TYPES.keys())
-            return random.choice(drop_types)
-
     def draw(self, surface, offset):
         """Draw the drop on the surface with camera offset."""
-        offset_pos = pygame.math.Vector2(self.rect.topleft) - pygame.math.Vector2(offset)
-        surface.blit(self.image, offset_pos)
+        surface.blit(self.image, (self.rect.x - offset[0], self.rect.y - offset[1]))
+
+
+# --- Module-local scaled image caches (sources come from assets.py) ---
+_SCALED_CACHE = {}
+
+def _load_scaled_cached(path: str, scale) -> pygame.Surface:
+    key = (path, scale)
+    surf = _SCALED_CACHE.get(key)
+    if surf is None:
+        surf = assets.image(path)
+        if scale != 1:
+            size = (int(surf.get_width() * scale), int(surf.get_height() * scale))
+            surf = pygame.transform.scale(surf, size)
+        _SCALED_CACHE[key] = surf
+    return surf
 
+def _tier_for(tiers, value):
+    """Highest (min value, scale factor, tint) tier reached by `value`, or None for the base sprite."""
+    chosen = None
+    for tier in tiers or ():
+        if value >= tier[0]:
+            chosen = tier
+    if chosen is None or (chosen[1] == 1.0 and chosen[2] is None):
+        return None
+    return chosen
 
-# --- Module-local image cache ---
-_IMAGE_CACHE = {}
+_TIER_CACHE = {}
 
-def _load_image_cached(path: str) -> pygame.Surface:
-    surf = _IMAGE_CACHE.get(path)
+def _load_tier_cached(path: str, scale, tier) -> pygame.Surface:
+    key = (path, scale, tier)
+    surf = _TIER_CACHE.get(key)
     if surf is None:
-        surf = pygame.image.load(path).convert_alpha()
-        _IMAGE_CACHE[path] = surf
+        _, factor, tint = tier
+        surf = _load_scaled_cached(path, scale * factor)
+        if tint is not None:
+            surf = surf.copy()
+            surf.fill(tint, special_flags=pygame.BLEND_RGB_MULT)
+        _TIER_CACHE[key] = surf
     return surf
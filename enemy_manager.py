@@ -1,77 +1,146 @@
 import pygame
-from enemy import Enemy
+import game_clock
+import math
+import functools
+import itertools
+from operator import attrgetter
+from enemy import Enemy, get_sprite_size, preload_enemy_frames
 from enemy_config import ENEMY_TYPES, ENEMY_SPAWN_WEIGHTS, LEVEL_UNLOCKS
-import random
+from enemy_store import EnemyStore, StoredEnemy, ARRAY_STORE_AVAILABLE, FLAG_STOPPED, FLAG_DYING
+from settings import (ENEMY_ARRAY_STORE, POOL_CAPACITY, ENEMY_LOD_RADIUS, ENEMY_LOD_INTERVAL,
+                      ENEMY_DESPAWN_RADIUS, ENEMY_SEPARATION_CELL, SPAWN_BURST_RADIUS,
+                      ENEMY_FLOW_FIELD, FLOW_FIELD_CELL, FLOW_FIELD_RADIUS)
+from pools import ObjectPool
+from spatial_hash import SpatialHash
+from game_random import rng, sample_rng
+from sampler import SpawnTables
+from crowd import separation_velocity_py
+from flow_field import FlowField
+from spawn_scheduler import SpawnScheduler
+from render_queue import LAYER_ENEMIES
+from profiler import profiler
+
+_spawn_order = attrgetter('spawn_seq')
+
+
+def _burst_jitter(outward):
+    # Along the edge (outward == 0): either way; across it: away from the view only
+    if outward == 0:
+        return rng.randint(-SPAWN_BURST_RADIUS, SPAWN_BURST_RADIUS)
+    return outward * rng.randint(0, 2 * SPAWN_BURST_RADIUS)
 
 class EnemyManager:
-    def __init__(self, display, sprite_width, sprite_height, default_spawn_delay=500):
+    def __init__(self, display, sprite_width, sprite_height, default_spawn_delay=500,
+                 use_array_store=ENEMY_ARRAY_STORE, lod_radius=ENEMY_LOD_RADIUS,
+                 lod_interval=ENEMY_LOD_INTERVAL, despawn_radius=ENEMY_DESPAWN_RADIUS,
+                 separation_cell=ENEMY_SEPARATION_CELL, use_flow_field=ENEMY_FLOW_FIELD):
         self.display = display
         self.sprite_width = sprite_width
         self.sprite_height = sprite_height
         self.enemy_list = pygame.sprite.Group()
         self.default_spawn_delay = default_spawn_delay
         self.current_spawn_delay = self.default_spawn_delay
-        self.last_spawn_time = pygame.time.get_ticks()
+        # Owed spawns are paid out in batches shaped by the current wave
+        self.spawn_scheduler = SpawnScheduler()
+        self.spawn_scheduler.reset(game_clock.get_ticks())
         
         # Enemy spawning configuration
         self.enemy_spawn_weights = ENEMY_SPAWN_WEIGHTS
         
         # Level-based spawning (unlock new enemies as player levels up)
         self.level_unlocks = LEVEL_UNLOCKS
+        # Weighted type choice per level, compiled once per level (see sampler.py)
+        self.spawn_tables = SpawnTables(self.enemy_spawn_weights, self.level_unlocks)
+
+        # Distant enemies step at a coarser rate; far strays can be recycled
+        self.lod_radius = lod_radius
+        self.lod_interval = lod_interval
+        self.despawn_radius = despawn_radius
+        self._lod_tick = 0
+        self.despawned = 0
+        # Crowd separation grid cell size (None disables separation)
+        self.separation_cell = separation_cell
+        # Optional player-centred flow field enemies steer by (see flow_field.py)
+        self.flow_field = FlowField(FLOW_FIELD_CELL, FLOW_FIELD_RADIUS) if use_flow_field else None
+
+        # Optional struct-of-arrays store: enemies are stepped in one vectorized batch
+        self.store = (EnemyStore(lod_radius=lod_radius, lod_interval=lod_interval,
+                                 separation_cell=separation_cell)
+                      if (use_array_store and ARRAY_STORE_AVAILABLE) else None)
+
+        # Spatial hash for collision queries, rebuilt once per tick after movement.
+        # Cells are two sprites wide so a typical query touches a 3x3 block.
+        max_sprite = max(max(get_sprite_size(enemy_type)) for enemy_type in ENEMY_TYPES)
+        self.spatial_hash = SpatialHash(max_sprite * 2)
+        # Bake flipped/flash/fade frames for every type before the first spawn
+        preload_enemy_frames()
+        # Faded enemies are recycled instead of rebuilt on every spawn
+        factory = functools.partial(StoredEnemy, self.store) if self.store is not None else Enemy
+        self.enemy_pool = ObjectPool('enemy', factory, POOL_CAPACITY['enemy'])
+        # Spawn order; hits are reported in this order to match group iteration
+        self._spawn_counter = itertools.count()
 
     def get_random_XY(self, camera_offset):
         spawn_margin = 50
         camera_offset_x, camera_offset_y = camera_offset
 
-        spawn_side = random.choice(["horizontal", "vertical"])
+        spawn_side = rng.choice(["horizontal", "vertical"])
         if spawn_side == "horizontal":
-            y = random.randint(camera_offset_y - spawn_margin, camera_offset_y + self.display.get_height() + spawn_margin)
-            x = random.choice([camera_offset_x - self.sprite_width - spawn_margin, camera_offset_x + self.display.get_width() + spawn_margin])
+            y = rng.randint(camera_offset_y - spawn_margin, camera_offset_y + self.display.get_height() + spawn_margin)
+            x = rng.choice([camera_offset_x - self.sprite_width - spawn_margin, camera_offset_x + self.display.get_width() + spawn_margin])
         else:
-            x = random.randint(camera_offset_x - spawn_margin, camera_offset_x + self.display.get_width() + spawn_margin)
-            y = random.choice([camera_offset_y - self.sprite_height - spawn_margin, camera_offset_y + self.display.get_height() + spawn_margin])
+            x = rng.randint(camera_offset_x - spawn_margin, camera_offset_x + self.display.get_width() + spawn_margin)
+            y = rng.choice([camera_offset_y - self.sprite_height - spawn_margin, camera_offset_y + self.display.get_height() + spawn_margin])
         return x, y
 
     def get_available_enemy_types(self, player_level):
         """Get enemy types available at the current player level"""
-        available_types = ['rat']  # Always available
-        
-        for unlock_level, enemy_types in self.level_unlocks.items():
-            if player_level >= unlock_level:
-                available_types = enemy_types
-                
-        return available_types
+        return self.spawn_tables.available_types(player_level)
 
     def choose_enemy_type(self, player_level):
         """Choose which enemy type to spawn based on weights and player level"""
-        available_types = self.get_available_enemy_types(player_level)
-        
-        # Filter weights to only include available enemy types
-        available_weights = {k: v for k, v in self.enemy_spawn_weights.items() if k in available_types}
-        
-        # If no weights available, default to rat
-        if not available_weights:
-            return 'rat'
-            
-        # Choose based on weights
-        total_weight = sum(available_weights.values())
-        random_value = random.randint(1, total_weight)
-        
-        current_weight = 0
-        for enemy_type, weight in available_weights.items():
-            current_weight += weight
-            if random_value <= current_weight:
-                return enemy_type
-                
-        return 'rat'  # Fallback
+        return self.spawn_tables.sample(sample_rng, player_level)
+
+    def choose_enemy_types(self, player_level, count):
+        """`count` enemy types for a batch of spawns in one draw."""
+        return self.spawn_tables.sample_many(sample_rng, player_level, count)
+
+    def create_enemy(self, x, y, enemy_type):
+        enemy = self.enemy_pool.acquire(x, y, enemy_type)
+        enemy.spawn_seq = next(self._spawn_counter)
+        return enemy
 
     def spawn_enemy(self, camera_offset, player_level=1):
-        current_time = pygame.time.get_ticks()
-        if current_time - self.last_spawn_time >= self.current_spawn_delay:
+        """Spawn whatever the scheduler releases this tick, placed by the wave's pattern."""
+        current_time = game_clock.get_ticks()
+        pattern, count = self.spawn_scheduler.plan(current_time, self.current_spawn_delay,
+                                                   len(self.enemy_list))
+        if not count:
+            return
+        positions = self.spawn_positions(pattern, camera_offset, count)
+        for (x, y), enemy_type in zip(positions, self.choose_enemy_types(player_level, count)):
+            self.enemy_list.add(self.create_enemy(x, y, enemy_type))
+
+    def spawn_positions(self, pattern, camera_offset, count):
+        if pattern == 'burst':
+            # One point on the spawn ring, jittered along the edge and only
+            # outward across it, so the clump never spills onto the screen
             x, y = self.get_random_XY(camera_offset)
-            enemy_type = self.choose_enemy_type(player_level)
-            self.enemy_list.add(Enemy(x, y, enemy_type))
-            self.last_spawn_time = current_time
+            width, height = self.display.get_size()
+            out_x = -1 if x < camera_offset[0] else (1 if x >= camera_offset[0] + width else 0)
+            out_y = -1 if y < camera_offset[1] else (1 if y >= camera_offset[1] + height else 0)
+            return [(x + _burst_jitter(out_x), y + _burst_jitter(out_y)) for _ in range(count)]
+        if pattern == 'ring':
+            # Evenly spaced on a circle just outside the view's corners
+            width, height = self.display.get_size()
+            center_x = camera_offset[0] + width / 2
+            center_y = camera_offset[1] + height / 2
+            radius = math.hypot(width, height) / 2 + max(self.sprite_width, self.sprite_height) + 50
+            phase = rng.uniform(0.0, 2.0 * math.pi)
+            step = 2.0 * math.pi / count
+            return [(int(center_x + math.cos(phase + i * step) * radius),
+                     int(center_y + math.sin(phase + i * step) * radius)) for i in range(count)]
+        return [self.get_random_XY(camera_offset) for _ in range(count)]
 
     def adjust_spawn_rate(self, player_level):
         """Dynamically adjust spawn rate based on player level.
@@ -86,18 +155,163 @@ class EnemyManager:
         new_delay = int(self.default_spawn_delay / factor)
         self.current_spawn_delay = max(100, new_delay)
 
+    def set_separation_cell(self, cell):
+        """Turn crowd separation on with grid cells of `cell` px, or off with None."""
+        self.separation_cell = cell
+        if self.store is not None:
+            self.store.separation_cell = cell
+
     def reset(self):
+        enemies = self.enemy_list.sprites()
         self.enemy_list.empty()
-        self.last_spawn_time = pygame.time.get_ticks()
+        self.spatial_hash.clear()
+        if self.store is not None:
+            self.store.clear()
+        self.enemy_pool.release_all(enemies)
+        self.spawn_scheduler.reset(game_clock.get_ticks())
         self.current_spawn_delay = self.default_spawn_delay  # Reset spawn delay to default
+        self._lod_tick = 0
+        # LOD stepping keys off spawn_seq, so a new run numbers spawns from 0 again
+        self._spawn_counter = itertools.count()
 
-    def draw(self, display, offset):
-        for enemy in self.enemy_list:
-            enemy.draw(display, offset)
+    def clear_attack_stops(self):
+        """Reset the per-frame 'stopped while attacking' flag on every enemy."""
+        if self.store is not None:
+            self.store.clear_flag(FLAG_STOPPED)
+        else:
+            for enemy in self.enemy_list:
+                enemy.stopped_due_to_attack = False
+
+    def collide(self, sprite, collided=None):
+        """Enemies hit by `sprite`; same results and order as pygame.sprite.spritecollide
+        against enemy_list, but only nearby spatial-hash cells are tested."""
+        if collided is None:
+            return self.in_rect(sprite.rect)
+        hits = [enemy for enemy in self.spatial_hash.query(sprite.rect) if collided(sprite, enemy)]
+        hits.sort(key=_spawn_order)
+        return hits
+
+    def in_rect(self, rect):
+        """Enemies whose rect overlaps `rect` (world coordinates), in enemy_list order."""
+        colliderect = rect.colliderect
+        hits = [enemy for enemy in self.spatial_hash.query(rect) if colliderect(enemy.rect)]
+        hits.sort(key=_spawn_order)
+        return hits
+
+    def refresh_enemy(self, enemy):
+        """Keep the spatial hash in sync after an enemy is moved mid-tick (knockback)."""
+        self.spatial_hash.move(enemy)
+
+    def draw(self, display, offset, alpha=1.0, queue=None):
+        """Draw on-screen enemies; alpha < 1 interpolates from the previous step's positions.
+
+        With a RenderQueue the blits are queued on LAYER_ENEMIES for the
+        caller to flush; otherwise they go to `display` in one blits call.
+        """
+        with profiler.scope('enemies.draw'):
+            # Cull to the camera view; the spatial hash is current after update_enemies
+            view = display.get_rect().move(offset)
+            visible = self.in_rect(view)
+            now = game_clock.get_ticks()
+            offset_x, offset_y = offset
+            batch = []
+            append = batch.append
+            if alpha >= 1.0:
+                for enemy in visible:
+                    frame = enemy.current_frame(now)
+                    if frame is not None:
+                        rect = enemy.rect
+                        append((frame, (rect.x - offset_x, rect.y - offset_y)))
+            else:
+                # Shift each enemy back toward where it was one step ago
+                lag = 1.0 - alpha
+                for enemy in visible:
+                    frame = enemy.current_frame(now)
+                    if frame is not None:
+                        rect = enemy.rect
+                        append((frame, (rect.x - (offset_x + (enemy.center_x - enemy.prev_center_x) * lag),
+                                        rect.y - (offset_y + (enemy.center_y - enemy.prev_center_y) * lag))))
+            if queue is not None:
+                queue.extend(LAYER_ENEMIES, batch)
+            else:
+                display.blits(batch, doreturn=False)
 
-    def update(self, player_pos, offset, current_time, player_level=1):
-        self.adjust_spawn_rate(player_level)
-        self.spawn_enemy(offset, player_level)
+    def update(self, player_pos, offset, current_time, dt, player_level=1):
+        self.update_spawning(offset, player_level)
+        self.update_enemies(player_pos, current_time, dt)
+
+    def update_spawning(self, offset, player_level=1):
+        with profiler.scope('enemies.spawn'):
+            self.adjust_spawn_rate(player_level)
+            self.spawn_enemy(offset, player_level)
+
+    def update_enemies(self, player_pos, current_time, dt):
+        """Move every enemy by one `dt` step, drop finished death fades and rebuild the spatial hash."""
+        with profiler.scope('enemies.move'):
+            if self.flow_field is not None:
+                self.flow_field.update(player_pos)
+            if self.store is not None:
+                self.store.update(player_pos, dt, self._lod_tick, self.flow_field)
+            else:
+                self._update_enemy_sprites(player_pos, dt)
+            self._lod_tick += 1
+            if self.despawn_radius is not None:
+                self.despawn_far(player_pos)
+            self.remove_faded(current_time)
+        # Bucket the survivors for this tick's collision queries
+        with profiler.scope('enemies.spatial_hash'):
+            self.spatial_hash.rebuild(self.enemy_list)
+
+    def _update_enemy_sprites(self, player_pos, dt):
+        # Per-sprite path with the same separation and LOD rules as EnemyStore.update
+        if self.separation_cell is not None:
+            enemies = self.enemy_list.sprites()
+            pushes = separation_velocity_py([(e.center_x, e.center_y) for e in enemies],
+                                            [e.separation for e in enemies],
+                                            [e.spawn_seq for e in enemies], self.separation_cell)
+            for enemy, (push_x, push_y) in zip(enemies, pushes):
+                enemy.separation_vx = push_x
+                enemy.separation_vy = push_y
+        if self.lod_radius is None or self.lod_interval <= 1:
+            for enemy in self.enemy_list:
+                enemy.update(player_pos, dt, flow_field=self.flow_field)
+            return
+        player_x, player_y = player_pos
+        far_sq = self.lod_radius * self.lod_radius
+        interval = self.lod_interval
+        tick = self._lod_tick
         for enemy in self.enemy_list:
-            enemy.update(player_pos, current_time)
-        self.draw(self.display, offset)
+            dx = player_x - enemy.center_x
+            dy = player_y - enemy.center_y
+            if dx * dx + dy * dy <= far_sq:
+                enemy.update(player_pos, dt, flow_field=self.flow_field)
+            elif (enemy.spawn_seq + tick) % interval == 0:
+                enemy.update(player_pos, dt, face_player=False, flow_field=self.flow_field)
+            else:
+                enemy.defer_update(dt)
+
+    def despawn_far(self, player_pos):
+        """Recycle living enemies that strayed beyond despawn_radius (no drops or XP)."""
+        radius = self.despawn_radius
+        if self.store is not None:
+            strays = self.store.views_beyond(player_pos, radius)
+        else:
+            player_x, player_y = player_pos
+            radius_sq = radius * radius
+            strays = [enemy for enemy in self.enemy_list if not enemy.is_dying and
+                      (enemy.center_x - player_x) ** 2 + (enemy.center_y - player_y) ** 2 > radius_sq]
+        for enemy in strays:
+            enemy.kill()
+            self.enemy_pool.release(enemy)
+        self.despawned += len(strays)
+
+    def remove_faded(self, current_time):
+        """Kill enemies whose death fade has finished."""
+        if self.store is not None:
+            dying = self.store.views_with_flag(FLAG_DYING)
+        else:
+            dying = [enemy for enemy in self.enemy_list if enemy.is_dying]
+        for enemy in dying:
+            if enemy.death_finished(current_time):
+                enemy.kill()
+                self.enemy_pool.release(enemy)
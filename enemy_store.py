@@ -0,0 +1,291 @@
+try:
+    import numpy as np
+except ImportError:  # Optional: EnemyManager falls back to per-sprite updates
+    np = None
+
+from enemy import Enemy
+from enemy_config import ENEMY_TYPES
+from crowd import separation_velocity
+
+ARRAY_STORE_AVAILABLE = np is not None
+
+# Per-enemy flag bits
+FLAG_STOPPED = 1  # colliding with / attacking the player, pursuit paused
+FLAG_DYING = 2    # death fade running, pursuit paused
+
+
+class EnemyStore:
+    """Struct-of-arrays enemy state stepped as one vectorized batch per frame.
+
+    Slots [0, count) are live and packed; removing an enemy moves the last
+    slot into the hole so every array stays contiguous. Each slot has a thin
+    sprite view (StoredEnemy) used only for pygame collision and drawing.
+    """
+
+    def __init__(self, capacity=1024, lod_radius=None, lod_interval=1, separation_cell=None):
+        self.capacity = 0
+        self.count = 0
+        # Grid cell size for crowd separation (None disables it)
+        self.separation_cell = separation_cell
+        # Enemies beyond lod_radius only step every lod_interval ticks
+        self.lod_radius = lod_radius
+        self.lod_interval = lod_interval
+        self.type_names = list(ENEMY_TYPES.keys())
+        self.type_ids = {name: i for i, name in enumerate(self.type_names)}
+        self.views = []
+        self._allocate_arrays(max(16, capacity))
+
+    def _allocate_arrays(self, capacity):
+        old_count = self.count
+        fields = {
+            'pos': ((capacity, 2), np.float64),
+            'prev_pos': ((capacity, 2), np.float64),
+            'vel': ((capacity, 2), np.float64),
+            'knockback': ((capacity, 2), np.float64),
+            'knockback_damping': ((capacity,), np.float64),
+            'speed': ((capacity,), np.float64),
+            'separation': ((capacity,), np.float64),
+            'health': ((capacity,), np.int64),
+            'last_attack_time': ((capacity,), np.int64),
+            'attack_cooldown': ((capacity,), np.int64),
+            'type_id': ((capacity,), np.int16),
+            'flags': ((capacity,), np.uint8),
+            'spawn_seq': ((capacity,), np.int64),
+            'lod_pending': ((capacity,), np.float64),
+        }
+        for name, (shape, dtype) in fields.items():
+            new = np.zeros(shape, dtype=dtype)
+            if old_count:
+                new[:old_count] = getattr(self, name)[:old_count]
+            setattr(self, name, new)
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.count
+
+    def allocate(self, view):
+        """Reserve a zeroed slot for a new sprite view and return its index."""
+        if self.count >= self.capacity:
+            self._allocate_arrays(self.capacity * 2)
+        slot = self.count
+        self.count += 1
+        self.pos[slot] = 0.0
+        self.prev_pos[slot] = 0.0
+        self.vel[slot] = 0.0
+        self.knockback[slot] = 0.0
+        self.lod_pending[slot] = 0.0
+        self.flags[slot] = 0
+        self.views.append(view)
+        return slot
+
+    def release(self, slot):
+        """Free a slot by moving the last live slot into it."""
+        last = self.count - 1
+        if slot != last:
+            for name in ('pos', 'prev_pos', 'vel', 'knockback', 'knockback_damping', 'speed', 'separation', 'health',
+                         'last_attack_time', 'attack_cooldown', 'type_id', 'flags', 'spawn_seq',
+                         'lod_pending'):
+                array = getattr(self, name)
+                array[slot] = array[last]
+            moved = self.views[last]
+            self.views[slot] = moved
+            moved._slot = slot
+        self.views.pop()
+        self.count = last
+
+    def clear(self):
+        for view in self.views:
+            view._detach()
+        self.views = []
+        self.count = 0
+
+    def views_with_flag(self, flag):
+        """Sprite views whose flags include `flag` (e.g. every dying enemy)."""
+        indices = np.flatnonzero(self.flags[:self.count] & flag)
+        views = self.views
+        return [views[i] for i in indices.tolist()]
+
+    def clear_flag(self, flag):
+        self.flags[:self.count] &= np.uint8(~flag & 0xFF)
+
+    def update(self, player_pos, dt, lod_tick=0, flow_field=None):
+        """Advance pursuit and knockback by one `dt` second step, then sync sprite rects.
+
+        Distant enemies (see lod_radius) are only stepped on ticks where
+        (spawn_seq + lod_tick) % lod_interval == 0, with the time they skipped
+        folded into that step, and keep their facing. With a flow_field,
+        enemies it covers walk its cell direction instead of straight at
+        the player.
+        """
+        n = self.count
+        if n == 0:
+            return
+        pos = self.pos[:n]
+        flags = self.flags[:n]
+        self.prev_pos[:n] = pos
+        dt_arr = np.full(n, dt)
+
+        # Pursuit: normalized vector to the player center, scaled by speed (px/s)
+        player_x, player_y = player_pos
+        delta = np.empty((n, 2))
+        delta[:, 0] = player_x - pos[:, 0]
+        delta[:, 1] = player_y - pos[:, 1]
+        distance = np.hypot(delta[:, 0], delta[:, 1])
+
+        active = far = None
+        if self.lod_radius is not None and self.lod_interval > 1:
+            far = delta[:, 0] * delta[:, 0] + delta[:, 1] * delta[:, 1] > self.lod_radius * self.lod_radius
+            active = ~far | ((self.spawn_seq[:n] + lod_tick) % self.lod_interval == 0)
+            pending = self.lod_pending[:n]
+            stepped_dt = np.where(active, dt_arr + pending, 0.0)
+            pending[:] = np.where(active, 0.0, pending + dt_arr)
+            dt_arr = stepped_dt
+        pursuing = ((flags & (FLAG_STOPPED | FLAG_DYING)) == 0) & (distance > 0)
+        safe_distance = np.where(pursuing, distance, 1.0)
+        vel = self.vel[:n]
+        np.divide(delta, safe_distance[:, None], out=vel)
+        if flow_field is not None:
+            directions, use = flow_field.sample(pos)
+            vel[use] = directions[use]
+        vel *= self.speed[:n, None]
+        if self.separation_cell is not None:
+            vel += separation_velocity(pos, self.separation[:n], self.spawn_seq[:n], self.separation_cell)
+        vel[~pursuing] = 0.0
+        move = vel * dt_arr[:, None]
+
+        # Knockback slide with linear damping (zero knockback contributes nothing)
+        knockback = self.knockback[:n]
+        move += knockback * dt_arr[:, None]
+        decay = np.maximum(0.0, 1.0 - self.knockback_damping[:n] * dt_arr)
+        knockback *= decay[:, None]
+
+        pos += move
+        self.sync_views(player_x, active, far)
+
+    def sync_views(self, player_x, active=None, far=None):
+        """Copy array positions into sprite rects and pick the facing image.
+
+        Only `active` slots are synced (all by default); `far` slots keep
+        their current facing.
+        """
+        n = self.count
+        index = np.arange(n) if active is None else np.flatnonzero(active)
+        centers = self.pos[index].astype(np.int64)
+        facing_left = (player_x < centers[:, 0]).tolist()
+        keep_facing = [False] * len(index) if far is None else far[index].tolist()
+        views = self.views
+        for i, (x, y), left, keep in zip(index.tolist(), centers.tolist(), facing_left, keep_facing):
+            view = views[i]
+            view.rect.center = (x, y)
+            if not keep and left != view._facing_left:
+                view._facing_left = left
+                view.image = view.frames.plain[left]
+
+    def views_beyond(self, center, radius):
+        """Live (not dying) sprite views whose center is farther than `radius` from `center`."""
+        n = self.count
+        dx = self.pos[:n, 0] - center[0]
+        dy = self.pos[:n, 1] - center[1]
+        beyond = (dx * dx + dy * dy > radius * radius) & ((self.flags[:n] & FLAG_DYING) == 0)
+        views = self.views
+        return [views[i] for i in np.flatnonzero(beyond).tolist()]
+
+
+def _array_property(name, column=None, cast=float):
+    def getter(self):
+        slot = self._slot
+        if slot is None:
+            return self._detached.get((name, column), cast(0))
+        array = getattr(self._store, name)
+        return cast(array[slot] if column is None else array[slot, column])
+
+    def setter(self, value):
+        slot = self._slot
+        if slot is None:
+            self._detached[(name, column)] = cast(value)
+        elif column is None:
+            getattr(self._store, name)[slot] = value
+        else:
+            getattr(self._store, name)[slot, column] = value
+
+    return property(getter, setter)
+
+
+def _flag_property(flag):
+    def getter(self):
+        slot = self._slot
+        if slot is None:
+            return bool(self._detached.get(('flags', flag), False))
+        return bool(self._store.flags[slot] & flag)
+
+    def setter(self, value):
+        slot = self._slot
+        if slot is None:
+            self._detached[('flags', flag)] = bool(value)
+        elif value:
+            self._store.flags[slot] |= flag
+        else:
+            self._store.flags[slot] &= np.uint8(~flag & 0xFF)
+
+    return property(getter, setter)
+
+
+class StoredEnemy(Enemy):
+    """Enemy sprite whose simulation state lives in an EnemyStore slot.
+
+    Attribute access is unchanged for callers (collisions, damage, drops), but
+    movement is driven by EnemyStore.update instead of Enemy.update.
+    """
+
+    center_x = _array_property('pos', 0)
+    center_y = _array_property('pos', 1)
+    prev_center_x = _array_property('prev_pos', 0)
+    prev_center_y = _array_property('prev_pos', 1)
+    knockback_vx = _array_property('knockback', 0)
+    knockback_vy = _array_property('knockback', 1)
+    knockback_damping = _array_property('knockback_damping')
+    speed = _array_property('speed')
+    separation = _array_property('separation')
+    health = _array_property('health', cast=int)
+    last_attack_time = _array_property('last_attack_time', cast=int)
+    attack_cooldown = _array_property('attack_cooldown', cast=int)
+    spawn_seq = _array_property('spawn_seq', cast=int)
+    stopped_due_to_attack = _flag_property(FLAG_STOPPED)
+    is_dying = _flag_property(FLAG_DYING)
+
+    def __init__(self, store, x, y, enemy_type='rat'):
+        self._store = store
+        self._slot = None
+        super().__init__(x, y, enemy_type)
+
+    def reset(self, x, y, enemy_type='rat'):
+        # A pooled view is detached; claim a fresh slot before the fields are written
+        store = self._store
+        self._detached = {}
+        self._slot = store.allocate(self)
+        super().reset(x, y, enemy_type)
+        store.type_id[self._slot] = store.type_ids.get(self.enemy_type, 0)
+
+    def _detach(self):
+        """Snapshot slot values onto the sprite so late readers still see sane state."""
+        if self._slot is None:
+            return
+        for prop_name in ('center_x', 'center_y', 'prev_center_x', 'prev_center_y', 'knockback_vx', 'knockback_vy', 'knockback_damping',
+                          'speed', 'separation', 'health', 'last_attack_time', 'attack_cooldown', 'spawn_seq',
+                          'stopped_due_to_attack', 'is_dying'):
+            value = getattr(self, prop_name)
+            slot, self._slot = self._slot, None
+            setattr(self, prop_name, value)
+            self._slot = slot
+        self._slot = None
+
+    def kill(self):
+        super().kill()
+        if self._slot is not None:
+            slot = self._slot
+            self._detach()
+            self._store.release(slot)
+
+    def update(self, player_pos, dt, face_player=True, flow_field=None):
+        # Movement is stepped in bulk by EnemyStore.update
+        pass
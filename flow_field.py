@@ -0,0 +1,153 @@
+import heapq
+import math
+
+try:
+    import numpy as np
+except ImportError:  # Optional: only EnemyStore's bulk sampling needs it
+    np = None
+
+# Player-centred flow field: a coarse grid around the player where each cell
+# holds the unit direction an enemy standing in it should walk. It is rebuilt
+# only when the player enters another cell (or the obstacles change), so
+# enemies steer by table lookup instead of each normalizing its own vector.
+#
+# Without obstacles every cell points straight at the player's cell center.
+# Blocked cells turn on a Dijkstra distance field from the player's cell;
+# each cell then points at its cheapest neighbour, routing around walls.
+# Enemies outside the grid, or within `near` cells of the player (where the
+# cell-center approximation is too coarse), steer directly.
+
+_NEIGHBOURS = [(dx, dy, math.hypot(dx, dy)) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy]
+
+
+class FlowField:
+    def __init__(self, cell_size=64, radius=24, near=1):
+        self.cell_size = cell_size
+        self.radius = radius          # grid spans (2 * radius + 1) cells per side
+        self.near = near
+        self.size = 2 * radius + 1
+        self.blocked = set()          # world cell coords enemies cannot enter
+        self.origin = None            # world cell coords of grid cell (0, 0)
+        self.center = None            # world cell coords of the player's cell
+        self.rebuilds = 0
+        self.dir_x = [0.0] * (self.size * self.size)
+        self.dir_y = [0.0] * (self.size * self.size)
+        self.reachable = [True] * (self.size * self.size)
+        # The direct table is the same around every player cell; built once
+        self._direct_built = False
+        self._arrays = None
+
+    def cell_of(self, x, y):
+        size = self.cell_size
+        return (math.floor(x / size), math.floor(y / size))
+
+    def set_blocked(self, cells):
+        """Replace the blocked world cells; the field is rebuilt on the next update."""
+        self.blocked = set(cells)
+        self.center = None
+
+    def update(self, player_pos):
+        """Rebuild if the player entered another cell; returns True if it did."""
+        cell = self.cell_of(*player_pos)
+        if cell == self.center:
+            return False
+        self.center = cell
+        self.origin = (cell[0] - self.radius, cell[1] - self.radius)
+        if self.blocked:
+            self._build_routed()
+            self._direct_built = False
+        elif not self._direct_built:
+            self._build_direct()
+            self._direct_built = True
+        self._arrays = None
+        self.rebuilds += 1
+        return True
+
+    def _build_direct(self):
+        size, r = self.size, self.radius
+        dir_x, dir_y = self.dir_x, self.dir_y
+        for gx in range(size):
+            for gy in range(size):
+                dx, dy = r - gx, r - gy
+                length = math.hypot(dx, dy)
+                i = gx * size + gy
+                self.reachable[i] = True
+                if length:
+                    dir_x[i] = dx / length
+                    dir_y[i] = dy / length
+                else:
+                    dir_x[i] = dir_y[i] = 0.0
+
+    def _build_routed(self):
+        size, r = self.size, self.radius
+        ox, oy = self.origin
+        blocked = self.blocked
+        inf = float('inf')
+        dist = [inf] * (size * size)
+        start = r * size + r
+        dist[start] = 0.0
+        heap = [(0.0, r, r)]
+        while heap:
+            d, gx, gy = heapq.heappop(heap)
+            if d > dist[gx * size + gy]:
+                continue
+            for dx, dy, cost in _NEIGHBOURS:
+                nx, ny = gx + dx, gy + dy
+                if not (0 <= nx < size and 0 <= ny < size) or (ox + nx, oy + ny) in blocked:
+                    continue
+                # No diagonal corner cutting past a wall
+                if dx and dy and ((ox + gx + dx, oy + gy) in blocked or (ox + gx, oy + gy + dy) in blocked):
+                    continue
+                nd = d + cost
+                ni = nx * size + ny
+                if nd < dist[ni]:
+                    dist[ni] = nd
+                    heapq.heappush(heap, (nd, nx, ny))
+
+        dir_x, dir_y = self.dir_x, self.dir_y
+        for gx in range(size):
+            for gy in range(size):
+                i = gx * size + gy
+                best, step = dist[i], None
+                for dx, dy, _ in _NEIGHBOURS:
+                    nx, ny = gx + dx, gy + dy
+                    if 0 <= nx < size and 0 <= ny < size and dist[nx * size + ny] < best:
+                        best, step = dist[nx * size + ny], (dx, dy)
+                # Cells cut off from the player fall back to direct steering
+                self.reachable[i] = dist[i] < inf
+                if step is None:
+                    dir_x[i] = dir_y[i] = 0.0
+                else:
+                    length = math.hypot(*step)
+                    dir_x[i] = step[0] / length
+                    dir_y[i] = step[1] / length
+
+    def direction_at(self, x, y):
+        """Unit direction for a world position, or None to steer directly."""
+        if self.origin is None:
+            return None
+        cx, cy = self.cell_of(x, y)
+        gx, gy = cx - self.origin[0], cy - self.origin[1]
+        if not (0 <= gx < self.size and 0 <= gy < self.size):
+            return None
+        if abs(gx - self.radius) <= self.near and abs(gy - self.radius) <= self.near:
+            return None
+        i = gx * self.size + gy
+        if not self.reachable[i]:
+            return None
+        return self.dir_x[i], self.dir_y[i]
+
+    def sample(self, pos):
+        """Vectorized direction_at over an (n, 2) array: (directions, use mask)."""
+        if self._arrays is None:
+            self._arrays = (np.column_stack((np.array(self.dir_x), np.array(self.dir_y))),
+                            np.array(self.reachable))
+        directions, reachable = self._arrays
+        size = self.cell_size
+        gx = np.floor(pos[:, 0] / size).astype(np.int64) - self.origin[0]
+        gy = np.floor(pos[:, 1] / size).astype(np.int64) - self.origin[1]
+        inside = (gx >= 0) & (gx < self.size) & (gy >= 0) & (gy < self.size)
+        near = (np.abs(gx - self.radius) <= self.near) & (np.abs(gy - self.radius) <= self.near)
+        index = np.where(inside, gx * self.size + gy, 0)
+        use = inside & ~near & reachable[index]
+        return directions[index], use
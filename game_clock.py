@@ -0,0 +1,45 @@
+import pygame
+
+
+# Gameplay code reads time through get_ticks() below instead of calling
+# pygame.time.get_ticks() directly, so a simulation can run on a clock it
+# controls (headless runs, replays, benchmarks) instead of the wall clock.
+
+class WallClock:
+    """Milliseconds since pygame.init(), as returned by pygame.time.get_ticks()."""
+
+    def get_ticks(self) -> int:
+        return pygame.time.get_ticks()
+
+
+class ManualClock:
+    """Clock that only moves when advanced; lets a simulation run faster than real time."""
+
+    def __init__(self, start_ms: float = 0.0):
+        self.now_ms = float(start_ms)
+
+    def get_ticks(self) -> int:
+        return int(self.now_ms)
+
+    def advance(self, ms: float) -> None:
+        self.now_ms += ms
+
+    def set(self, ms: float) -> None:
+        self.now_ms = float(ms)
+
+
+_clock = WallClock()
+
+
+def get_ticks() -> int:
+    return _clock.get_ticks()
+
+
+def get_clock():
+    return _clock
+
+
+def set_clock(clock) -> None:
+    """Install the clock every gameplay module reads from."""
+    global _clock
+    _clock = clock
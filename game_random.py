@@ -0,0 +1,20 @@
+import random
+
+
+# Dedicated random stream for gameplay decisions (spawn positions, upgrade
+# offers). Seeding it makes a run reproducible; purely cosmetic effects such
+# as the level-up exp rain keep using the global `random` module.
+rng = random.Random()
+
+# Separate stream for the weighted spawn/drop tables (see sampler.py), so how
+# many draws one system makes never shifts the other's sequence.
+sample_rng = random.Random()
+
+
+def seed(value=None):
+    """Seed the gameplay streams (a fresh random seed if None) and return the seed."""
+    if value is None:
+        value = random.SystemRandom().getrandbits(63)
+    rng.seed(value)
+    sample_rng.seed(f"{value}:sampler")
+    return value
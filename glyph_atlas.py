@@ -0,0 +1,113 @@
+import pygame
+
+
+class GlyphAtlas:
+    """Outlined glyphs pre-rendered once at a fixed ladder of scales.
+
+    Text is composed from cached glyphs. Faded text uses per-glyph copies at
+    one of `alpha_steps` alpha levels, made on first use, so every glyph of
+    every number can go out in one Surface.blits call without touching the
+    shared surfaces' alpha in between.
+    """
+
+    def __init__(self, font, color=(255, 255, 255), outline=(0, 0, 0), thickness=2,
+                 min_scale=0.65, scale_steps=8, preload='0123456789', alpha_steps=16):
+        self.font = font
+        self.color = color
+        self.outline = outline
+        self.thickness = thickness
+        self.min_scale = min_scale
+        self.scales = [1.0 - (1.0 - min_scale) * i / (scale_steps - 1) for i in range(scale_steps)]
+        self._preload = preload
+        self.alpha_steps = alpha_steps
+        # char -> per-scale (outlined glyph surface, advance in px)
+        self._glyphs = {}
+        # (char, scale index, alpha level) -> faded copy of the glyph surface
+        self._faded = {}
+
+    def scale_index(self, scale):
+        """Nearest pre-scaled size for `scale` (1.0 down to min_scale)."""
+        steps = len(self.scales) - 1
+        index = int(round((1.0 - scale) / (1.0 - self.min_scale) * steps))
+        return min(max(index, 0), steps)
+
+    def _glyph(self, char):
+        variants = self._glyphs.get(char)
+        if variants is None:
+            if not self._glyphs and self._preload:
+                # First use: bake the common set in one go
+                for c in self._preload:
+                    self._glyphs[c] = self._render(c)
+                variants = self._glyphs.get(char)
+            if variants is None:
+                variants = self._render(char)
+                self._glyphs[char] = variants
+        return variants
+
+    def _render(self, char):
+        t = self.thickness
+        fill_text = self.font.render(char, True, self.color).convert_alpha()
+        w, h = fill_text.get_size()
+        glyph = pygame.Surface((w + t * 2, h + t * 2), pygame.SRCALPHA)
+        if t > 0:
+            # Outline by 8-neighborhood
+            outline_text = self.font.render(char, True, self.outline).convert_alpha()
+            for dx in (-t, 0, t):
+                for dy in (-t, 0, t):
+                    if dx == 0 and dy == 0:
+                        continue
+                    glyph.blit(outline_text, (dx + t, dy + t))
+        glyph.blit(fill_text, (t, t))
+
+        # Advance by the surface width less one side's outline, so the next
+        # glyph's outline meets this glyph's fill instead of covering it
+        variants = []
+        for scale in self.scales:
+            if scale == 1.0:
+                variants.append((glyph, float(w + t)))
+                continue
+            size = (max(1, int(glyph.get_width() * scale)), max(1, int(glyph.get_height() * scale)))
+            variants.append((pygame.transform.smoothscale(glyph, size), size[0] - t * scale))
+        return variants
+
+    def size(self, text, scale_index):
+        """(width, height) of `text` drawn at one of the pre-scaled sizes."""
+        advance = 0.0
+        height = 0
+        for char in text:
+            image, char_advance = self._glyph(char)[scale_index]
+            advance += char_advance
+            height = max(height, image.get_height())
+        # The last glyph's trailing outline sticks out past its advance
+        pad = self.thickness * self.scales[scale_index] if text else 0.0
+        return int(advance + pad), height
+
+    def _faded_glyph(self, char, index, image, alpha):
+        level = int(alpha * self.alpha_steps / 255 + 0.5)
+        if level >= self.alpha_steps:
+            return image
+        key = (char, index, level)
+        faded = self._faded.get(key)
+        if faded is None:
+            faded = image.copy()
+            faded.set_alpha(level * 255 // self.alpha_steps)
+            self._faded[key] = faded
+        return faded
+
+    def layout(self, text, center_x, bottom_y, scale=1.0, alpha=255, out=None):
+        """Append (glyph surface, position) pairs for `text` to `out` (a new list if None)."""
+        if out is None:
+            out = []
+        index = self.scale_index(scale)
+        width, height = self.size(text, index)
+        top = int(bottom_y - height)
+        x = center_x - width / 2
+        for char in text:
+            image, advance = self._glyph(char)[index]
+            out.append((self._faded_glyph(char, index, image, alpha), (int(x), top)))
+            x += advance
+        return out
+
+    def draw(self, surface, text, center_x, bottom_y, scale=1.0, alpha=255):
+        """Blit `text` horizontally centered on center_x with its bottom at bottom_y."""
+        surface.blits(self.layout(text, center_x, bottom_y, scale, alpha), doreturn=False)
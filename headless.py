@@ -0,0 +1,80 @@
+import os
+import sys
+import time
+import argparse
+
+import pygame
+
+import game_clock
+from settings import *
+from game_state_manager import GameStateManager
+
+
+def first_choice(choices):
+    """Upgrade policy: always take the first offered card."""
+    return 0
+
+
+def create_headless_level(start_ms=0):
+    """Build a Level with no window, driven by a ManualClock.
+
+    pygame still needs a (dummy) video mode so sprites can be converted, but
+    the Level's display is an off-screen Surface that step() never draws to.
+    """
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    pygame.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((1, 1))
+    game_clock.set_clock(game_clock.ManualClock(start_ms))
+
+    from level import Level
+    display = pygame.Surface((DISPLAY_WIDTH, DISPLAY_HEIGHT))
+    return Level(display, GameStateManager('level'), pygame.time.Clock(), headless=True)
+
+
+def simulate(level, seconds, step=SIM_STEP, upgrade_policy=first_choice, input_script=None):
+    """Run `seconds` of gameplay in fixed steps as fast as the CPU allows.
+
+    upgrade_policy(choices) -> index picks a card whenever a level-up is offered;
+    input_script(now_ms) -> INPUT_* bitmask drives the player (None stands still).
+    Stops early if the player dies. Returns the number of steps taken, so the
+    time of death is steps * step.
+    """
+    clock = game_clock.get_clock()
+    step_ms = step * 1000.0
+    steps = int(round(seconds / step))
+    for taken in range(1, steps + 1):
+        clock.advance(step_ms)
+        if input_script is not None:
+            level.player.input_override = input_script(clock.get_ticks())
+        else:
+            level.player.input_override = 0
+        level.step(step)
+        if level.player.current_health <= 0:
+            return taken
+        if level.level_up_screen.is_active:
+            level.choose_upgrade(upgrade_policy(level.level_up_screen.upgrade_choices))
+    return steps
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run the level without a window at a fixed timestep.')
+    parser.add_argument('--minutes', type=float, default=1.0, help='simulated gameplay time')
+    parser.add_argument('--step', type=float, default=SIM_STEP, help='simulation step in seconds')
+    args = parser.parse_args(argv)
+
+    level = create_headless_level()
+    started = time.perf_counter()
+    steps = simulate(level, args.minutes * 60.0, args.step)
+    elapsed = time.perf_counter() - started
+    print(f"simulated {steps * args.step / 60.0:.1f} min in {elapsed:.2f} s ({steps} steps, "
+          f"{elapsed * 1000.0 / max(1, steps):.3f} ms/step)")
+    if level.player.current_health <= 0:
+        print(f"player died at {steps * args.step:.2f} s")
+    print(f"player level {level.player.level}, health {level.player.current_health}, "
+          f"enemies {len(level.enemy_manager.enemy_list)}, drops {len(level.drops)}")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
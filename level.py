@@ -1,5 +1,11 @@
+import time
+import functools
+
 import pygame
-import random
+
+import game_clock
+import game_random
+from game_random import rng, sample_rng
 
 from player import Player
 from enemy_manager import EnemyManager
@@ -13,38 +19,37 @@ from camera import Camera
 from level_up_screen import LevelUpScreen
 from upgrade_system import UPGRADE_CHOICES, apply_upgrade, compute_available_upgrades
 from weapons import WeaponManager
+from profiler import profiler
+from pools import ObjectPool
+from drop_store import DropStore, StoredDrop, DROP_STORE_AVAILABLE
+from drop_merge import DropMerger
+from sampler import DropTables
+from glyph_atlas import GlyphAtlas
+from background import BackgroundRenderer
+from assets import assets
+from text_cache import text_cache
+from render_queue import RenderQueue, LAYER_PLAYER, LAYER_DROPS, LAYER_SLASH, LAYER_DAMAGE_NUMBERS
 
 
 # --- Floating damage numbers (screen-space overlay) ---
 class DamageNumber:
-    def __init__(self, text: str, world_pos, font: pygame.font.Font,
-                 color=(255, 255, 255), outline=(0, 0, 0), duration_ms=2000):
+    def __init__(self, text: str, world_pos, atlas: GlyphAtlas, duration_ms=2000):
+        self.reset(text, world_pos, atlas, duration_ms)
+
+    def reset(self, text: str, world_pos, atlas: GlyphAtlas, duration_ms=2000):
         # World-space anchor so numbers do not follow the camera
         self.world_x, self.world_y = float(world_pos[0]), float(world_pos[1])
         self.start_world_y = float(self.world_y)
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = game_clock.get_ticks()
         self.duration = duration_ms
         self.alive = True
-        self.font = font
-        self.base_surface = self._render_with_outline(text, font, color, outline)
+        # Glyphs come from the shared atlas, baked on first draw so headless
+        # simulation never touches a Surface
+        self.atlas = atlas
+        self.text = text
         self.scale = 1.0
         self.alpha = 255
 
-    def _render_with_outline(self, text, font, color, outline, thickness=2):
-        text_surf = font.render(str(text), True, color).convert_alpha()
-        w, h = text_surf.get_size()
-        surf = pygame.Surface((w + thickness * 2, h + thickness * 2), pygame.SRCALPHA)
-        # Outline by 8-neighborhood
-        if thickness > 0:
-            outline_surf = font.render(str(text), True, outline).convert_alpha()
-            for dx in (-thickness, 0, thickness):
-                for dy in (-thickness, 0, thickness):
-                    if dx == 0 and dy == 0:
-                        continue
-                    surf.blit(outline_surf, (dx + thickness, dy + thickness))
-        surf.blit(text_surf, (thickness, thickness))
-        return surf
-
     def update(self, now_ms: int):
         if not self.alive:
             return
@@ -61,39 +66,54 @@ class DamageNumber:
     def draw(self, surface: pygame.Surface, offset=(0, 0)):
         if not self.alive:
             return
-        img = self.base_surface
-        if self.scale != 1.0:
-            w = max(1, int(img.get_width() * self.scale))
-            h = max(1, int(img.get_height() * self.scale))
-            img = pygame.transform.smoothscale(img, (w, h))
-        img = img.copy()  # isolate alpha per instance to avoid trails
-        img.set_alpha(self.alpha)
-        screen_x = self.world_x - offset[0]
-        screen_y = self.world_y - offset[1]
-        surface.blit(img, (int(screen_x - img.get_width() / 2), int(screen_y - img.get_height())))
+        self.atlas.draw(surface, self.text, self.world_x - offset[0], self.world_y - offset[1],
+                        self.scale, self.alpha)
+
+    def layout(self, offset, out):
+        """Append this number's glyph blits to `out`."""
+        if self.alive:
+            self.atlas.layout(self.text, self.world_x - offset[0], self.world_y - offset[1],
+                              self.scale, self.alpha, out)
 
 
 class DamageNumberManager:
     def __init__(self, display: pygame.Surface):
         self.display = display
         self.font = pygame.font.Font(None, 32)
+        # Outlined digits pre-rendered at a fixed set of sizes, shared by every number
+        self.atlas = GlyphAtlas(self.font)
         self.items: list[DamageNumber] = []
+        self.pool = ObjectPool('damage_number', DamageNumber, POOL_CAPACITY['damage_number'])
+
+    def reset(self):
+        self.pool.release_all(self.items)
+        self.items = []
 
     def spawn(self, value: int, world_pos):
         try:
-            dn = DamageNumber(str(value), world_pos, self.font)
+            dn = self.pool.acquire(str(value), world_pos, self.atlas)
             self.items.append(dn)
         except Exception:
             pass
 
     def update(self, now_ms: int):
-        for dn in self.items:
-            dn.update(now_ms)
-        self.items = [dn for dn in self.items if dn.alive]
-
-    def draw(self, surface: pygame.Surface, offset):
-        for dn in self.items:
-            dn.draw(surface, offset)
+        with profiler.scope('damage_numbers.update'):
+            live = []
+            for dn in self.items:
+                dn.update(now_ms)
+                if dn.alive:
+                    live.append(dn)
+                else:
+                    self.pool.release(dn)
+            self.items = live
+
+    def draw(self, surface: pygame.Surface, offset, queue=None):
+        with profiler.scope('damage_numbers.draw'):
+            batch = queue.batch(LAYER_DAMAGE_NUMBERS) if queue is not None else []
+            for dn in self.items:
+                dn.layout(offset, batch)
+            if queue is None:
+                surface.blits(batch, doreturn=False)
 
 
 # --- Performance overlay (simple frame/update timing and counts) ---
@@ -114,21 +134,21 @@ class PerfOverlay:
         self._last_display_ticks = 0
         self._cached_surfaces = []
         self._cached_size = (0, 0)
+        # Paths written by the last F9 dump, shown on the overlay
+        self.last_dump = None
 
     def start_frame(self):
-        import time
         self.t0 = time.perf_counter()
         self.update_ms = 0.0
         self.frame_ms = 0.0
 
     def mark_update_end(self):
-        import time
         if self.t0 is None:
             return
         self.update_ms = (time.perf_counter() - self.t0) * 1000.0
 
     def end_frame(self):
-        import time
+        profiler.end_frame()
         if self.t0 is None:
             return
         self.frame_ms = (time.perf_counter() - self.t0) * 1000.0
@@ -143,7 +163,35 @@ class PerfOverlay:
     def _avg(self, arr):
         return sum(arr) / len(arr) if arr else 0.0
 
-    def draw(self, num_enemies: int, num_drops: int, num_dmg_numbers: int):
+    def toggle_profiler(self):
+        profiler.set_enabled(not profiler.enabled)
+        if not profiler.enabled:
+            profiler.reset()
+        self._cached_surfaces = []
+
+    def dump_profile(self, prefix='profile'):
+        """Write the rolling scope history as CSV plus a Chrome trace; returns the paths."""
+        stamp = time.strftime('%Y%m%d-%H%M%S')
+        csv_path = f"{prefix}_{stamp}.csv"
+        trace_path = f"{prefix}_{stamp}.trace.json"
+        profiler.dump_csv(csv_path)
+        profiler.dump_chrome_trace(trace_path)
+        self.last_dump = (csv_path, trace_path)
+        self._cached_surfaces = []
+        return csv_path, trace_path
+
+    def _scope_lines(self, max_rows=24):
+        rows = profiler.breakdown()
+        if not rows:
+            return ["scopes: waiting for data"]
+        lines = ["scope                      avg / max ms"]
+        for path, depth, avg_ms, max_ms in rows[:max_rows]:
+            name = '  ' * depth + path.rsplit('/', 1)[-1]
+            lines.append(f"{name:<26} {avg_ms:5.2f} / {max_ms:5.2f}")
+        return lines
+
+    def draw(self, num_enemies: int, num_drops: int, num_dmg_numbers: int, stats=()):
+        # stats: extra objects with a stats_line() (object pools, drop merger)
         # Update cached text surfaces at most twice per second
         now_ticks = pygame.time.get_ticks()
         if (now_ticks - self._last_display_ticks >= self.display_update_interval_ms) or not self._cached_surfaces:
@@ -154,6 +202,15 @@ class PerfOverlay:
                 f"enemies: {num_enemies}  drops: {num_drops}",
                 f"dmg nums: {num_dmg_numbers}",
             ]
+            lines.extend(source.stats_line() for source in stats)
+            if profiler.enabled:
+                lines.extend(self._scope_lines())
+                if self.last_dump is not None:
+                    lines.append(f"saved {self.last_dump[0]}, {self.last_dump[1]}")
+                else:
+                    lines.append("F9: save profile")
+            else:
+                lines.append("F3: scope profiler")
             padding = 12
             max_w = 0
             h = padding
@@ -186,37 +243,29 @@ class PerfOverlay:
             ty += s.get_height() + 2
 
 class Level:
-    def __init__(self, display, game_state_manager, clock):
+    def __init__(self, display, game_state_manager, clock, headless=False):
         self.display = display
-        self.background_img = pygame.image.load('rock_bg.jpg').convert()
+        # Headless levels are driven through step() only (see headless.py)
+        self.headless = headless
+        self.background_img = assets.image('rock_bg.jpg')
         self.tile_size = self.background_img.get_size()
+        self.background = BackgroundRenderer(self.background_img, self.display.get_size())
         self.game_state_manager = game_state_manager
-        self.player = Player(self.display)
-        self.camera = Camera(self.player, display.get_size())
-        self.enemy_manager = EnemyManager(self.display, 20, 20)
-        self.scoreboard = Scoreboard(self.display, clock)
-        self.health_bar = HealthBar(self.display, self.player)
         self.pause_menu = PauseMenu(self.display, game_state_manager)
-        self.drops = pygame.sprite.Group()
-        self.xp_bar = XPBar(self.display, self.player)
         self.clock = clock
-        self.last_update = pygame.time.get_ticks()
-        
-        # Level-up system
-        self.level_up_screen = LevelUpScreen(self.display)
-        self.player_previous_level = self.player.level
-        
-        # Weapons system
-        from slash_attack import SlashAttack
-        self.weapons = WeaponManager(self.player, self.display, SlashAttack)
-        # Track taken upgrade counts
-        self.taken_upgrades = {}
 
-        # Damage numbers overlay
-        self.damage_numbers = DamageNumberManager(self.display)
         # Performance overlay
         self.perf = PerfOverlay(self.display, clock)
 
+        # World sprites are batched per layer into Surface.blits calls
+        self.render_queue = RenderQueue()
+
+        # Player/enemy contact uses a shrunken hitbox
+        self._player_hit_test = pygame.sprite.collide_rect_ratio(0.6)
+
+        # Per enemy type drop chance and weighted drop type (see sampler.py)
+        self.drop_tables = DropTables()
+
         # Drop effects dispatcher
         self.drop_effects = {
             'health': self._effect_health,
@@ -224,28 +273,58 @@ class Level:
             'magnet': self._effect_magnet,
         }
 
+        # Optional replay recorder (see replay.py)
+        self.recorder = None
+
+        self.player = Player(self.display)
+        self.camera = Camera(self.player, self.display.get_size())
+        self.enemy_manager = EnemyManager(self.display, 20, 20)
+        self.scoreboard = Scoreboard(self.display, self.clock)
+        self.health_bar = HealthBar(self.display, self.player)
+        self.drops = pygame.sprite.Group()
+        # Optional struct-of-arrays drop state stepped in bulk (see drop_store.py)
+        self.drop_store = DropStore() if (DROP_ARRAY_STORE and DROP_STORE_AVAILABLE) else None
+        factory = functools.partial(StoredDrop, self.drop_store) if self.drop_store is not None else EnemyDrop
+        self.drop_pool = ObjectPool('drop', factory, POOL_CAPACITY['drop'])
+        self.drop_merger = DropMerger(self.display, self.drops, self.drop_pool, self.drop_store,
+                                      DROP_MERGE_INTERVAL)
+        self.xp_bar = XPBar(self.display, self.player)
+        self.level_up_screen = LevelUpScreen(self.display, particles=not self.headless)
+        from slash_attack import SlashAttack
+        self.weapons = WeaponManager(self.player, self.display, SlashAttack)
+        # Damage numbers overlay
+        self.damage_numbers = DamageNumberManager(self.display)
+
+        # Gameplay reads time from a simulation clock that run() advances in
+        # whole SIM_STEP steps, so overlays and slow frames never need catch-up
+        # fixes. Headless callers step the Level on a clock they own instead.
+        self.frame_clock = game_clock.get_clock()
+        self.sim_clock = None
+        if not headless:
+            self.sim_clock = game_clock.ManualClock(self.frame_clock.get_ticks())
+            game_clock.set_clock(self.sim_clock)
+
+        self.reset()
+
     def handle_events(self, events):
         for event in events:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
-                    was_paused = self.pause_menu.is_paused
                     self.pause_menu.is_paused = not self.pause_menu.is_paused
-                    # On resume, prevent enemy catch-up
-                    if was_paused and not self.pause_menu.is_paused:
-                        now = pygame.time.get_ticks()
-                        try:
-                            for enemy in self.enemy_manager.enemy_list:
-                                setattr(enemy, '_last_update_time', now)
-                            self.enemy_manager.last_spawn_time = now
-                        except Exception:
-                            pass
                 elif event.key == pygame.K_p:
                     # Debug cheat: add just enough XP to reach next level
+                    if self.recorder is not None:
+                        self.recorder.record_cheat_xp(game_clock.get_ticks())
                     try:
                         delta = max(1, self.player.xp_to_next_level - self.player.current_xp)
                         self.player.increase_xp(delta)
                     except Exception:
                         pass
+                elif event.key == pygame.K_F3:
+                    self.perf.toggle_profiler()
+                elif event.key == pygame.K_F9 and profiler.enabled:
+                    # The overlay shows where the files went
+                    self.perf.dump_profile()
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 # Handle mouse button down events
                 pass
@@ -262,7 +341,7 @@ class Level:
         filtered = compute_available_upgrades(self.player, self.weapons, self.taken_upgrades)
         available_upgrades = list(filtered.keys())
         # Randomly select 3 upgrades
-        selected_upgrades = random.sample(available_upgrades, min(3, len(available_upgrades)))
+        selected_upgrades = rng.sample(available_upgrades, min(3, len(available_upgrades)))
         upgrade_choices = [filtered[upgrade] for upgrade in selected_upgrades]
         self.level_up_screen.show_upgrades(upgrade_choices)
     
@@ -273,20 +352,24 @@ class Level:
             if selected_upgrade:
                 self.apply_upgrade(selected_upgrade)
     
+    def choose_upgrade(self, index):
+        """Pick one of the offered upgrade cards without input events (headless, replays)."""
+        if not self.level_up_screen.is_active:
+            return None
+        self.level_up_screen.selected_choice = index
+        selected_upgrade = self.level_up_screen.apply_upgrade()
+        if selected_upgrade:
+            self.apply_upgrade(selected_upgrade)
+        return selected_upgrade
+
     def apply_upgrade(self, upgrade):
         """Apply the selected upgrade to the player."""
         effect = upgrade['effect']
         value = upgrade['value']
+        now = game_clock.get_ticks()
+        if self.recorder is not None and upgrade in self.level_up_screen.upgrade_choices:
+            self.recorder.record_upgrade(now, self.level_up_screen.upgrade_choices.index(upgrade))
         apply_upgrade(effect, value, self.player, self.weapons)
-        # Prevent enemy catch-up after overlay by resetting their last update time
-        now = pygame.time.get_ticks()
-        try:
-            for enemy in self.enemy_manager.enemy_list:
-                setattr(enemy, '_last_update_time', now)
-            # Also reset spawn timer so spawns don't burst
-            self.enemy_manager.last_spawn_time = now
-        except Exception:
-            pass
         # Track taken count by key name if present in catalog
         for key, data in UPGRADE_CHOICES.items():
             if data['effect'] == effect and data['value'] == value and data['name'] == upgrade['name']:
@@ -294,77 +377,74 @@ class Level:
                 break
 
     def draw_background_with_offset(self, offset):
-        offset_x, offset_y = offset
-
-        # Calculate the starting tile position based on the offset
-        start_x = offset_x % self.tile_size[0]
-        start_y = offset_y % self.tile_size[1]
-
-        # Calculate the number of tiles needed to cover the screen
-        tiles_x = int(DISPLAY_WIDTH / self.tile_size[0]) + 2
-        tiles_y = int(DISPLAY_HEIGHT / self.tile_size[1]) + 2
-
-        # Draw each tile, adjusted by the current camera offset
-        for y in range(tiles_y):
-            for x in range(tiles_x):
-                tile_pos = (x * self.tile_size[0] - start_x, y * self.tile_size[1] - start_y)
-                self.display.blit(self.background_img, tile_pos)
+        with profiler.scope('background'):
+            self.background.draw(self.display, offset)
 
     def check_collisions(self):
         """Handle player/enemy collisions and manage enemy attacks based on cooldown."""
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.get_ticks()
         # Reset stop flags each frame before computing current collisions
-        for enemy in self.enemy_manager.enemy_list:
-            enemy.stopped_due_to_attack = False
-
-        hits = pygame.sprite.spritecollide(
-            self.player,
-            self.enemy_manager.enemy_list,
-            False,
-            collided=pygame.sprite.collide_rect_ratio(0.6)
-        )
+        self.enemy_manager.clear_attack_stops()
+
+        hits = self.enemy_manager.collide(self.player, collided=self._player_hit_test)
         for enemy in hits:
             enemy.stopped_due_to_attack = True
             enemy.attack(self.player, current_time)
 
     def check_slash_collisions(self):
         if self.player.slash_attack.active:
-            current_time = pygame.time.get_ticks()
-            hits = pygame.sprite.spritecollide(self.player.slash_attack, self.enemy_manager.enemy_list, dokill=False)
+            current_time = game_clock.get_ticks()
+            hits = self.enemy_manager.collide(self.player.slash_attack)
             for enemy in hits:
                 # Avoid double-counting within a single slash animation
                 if getattr(self.player.slash_attack, 'has_hit', None) and self.player.slash_attack.has_hit(enemy):
                     continue
                 # Apply damage instead of instant kill
-                dmg = self.player.slash_attack.damage
-                if enemy.take_damage(dmg, hit_source_pos=self.player.rect.center):  # Enemy died
-                    # Death is handled by enemy fade logic
-                    
-                    # Create drops using enemy's specific drop types and weights
-                    if random.random() < enemy.drop_chance:
-                        drop_type = EnemyDrop.determine_drop_type(enemy.drop_types, enemy.drop_weights)
-                        drop = EnemyDrop(self.display, enemy.rect.center, drop_type, 2)
-                        self.drops.add(drop)
-                # Spawn floating damage number at enemy world position (rate-limited)
-                last_dn = getattr(enemy, 'last_damage_number_ms', 0)
-                if current_time - last_dn > 150:
-                    world_pos = (enemy.rect.centerx, enemy.rect.centery - 10)
-                    self.damage_numbers.spawn(dmg, world_pos)
-                    setattr(enemy, 'last_damage_number_ms', current_time)
+                self.damage_enemy(enemy, self.player.slash_attack.damage, current_time)
                 # Mark as hit for this slash
                 if getattr(self.player.slash_attack, 'mark_hit', None):
                     self.player.slash_attack.mark_hit(enemy)
 
     
 
+    def damage_enemy(self, enemy, dmg, current_time):
+        """Apply a hit: knockback from the player, drop roll on death, damage number."""
+        # Use player center for knockback anchor
+        if enemy.take_damage(dmg, hit_source_pos=self.player.rect.center):  # Enemy died
+            # Death is handled by enemy fade logic
+            self.kills += 1
+
+            # Create drops using enemy's specific drop types and weights
+            drop_type = self.drop_tables.roll(sample_rng, enemy.enemy_type, enemy.drop_chance)
+            if drop_type is not None:
+                drop = self.drop_pool.acquire(self.display, enemy.rect.center, drop_type, 2)
+                self.drops.add(drop)
+        # Knockback may have pushed the enemy into another hash cell
+        self.enemy_manager.refresh_enemy(enemy)
+        # Spawn floating damage number at enemy world position (rate-limited)
+        last_dn = getattr(enemy, 'last_damage_number_ms', 0)
+        if current_time - last_dn > 150:
+            world_pos = (enemy.rect.centerx, enemy.rect.centery - 10)
+            self.damage_numbers.spawn(dmg, world_pos)
+            setattr(enemy, 'last_damage_number_ms', current_time)
+
+    def check_weapon_collisions(self, current_time):
+        for weapon_sprite, dmg in self.weapons.get_hit_sprites():
+            for enemy in self.enemy_manager.collide(weapon_sprite):
+                self.damage_enemy(enemy, dmg, current_time)
+
     def check_drop_collisions(self):
+        # Frame dt from the run loop
+        dt = getattr(self, 'frame_dt', 0.016)
+        if self.drop_store is not None:
+            self._step_drop_store(dt)
+            return
         # Visual collect: trigger bounce then return; apply when ready
         drops_hit = pygame.sprite.spritecollide(self.player, self.drops, dokill=False, collided=pygame.sprite.collide_rect_ratio(0.5))
         for drop in drops_hit:
             drop.start_collect(self.player.rect.center)
 
-        # Update collect animations and apply when ready (use frame dt from run loop)
-        dt = getattr(self, 'frame_dt', 0.016)
+        # Update collect animations and apply when ready
         for drop in list(self.drops):
             if hasattr(drop, 'update_collect'):
                 drop.update_collect(self.player.rect, dt)
@@ -373,6 +453,21 @@ class Level:
                 if effect_fn:
                     effect_fn(drop)
                 drop.kill()
+                self.drop_pool.release(drop)
+
+    def _step_drop_store(self, dt):
+        # Same pickup flow as below, stepped for every drop at once
+        now = game_clock.get_ticks()
+        self.drop_store.collide_player(self.player.rect, now)
+        ready = self.drop_store.update(self.player.rect.center, dt, now)
+        # Remove all arrivals first so a magnet among them only pulls the rest
+        for drop in ready:
+            drop.kill()
+        for drop in ready:
+            effect_fn = self.drop_effects.get(drop.drop_type)
+            if effect_fn:
+                effect_fn(drop)
+            self.drop_pool.release(drop)
 
     # --- Drop effect handlers ---
     def _effect_health(self, drop):
@@ -383,6 +478,10 @@ class Level:
 
     def _effect_magnet(self, drop):
         # Immediate vacuum: force all current drops to return to player
+        if self.drop_store is not None:
+            self.drop_store.force_return(self.player.rect.center)
+            self.player.activate_magnet_power_up(5000)
+            return
         for d in self.drops:
             if d is drop:
                 # Applying this magnet drop itself; continue to other drops
@@ -395,116 +494,261 @@ class Level:
     def update_drops_magnetic_attraction(self):
         """Update all drops with magnetic attraction to player."""
         magnetic_radius = self.player.get_magnetic_radius()
+        if self.drop_store is not None:
+            self.drop_store.attract(self.player.rect.center, magnetic_radius, game_clock.get_ticks())
+            return
         for drop in self.drops:
             drop.update_magnetic_attraction(self.player.rect, magnetic_radius)
 
     def reset(self):
+        """Start a new run: player, enemies, drops, weapons, upgrades and timers.
+
+        Every run starts from the same state so a seed + inputs fully determine
+        it. Fonts, glyph atlases, sprites and object pools are kept.
+        """
         self.player.reset()
+        self.camera.reset()
         self.enemy_manager.reset()
         self.scoreboard.reset()
+        for drop in self.drops.sprites():
+            drop.kill()
+            self.drop_pool.release(drop)
+        self.drop_merger.reset()
+        self._frozen_key = None
+        self.xp_bar.reset()
+        # Real time not yet simulated (ms), and the camera before the last step
+        self.last_update = self.frame_clock.get_ticks()
+        self._accumulator = 0.0
+        self._prev_camera = (self.camera.offset_x, self.camera.offset_y)
+
+        # Level-up system
+        self.level_up_screen.reset()
+        self.player_previous_level = self.player.level
+
+        # Weapons system
+        self.weapons.reset()
+        # Track taken upgrade counts
+        self.taken_upgrades = {}
+        # Enemies killed this run (batch_sim.py reports kills/sec)
+        self.kills = 0
+        self.damage_numbers.reset()
+
+    def start_recording(self, seed=None):
+        """Seed the gameplay RNG, start a fresh run and record it; returns the recorder."""
+        from replay import ReplayRecorder
+        seed = game_random.seed(seed)
+        self.reset()
+        self.recorder = ReplayRecorder(seed, game_clock.get_ticks())
+        return self.recorder
+
+    def step(self, dt):
+        """Advance the simulation by `dt` seconds without drawing anything.
+
+        Reads time from game_clock, so a caller that owns the clock (headless
+        runs, replays) decides how fast simulated time passes.
+        """
+        current_time = game_clock.get_ticks()
+        self.frame_dt = dt
+        # The world is about to change; a frozen scene is stale from here on
+        self._frozen_key = None
+        self._prev_camera = (self.camera.offset_x, self.camera.offset_y)
+
+        # Top-level scopes match the benchmark's subsystems
+        with profiler.scope('move'):
+            self.update_player(dt)
+        with profiler.scope('spawn'):
+            self.update_spawning()
+        with profiler.scope('move'):
+            self.enemy_manager.update_enemies(self.player.rect.center, current_time, dt)
+            self.weapons.update(dt, current_time)
+        with profiler.scope('drops'):
+            # Update drops with magnetic attraction
+            with profiler.scope('drops.magnet'):
+                self.update_drops_magnetic_attraction()
+            with profiler.scope('drops.merge'):
+                self.drop_merger.update(current_time)
+        with profiler.scope('collision'):
+            self.update_collisions(current_time)
+        with profiler.scope('drops'):
+            with profiler.scope('check_drop_collisions'):
+                self.check_drop_collisions()
+        with profiler.scope('damage_numbers'):
+            self.damage_numbers.update(current_time)
+        self.scoreboard.update()
+
+        # Check for level up after XP update
+        self.check_level_up()
+
+    def update_player(self, dt):
+        self.camera.update()
+        self.player.update(dt)
+        self.player.update_magnet_power_up()  # Update magnet power-up timer
+
+    def update_spawning(self):
+        offset = (self.camera.offset_x, self.camera.offset_y)
+        self.enemy_manager.update_spawning(offset, self.player.level)
+
+    def update_collisions(self, current_time):
+        with profiler.scope('check_collisions'):
+            self.check_collisions()
+        with profiler.scope('check_slash_collisions'):
+            self.check_slash_collisions()
+        # Weapon collisions
+        with profiler.scope('check_weapon_collisions'):
+            self.check_weapon_collisions(current_time)
+
+    def render(self, alpha=1.0):
+        """Draw the world and HUD for the current simulation state.
+
+        alpha in [0, 1] is how far real time has run past the previous step
+        toward the current one; the camera and enemies are drawn in between.
+        """
+        world_offset = self.interpolated_offset(alpha)
+        with profiler.scope('draw'):
+            self.render_world(world_offset, alpha)
+        # Damage numbers go on the top world layer (world -> screen using camera offset)
+        with profiler.scope('damage_numbers'):
+            self.damage_numbers.draw(self.display, world_offset, self.render_queue)
+        with profiler.scope('draw'):
+            with profiler.scope('blits'):
+                self.render_queue.flush(self.display)
+            self.render_hud()
+
+    def interpolated_offset(self, alpha):
+        offset_x, offset_y = self.camera.offset_x, self.camera.offset_y
+        if alpha >= 1.0:
+            return offset_x, offset_y
+        prev_x, prev_y = self._prev_camera
+        return (round(prev_x + (offset_x - prev_x) * alpha),
+                round(prev_y + (offset_y - prev_y) * alpha))
+
+    def render_world(self, world_offset=None, alpha=1.0):
+        # Draws the background and queues the world sprites; render() flushes
+        # the queue. The camera follows the player, so the player and everything
+        # attached to it (weapons, slash) stay on the current offset; the rest
+        # of the world scrolls with the interpolated one
+        offset = (self.camera.offset_x, self.camera.offset_y)
+        if world_offset is None:
+            world_offset = offset
+        self.draw_background_with_offset(world_offset)
+        queue = self.render_queue
+        player = self.player
+        queue.add(LAYER_PLAYER, player.image, (player.rect.x - offset[0], player.rect.y - offset[1]))
+        self.enemy_manager.draw(self.display, world_offset, alpha, queue)
+        self.weapons.draw(self.display, offset, queue)
+        with profiler.scope('drops.draw'):
+            if self.drop_store is not None:
+                # Positions straight from the arrays, culled to the view
+                queue.extend(LAYER_DROPS, self.drop_store.draw_list(self.display.get_rect().move(world_offset)))
+            else:
+                world_x, world_y = world_offset
+                queue.extend(LAYER_DROPS, [(drop.image, (drop.rect.x - world_x, drop.rect.y - world_y))
+                                           for drop in self.drops])
+        slash = player.slash_attack
+        if slash.active:
+            queue.add(LAYER_SLASH, slash.image, (slash.rect.x - offset[0], slash.rect.y - offset[1]))
+
+    def render_frozen(self):
+        """Draw the scene while gameplay is stopped (level-up overlay).
+
+        Nothing moves between steps, so the scene is rendered once and left
+        on the display for as long as the camera has not moved. Returns True
+        when it was drawn again.
+        """
+        key = (self.camera.offset_x, self.camera.offset_y)
+        if key == self._frozen_key:
+            return False
+        self.render()
+        self._frozen_key = key
+        return True
+
+    def render_level_up(self):
+        """Frozen scene plus level-up overlay; returns the changed rects (None = full frame).
+
+        After the first frame the overlay only repaints its window and the
+        falling drops, so neither the scene nor the dimming is drawn again.
+        """
+        if self.render_frozen():
+            self.level_up_screen.invalidate()
+        return self.level_up_screen.draw()
+
+    def render_hud(self):
+        offset = (self.camera.offset_x, self.camera.offset_y)
+        self.health_bar.update(offset)
+        self.xp_bar.update(self.player.current_xp, self.player.xp_to_next_level)
+        self.scoreboard.draw_score()
+
+    def invalidate(self):
+        """Scene (re)entered: time spent in other scenes is not simulated."""
+        self.last_update = self.frame_clock.get_ticks()
+        self._accumulator = 0.0
+        # Other scenes drew over the display; a frozen scene must be drawn again
+        self._frozen_key = None
+
+    def advance(self, frame_ms):
+        """Run as many fixed SIM_STEP steps as `frame_ms` of real time covers.
+
+        The remainder carries over to the next frame. Returns the render alpha.
+        """
+        step_ms = SIM_STEP * 1000.0
+        self._accumulator += min(frame_ms, SIM_MAX_FRAME * 1000.0)
+        while self._accumulator >= step_ms:
+            self._accumulator -= step_ms
+            self.sim_clock.advance(step_ms)
+            if self.recorder is not None:
+                self.recorder.record_tick(self.sim_clock.get_ticks(), self.player.read_input())
+            self.step(SIM_STEP)
+            if self.level_up_screen.is_active:
+                # Gameplay freezes behind the overlay; the rest of this frame is dropped
+                self._accumulator = 0.0
+                return 1.0
+        return self._accumulator / step_ms
 
     def run(self, events):
+        """Run one frame; returns the display rects it changed (None = full frame)."""
         self.handle_events(events)
-        now = pygame.time.get_ticks()
-        dt = (now - self.last_update) / 1000.0  # Convert milliseconds to seconds for dt
+        now = self.frame_clock.get_ticks()
+        frame_ms = now - self.last_update
         self.last_update = now
-        self.frame_dt = dt
-        current_time = now  # Use current_time for updates that don't need dt
 
         # Handle level-up screen events first
         self.handle_level_up_events(events)
 
+        # Gameplay scrolls the whole screen; menus over a frozen frame report less
+        dirty = None
         if not self.pause_menu.is_paused and not self.level_up_screen.is_active:
             # Begin perf timing for this frame
             try:
                 self.perf.start_frame()
             except Exception:
                 pass
-            self.camera.update()
-            self.player.update(dt)
-            self.player.update_magnet_power_up()  # Update magnet power-up timer
-
-            self.draw_background_with_offset((self.camera.offset_x, self.camera.offset_y))
-
-            offset = (self.camera.offset_x, self.camera.offset_y)
-
-            self.display.blit(self.player.image, self.player.rect.topleft - pygame.math.Vector2(offset))
-            
-            self.enemy_manager.update(self.player.rect.center, (self.camera.offset_x, self.camera.offset_y), current_time, self.player.level)
-
-            # Weapons update/draw
-            self.weapons.update(dt, current_time)
-            self.weapons.draw(self.display, offset)
-
-            # Update drops with magnetic attraction
-            self.update_drops_magnetic_attraction()
-            
-            for drop in self.drops:
-                drop.draw(self.display, offset)
-
-            if self.player.slash_attack.active:
-                self.player.slash_attack.draw(self.display, offset)
-            # Draw damage numbers last (world -> screen using camera offset)
-            self.damage_numbers.draw(self.display, (self.camera.offset_x, self.camera.offset_y))
-
-            self.check_collisions()
-            self.check_slash_collisions()
-            # Weapon collisions
-            for weapon_sprite, dmg in self.weapons.get_hit_sprites():
-                hits = pygame.sprite.spritecollide(weapon_sprite, self.enemy_manager.enemy_list, dokill=False)
-                for enemy in hits:
-                    # Use player center for knockback anchor
-                    if enemy.take_damage(dmg, hit_source_pos=self.player.rect.center):
-                        # Do not kill immediately, start death fade handled by enemy
-                        if random.random() < enemy.drop_chance:
-                            drop_type = EnemyDrop.determine_drop_type(enemy.drop_types, enemy.drop_weights)
-                            drop = EnemyDrop(self.display, enemy.rect.center, drop_type, 2)
-                            self.drops.add(drop)
-                    # Damage number for weapon hit (rate-limited)
-                    last_dn = getattr(enemy, 'last_damage_number_ms', 0)
-                    if current_time - last_dn > 150:
-                        world_pos = (enemy.rect.centerx, enemy.rect.centery - 10)
-                        self.damage_numbers.spawn(dmg, world_pos)
-                        setattr(enemy, 'last_damage_number_ms', current_time)
-            self.check_drop_collisions()
-            # Overlay updates
-            self.damage_numbers.update(current_time)
-            self.scoreboard.update()
-            self.health_bar.update(offset)
-            self.xp_bar.update(self.player.current_xp, self.player.xp_to_next_level)
-            
-            # Check for level up after XP update
-            self.check_level_up()
-            # Finalize perf timing and draw overlay on top
+            alpha = self.advance(frame_ms)
             try:
                 self.perf.mark_update_end()
+            except Exception:
+                pass
+            self.render(alpha)
+            # Finalize perf timing and draw overlay on top
+            try:
                 self.perf.end_frame()
-                self.perf.draw(len(self.enemy_manager.enemy_list), len(self.drops), len(self.damage_numbers.items))
+                self.perf.draw(len(self.enemy_manager.enemy_list), len(self.drops), len(self.damage_numbers.items),
+                               (self.enemy_manager.enemy_pool, self.drop_pool, self.damage_numbers.pool,
+                                self.drop_merger, self.enemy_manager.spawn_scheduler, text_cache))
             except Exception:
                 pass
 
         elif self.pause_menu.is_paused:
             self.pause_menu.update(events)
-            self.pause_menu.draw()
+            dirty = self.pause_menu.draw()
         elif self.level_up_screen.is_active:
             # Draw the current scene without updating gameplay so overlay shows the game behind
-            self.draw_background_with_offset((self.camera.offset_x, self.camera.offset_y))
-            offset = (self.camera.offset_x, self.camera.offset_y)
-            self.display.blit(self.player.image, self.player.rect.topleft - pygame.math.Vector2(offset))
-            self.enemy_manager.draw(self.display, offset)
-            for drop in self.drops:
-                drop.draw(self.display, offset)
-            if self.player.slash_attack.active:
-                self.player.slash_attack.draw(self.display, offset)
-            # Keep numbers visible during overlay (use camera offset)
-            self.damage_numbers.draw(self.display, (self.camera.offset_x, self.camera.offset_y))
-            self.health_bar.update(offset)
-            self.xp_bar.update(self.player.current_xp, self.player.xp_to_next_level)
-            try:
-                self.scoreboard.draw_score()
-            except Exception:
-                pass
-        
-        # Always draw level-up screen if active (on top of everything)
+            return self.render_level_up()
+
+        # Level-up opened this frame, or shown over the pause menu: draw it on
+        # top of everything, and the frozen scene again once it is alone
         if self.level_up_screen.is_active:
-            self.level_up_screen.draw()
\ No newline at end of file
+            self._frozen_key = None
+            self.level_up_screen.invalidate()
+            self.level_up_screen.draw()
+            dirty = None
+        return dirty
@@ -1,10 +1,14 @@
 import pygame
 from settings import *
+from assets import assets
+from text_cache import text_cache
 
 
 class LevelUpScreen:
-    def __init__(self, display):
+    def __init__(self, display, particles=True):
         self.display = display
+        # Exp rain is purely visual; headless levels switch it off
+        self.particles = particles
         self.is_active = False
         self.upgrade_choices = []
         self.selected_choice = None
@@ -48,11 +52,27 @@ class LevelUpScreen:
         self.confirm_button_color = (60, 120, 60)
         self.confirm_button_hover_color = (80, 160, 80)
 
-        # Local icon cache
-        self._icon_cache = {}
         # Particles
         self._exp_rain = None
+        self._rain_rects = []  # drops drawn last frame; erased (repainted) this frame
         self._last_tick = pygame.time.get_ticks()
+        # The dimmed scene behind the window, captured on the first frame and
+        # painted back under moving drops afterwards (see invalidate)
+        self._backdrop = None
+        self._backdrop_valid = False
+
+    def invalidate(self):
+        """The display under the overlay was redrawn: dim and capture it again next draw."""
+        self._backdrop_valid = False
+
+    def reset(self):
+        """Hide the screen and drop any rain (fonts are kept)."""
+        self.is_active = False
+        self.upgrade_choices = []
+        self.selected_choice = None
+        self._exp_rain = None
+        self._rain_rects = []
+        self._backdrop_valid = False
 
     def show_upgrades(self, upgrade_choices):
         """Show the level-up screen with up to 3 vertical cards."""
@@ -60,7 +80,11 @@ class LevelUpScreen:
         self.upgrade_choices = upgrade_choices[:3]
         self.selected_choice = 0 if self.upgrade_choices else None
         self._rebuild_choice_rects()
+        # First frame of the overlay repaints the whole screen
+        self._backdrop_valid = False
         # Start exp rain effect
+        if not self.particles:
+            return
         self._last_tick = pygame.time.get_ticks()
         self._exp_rain = ExpRain(self.display, initial_count=320, max_count=520,
                                   spawn_rate_per_sec=140, sprite_path='emerald.png',
@@ -76,30 +100,13 @@ class LevelUpScreen:
             self.choice_rects.append(rect)
 
     def _wrap_text(self, text, max_width, font):
-        words = text.split()
-        lines = []
-        current = ""
-        for w in words:
-            test = (current + " " + w).strip()
-            if font.size(test)[0] <= max_width:
-                current = test
-            else:
-                if current:
-                    lines.append(current)
-                current = w
-        if current:
-            lines.append(current)
-        return lines[:3]
+        return text_cache.wrap(font, text, max_width, max_lines=3)
 
     def _load_icon(self, path):
-        surf = self._icon_cache.get(path)
-        if surf is None:
-            try:
-                surf = pygame.image.load(path).convert_alpha()
-            except Exception:
-                surf = pygame.image.load('emerald.png').convert_alpha()
-            self._icon_cache[path] = surf
-        return surf
+        try:
+            return assets.image(path)
+        except (FileNotFoundError, pygame.error):
+            return assets.image('emerald.png')
 
     def _icon_for_choice(self, choice):
         # Placeholder mapping; default to emerald
@@ -157,27 +164,41 @@ class LevelUpScreen:
             self.selected_choice = None
             # Stop particles
             self._exp_rain = None
+            self._rain_rects = []
             return selected_upgrade
         return None
 
     def draw(self):
+        """Draw the overlay; returns the changed rects (None for a full frame)."""
         if not self.is_active:
-            return
-
-        # Dim overlay
-        overlay = pygame.Surface((DISPLAY_WIDTH, DISPLAY_HEIGHT))
-        overlay.set_alpha(self.overlay_color[3])
-        overlay.fill((self.overlay_color[0], self.overlay_color[1], self.overlay_color[2]))
-        self.display.blit(overlay, (0, 0))
+            return []
+
+        full_frame = not self._backdrop_valid
+        if full_frame:
+            # Dim overlay, once per scene
+            overlay = pygame.Surface((DISPLAY_WIDTH, DISPLAY_HEIGHT))
+            overlay.set_alpha(self.overlay_color[3])
+            overlay.fill((self.overlay_color[0], self.overlay_color[1], self.overlay_color[2]))
+            self.display.blit(overlay, (0, 0))
+            if self._backdrop is None or self._backdrop.get_size() != self.display.get_size():
+                self._backdrop = self.display.copy()
+            else:
+                self._backdrop.blit(self.display, (0, 0))
+            self._backdrop_valid = True
+        else:
+            # Erase last frame's drops; the window is redrawn over its own area
+            backdrop = self._backdrop
+            self.display.blits([(backdrop, rect, rect) for rect in self._rain_rects], doreturn=False)
 
         # Update and draw particle rain (above overlay, behind window)
         now = pygame.time.get_ticks()
         dt = max(0.0, (now - self._last_tick) / 1000.0)
         dt = min(dt, 0.05)
         self._last_tick = now
+        rain_rects = []
         if self._exp_rain:
             self._exp_rain.update(dt)
-            self._exp_rain.draw(self.display)
+            rain_rects = self._exp_rain.draw(self.display)
 
         # Window
         window_rect = pygame.Rect(self.window_x, self.window_y, self.window_width, self.window_height)
@@ -185,7 +206,7 @@ class LevelUpScreen:
         pygame.draw.rect(self.display, self.window_border_color, window_rect, 4)
 
         # Title
-        title_text = self.title_font.render("LEVEL UP!", True, self.accent_text_color)
+        title_text = text_cache.render(self.title_font, "LEVEL UP!", True, self.accent_text_color)
         title_rect = title_text.get_rect(center=(self.window_x + self.window_width // 2, self.window_y + 40))
         self.display.blit(title_text, title_rect)
 
@@ -208,18 +229,18 @@ class LevelUpScreen:
             name = str(choice.get('name', 'Upgrade'))
             # Build description directly from upgrade data (name + effect/value)
             desc = str(choice.get('description', ''))
-            name_surf = self.name_font.render(name, True, self.accent_text_color)
+            name_surf = text_cache.render(self.name_font, name, True, self.accent_text_color)
             self.display.blit(name_surf, (icon_x + self.icon_size + 14, rect.y + 14))
 
             # Wrap description
             max_desc_w = rect.width - (self.icon_pad * 2 + self.icon_size + 14)
             lines = self._wrap_text(desc, max_desc_w, self.desc_font)
             for li, line in enumerate(lines):
-                line_surf = self.desc_font.render(line, True, self.text_color)
+                line_surf = text_cache.render(self.desc_font, line, True, self.text_color)
                 self.display.blit(line_surf, (icon_x + self.icon_size + 14, rect.y + 44 + li * 22))
 
             # Key indicator (1..3)
-            key_surf = self.desc_font.render(str(i + 1), True, self.key_text_color)
+            key_surf = text_cache.render(self.desc_font, str(i + 1), True, self.key_text_color)
             self.display.blit(key_surf, (rect.right - 24, rect.y + 10))
 
         # Confirm button
@@ -229,10 +250,18 @@ class LevelUpScreen:
         btn_color = self.confirm_button_hover_color if (confirm_rect.collidepoint(mouse_pos) and self.selected_choice is not None) else self.confirm_button_color
         pygame.draw.rect(self.display, btn_color, confirm_rect)
         pygame.draw.rect(self.display, self.window_border_color, confirm_rect, 2)
-        confirm_text = self.name_font.render("Confirm", True, self.text_color)
+        confirm_text = text_cache.render(self.name_font, "Confirm", True, self.text_color)
         self.display.blit(confirm_text, confirm_rect.move((confirm_rect.width - confirm_text.get_width()) // 2,
                                                          (confirm_rect.height - confirm_text.get_height()) // 2).topleft)
 
+        # Over a frozen scene only the window and the drops (where they were
+        # and where they are now) change
+        dirty = [window_rect] + self._rain_rects + rain_rects
+        self._rain_rects = rain_rects
+        if full_frame:
+            return None
+        return dirty
+
 
 # --- Level Up Particle Effect: Exp Rain ---
 class ExpRain:
@@ -263,9 +292,9 @@ class ExpRain:
 
     def _load_sprite(self, path):
         try:
-            return pygame.image.load(path).convert_alpha()
-        except Exception:
-            return pygame.image.load('emerald.png').convert_alpha()
+            return assets.image(path)
+        except (FileNotFoundError, pygame.error):
+            return assets.image('emerald.png')
 
     def _spawn_one(self, random_x=False, random_y_above=False):
         import random
@@ -301,9 +330,11 @@ class ExpRain:
         self.particles = alive
 
     def draw(self, surface):
-        # Draw with precomputed scaled surfaces, no per-frame transforms
-        for x, y, vy, sidx, shrink in self.particles:
-            idx = int(sidx)
-            idx = max(0, min(idx, len(self._scaled_surfaces) - 1))
-            img = self._scaled_surfaces[idx]
-            surface.blit(img, (int(x), int(y)))
+        """Draw every drop; returns the on-screen rects drawn."""
+        # Precomputed scaled surfaces, no per-frame transforms, one blits call
+        surfaces = self._scaled_surfaces
+        last = len(surfaces) - 1
+        rects = surface.blits([(surfaces[max(0, min(int(sidx), last))], (int(x), int(y)))
+                               for x, y, vy, sidx, shrink in self.particles])
+        # Drops still above the screen clip to nothing
+        return [rect for rect in rects if rect.height]
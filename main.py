@@ -1,22 +1,83 @@
+from startup_trace import trace
 import pygame, sys
 from settings import *
 from game_state_manager import GameStateManager
 from main_menu import MainMenu
-from level import Level
+from assets import assets
 
 class Main:
-    def __init__(self):
+    def __init__(self, record_path=None, asset_report=False, startup_report=False):
         pygame.init()
         self.display_surface = pygame.display.set_mode((DISPLAY_WIDTH, DISPLAY_HEIGHT))
         self.clock = pygame.time.Clock()
         self.refresh_rate = pygame.display.get_current_refresh_rate()
         self.target_fps = self.refresh_rate
+        trace.mark('display')
 
-        # Initialize scenes objects
+        # Images decode on a thread while the menu is up (see _warm_up)
+        self.asset_report = asset_report
+        self.startup_report = startup_report
+        self._assets_pending = False
+        if ASSET_PRELOAD:
+            assets.preload(background=ASSET_PRELOAD_BACKGROUND)
+            self._assets_pending = ASSET_PRELOAD_BACKGROUND
+            if not self._assets_pending:
+                self._report_assets()
+
+        # Only the menu is built up front; other scenes are built on first
+        # use, or ahead of time while the menu is idle, and then kept
         self.game_state_manager = GameStateManager('main_menu')
         self.main_menu = MainMenu(self.display_surface, self.game_state_manager)
-        self.level = Level(self.display_surface, self.game_state_manager, self.clock)
-        self.states = {'main_menu': self.main_menu, 'level': self.level}
+        self.states = {'main_menu': self.main_menu}
+        self._scene_factories = {'level': self._build_level}
+        self._warm_up_steps = self._warm_up()
+        trace.mark('menu_built')
+
+        # Optional replay log of each run (see replay.py)
+        self.record_path = record_path
+
+        # Scene shown last frame; a newly shown scene always pushes a full frame
+        self._last_state = None
+
+    def _build_level(self):
+        from level import Level
+        level = Level(self.display_surface, self.game_state_manager, self.clock)
+        trace.mark('level_built')
+        return level
+
+    def scene(self, state):
+        """The scene for `state`, built on first use."""
+        scene = self.states.get(state)
+        if scene is None:
+            scene = self.states[state] = self._scene_factories[state]()
+        return scene
+
+    @property
+    def level(self):
+        return self.scene('level')
+
+    def _warm_up(self):
+        # One step per idle menu frame: finish converting the preloaded
+        # images once their decode thread is done, then build the level
+        while self._assets_pending and not assets.ready():
+            yield
+        if self._assets_pending:
+            assets.finish_preload()
+            self._assets_pending = False
+            self._report_assets()
+            yield
+        self.scene('level')
+
+    def _report_assets(self):
+        trace.mark('assets_ready')
+        if self.asset_report:
+            print('\n'.join(assets.report()))
+
+    def save_replay(self):
+        level = self.states.get('level')
+        if self.record_path and level is not None and level.recorder is not None:
+            level.recorder.save(self.record_path, level)
+            level.recorder = None
 
     def handle_events(self, events):
         for event in events:
@@ -27,6 +88,12 @@ class Main:
                 pass
 
     def run(self):
+        try:
+            self._loop()
+        finally:
+            self.save_replay()
+
+    def _loop(self):
         while True:
             # System
             self.clock.tick(self.target_fps)
@@ -37,13 +104,45 @@ class Main:
 
             # Check for reset request before state handle
             if self.game_state_manager.is_reset_requested():
-                self.level.reset()
+                trace.mark('run_requested')
+                if self.record_path:
+                    self.save_replay()
+                    self.level.start_recording()
+                else:
+                    self.level.reset()
                 self.game_state_manager.clear_reset_request()
 
-            # State handle
-            self.states[self.game_state_manager.get_state()].run(events)
+            # State handle: scenes return the rects they changed, or None for a full frame
+            state = self.game_state_manager.get_state()
+            scene = self.scene(state)
+            entered = state != self._last_state
+            if entered:
+                invalidate = getattr(scene, 'invalidate', None)
+                if invalidate is not None:
+                    invalidate()
+            dirty = scene.run(events)
+            self._last_state = state
+
+            if dirty is None or entered:
+                pygame.display.update()
+            elif dirty:
+                pygame.display.update(dirty)
 
-            pygame.display.update()
+            trace.mark('first_frame')
+            if state == 'main_menu':
+                # The menu is mostly idle: spend it warming up the next scene
+                next(self._warm_up_steps, None)
+            elif 'first_gameplay_frame' not in trace.marks:
+                trace.mark('first_gameplay_frame')
+                if self.startup_report:
+                    print('\n'.join(trace.report()))
 
 if __name__ == '__main__':
-    Main().run()
\ No newline at end of file
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--record', metavar='PATH', help='record each run to a replay log (see replay.py)')
+    parser.add_argument('--asset-report', action='store_true', help='print per-asset load time and memory')
+    parser.add_argument('--startup-trace', action='store_true',
+                        help='print time to first frame and first gameplay frame')
+    args = parser.parse_args()
+    Main(record_path=args.record, asset_report=args.asset_report, startup_report=args.startup_trace).run()
\ No newline at end of file
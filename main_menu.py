@@ -1,13 +1,17 @@
 import pygame, sys
 from settings import *
 from button import Button
+from assets import assets
 
 class MainMenu:
     def __init__(self, display, game_state_manager):
         self.display = display
         self.game_state_manager = game_state_manager
-        self.image = pygame.image.load('main_menu_bg.jpg')
+        self.image = assets.image('main_menu_bg.jpg')
         self.image = pygame.transform.scale(self.image, (DISPLAY_WIDTH, DISPLAY_HEIGHT))
+        # The menu is static: paint it fully once, then only buttons whose hover changes
+        self._needs_full_redraw = True
+        self._hovered = []
 
         # Button specifications
         button_width, button_height = 200, 50
@@ -23,6 +27,10 @@ class MainMenu:
             Button(button_x, quit_button_y, button_width, button_height, (255, 0, 0), "Quit", (255, 255, 255), self.quit_game)
         ]
 
+    def invalidate(self):
+        """Repaint the whole menu on the next frame (e.g. after coming back from a run)."""
+        self._needs_full_redraw = True
+
     def start_game(self):
         self.game_state_manager.set_state('reset_level')
 
@@ -42,7 +50,24 @@ class MainMenu:
                 button.update(events)
 
     def run(self, events):
-        self.display.blit(self.image, (0, 0))
+        """Handle input and draw; returns the changed rects (None for a full frame)."""
         self.handle_events(events)
-        for button in self.buttons:
-            button.draw(self.display)
+        mouse_pos = pygame.mouse.get_pos()
+        hovered = [button.is_over(mouse_pos) for button in self.buttons]
+
+        if self._needs_full_redraw:
+            self.display.blit(self.image, (0, 0))
+            for button in self.buttons:
+                button.draw(self.display)
+            self._needs_full_redraw = False
+            self._hovered = hovered
+            return None
+
+        dirty = []
+        for button, hover, was_hovered in zip(self.buttons, hovered, self._hovered):
+            if hover != was_hovered:
+                self.display.blit(self.image, button.rect, button.rect)
+                button.draw(self.display)
+                dirty.append(button.rect)
+        self._hovered = hovered
+        return dirty
@@ -3,10 +3,16 @@ from settings import *
 import pygame
 
 class PauseMenu:
+    # The translucent panel is stacked once per frame over the frozen game, so
+    # it fades in; after this many frames it is within 1/255 of solid.
+    FADE_FRAMES = 80
+
     def __init__(self, display, game_state_manager):
         # Initialize pause menu components (buttons, backgrounds, etc.)
         self.display = display
         self.game_manager = game_state_manager
+        self._frames_shown = 0
+        self._hovered = []
         self.is_paused = False
 
         # Button specifications
@@ -26,6 +32,19 @@ class PauseMenu:
         self.margin_y = DISPLAY_HEIGHT // 4
         self.pause_surface = pygame.Surface((self.margin_x * 2, self.margin_y * 2))
         self.pause_surface.set_alpha(20)
+        self.pause_surface.fill('gray25')
+        self.panel_rect = self.pause_surface.get_rect(topleft=(self.margin_x, self.margin_y))
+
+    @property
+    def is_paused(self):
+        return self._is_paused
+
+    @is_paused.setter
+    def is_paused(self, paused):
+        if paused:
+            # Opening (or re-opening) the menu restarts the fade-in
+            self._frames_shown = 0
+        self._is_paused = paused
 
     def resume_game(self):
         self.is_paused = not self.is_paused
@@ -41,9 +60,25 @@ class PauseMenu:
             button.update(events)
 
     def draw(self):
-        # Draw pause menu and its components
-        for button in self.buttons:
-            button.draw(self.display)
+        """Draw pause menu and its components; returns the rects that changed."""
+        mouse_pos = pygame.mouse.get_pos()
+        hovered = [button.is_over(mouse_pos) for button in self.buttons]
 
-        self.pause_surface.fill('gray25')
-        self.display.blit(self.pause_surface, (self.margin_x, self.margin_y))
\ No newline at end of file
+        if self._frames_shown < self.FADE_FRAMES:
+            self._frames_shown += 1
+            for button in self.buttons:
+                button.draw(self.display)
+            self.display.blit(self.pause_surface, self.panel_rect)
+            self._hovered = hovered
+            return [self.panel_rect]
+
+        # Faded in: the frame is static apart from buttons changing hover state
+        dirty = []
+        for button, hover, was_hovered in zip(self.buttons, hovered, self._hovered):
+            if hover != was_hovered:
+                button.draw(self.display)
+                self.display.blit(self.pause_surface, button.rect,
+                                  button.rect.move(-self.margin_x, -self.margin_y))
+                dirty.append(button.rect)
+        self._hovered = hovered
+        return dirty
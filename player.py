@@ -1,14 +1,23 @@
 import pygame
+import game_clock
 from settings import *
 from animation import Animation
+import animation_cache
 from slash_attack import SlashAttack
 
 
+# Movement input bits (see Player.read_input)
+INPUT_LEFT = 1
+INPUT_RIGHT = 2
+INPUT_UP = 4
+INPUT_DOWN = 8
+
+
 class Player(pygame.sprite.Sprite):
     def __init__(self, display):
         super().__init__()
         self.display = display
-        self.sprite_sheet = pygame.image.load('Player_Sprite_Sheet2.png').convert_alpha()
+        self.sprite_sheet = animation_cache.load_sheet('Player_Sprite_Sheet2.png')
         self.scale = 2
 
         animations = {
@@ -20,6 +29,14 @@ class Player(pygame.sprite.Sprite):
                                         sprite_sheet_path='slash_anim.png',
                                         frame_dimensions=(50, 37), num_frames=4, scale=2)
 
+        # Scripted movement (headless runs, replays); None reads the keyboard
+        self.input_override = None
+        self.reset()
+
+    def reset(self):
+        """Start stats, position and animation of a new run (sprites are kept)."""
+        self.animation.reset()
+        self.slash_attack.reset()
         # Initially set to 'idle' animation
         self.animation.set_animation('idle')
         self.image = self.animation.get_current_frame()
@@ -51,26 +68,42 @@ class Player(pygame.sprite.Sprite):
         self.magnet_power_up_duration = 0
         self.magnet_power_up_timer = 0
 
-    def move(self, dt):
+    def read_input(self):
+        """Current movement input as a bitmask of INPUT_* flags."""
+        if self.input_override is not None:
+            return self.input_override
         keys = pygame.key.get_pressed()
+        mask = 0
+        if keys[pygame.K_LEFT]:
+            mask |= INPUT_LEFT
+        if keys[pygame.K_RIGHT]:
+            mask |= INPUT_RIGHT
+        if keys[pygame.K_UP]:
+            mask |= INPUT_UP
+        if keys[pygame.K_DOWN]:
+            mask |= INPUT_DOWN
+        return mask
+
+    def move(self, dt):
+        mask = self.read_input()
         # Determine animation based on input
 
-        if keys[pygame.K_RIGHT] or keys[pygame.K_LEFT] or keys[pygame.K_UP] or keys[pygame.K_DOWN]:
+        if mask:
             self.animation.set_animation('run')
         else:
             self.animation.set_animation('idle')
 
         dx, dy = 0.0, 0.0
         pixels = self.speed * dt
-        if keys[pygame.K_RIGHT]:
+        if mask & INPUT_RIGHT:
             dx += pixels
             self.facing_right = True
-        if keys[pygame.K_LEFT]:
+        if mask & INPUT_LEFT:
             dx -= pixels
             self.facing_right = False
-        if keys[pygame.K_UP]:
+        if mask & INPUT_UP:
             dy -= pixels
-        if keys[pygame.K_DOWN]:
+        if mask & INPUT_DOWN:
             dy += pixels
 
         diagonal_movement = dx != 0 and dy != 0
@@ -115,13 +148,8 @@ class Player(pygame.sprite.Sprite):
     #
     #     self.slash_attack.draw(self.display)
 
-    def reset(self):
-        self.rect.center = DISPLAY_CENTER
-        self.position = pygame.math.Vector2(self.rect.center)
-        self.current_health = self.max_health
-
     def update(self, dt):
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.get_ticks()
 
         if current_time - self.last_slash > self.slash_cooldown:
             self.last_slash = current_time
@@ -129,9 +157,7 @@ class Player(pygame.sprite.Sprite):
 
         self.slash_attack.update()
         self.animation.update()
-        self.image = self.animation.get_current_frame()
-        if not self.facing_right:
-            self.image = pygame.transform.flip(self.image, True, False)
+        self.image = self.animation.get_current_frame(flip=not self.facing_right)
         self.rect = self.image.get_rect(center=self.rect.center)
         self.move(dt)
 
@@ -145,11 +171,11 @@ class Player(pygame.sprite.Sprite):
         """Activate magnet power-up for specified duration (in milliseconds)."""
         self.magnet_power_up_active = True
         self.magnet_power_up_duration = duration
-        self.magnet_power_up_timer = pygame.time.get_ticks()
+        self.magnet_power_up_timer = game_clock.get_ticks()
 
     def update_magnet_power_up(self):
         """Update magnet power-up timer."""
         if self.magnet_power_up_active:
-            current_time = pygame.time.get_ticks()
+            current_time = game_clock.get_ticks()
             if current_time - self.magnet_power_up_timer > self.magnet_power_up_duration:
                 self.magnet_power_up_active = False
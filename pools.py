@@ -0,0 +1,49 @@
+# Free lists for short-lived gameplay objects (enemies, drops, damage numbers).
+#
+# Pooled classes expose reset(*args) taking the same arguments as their
+# constructor; acquire() reuses a released instance through reset() and only
+# builds a new one when the free list is empty.
+
+
+class ObjectPool:
+    def __init__(self, name, factory, capacity=256):
+        self.name = name
+        self.factory = factory
+        self.capacity = capacity  # max released instances kept for reuse
+        self._free = []
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+
+    def acquire(self, *args):
+        if self._free:
+            obj = self._free.pop()
+            obj.reset(*args)
+            self.reused += 1
+            return obj
+        self.created += 1
+        return self.factory(*args)
+
+    def release(self, obj):
+        """Hand back an instance nobody references any more."""
+        if len(self._free) < self.capacity:
+            self._free.append(obj)
+        else:
+            self.discarded += 1
+
+    def release_all(self, objs):
+        for obj in objs:
+            self.release(obj)
+
+    @property
+    def free(self):
+        return len(self._free)
+
+    @property
+    def reuse_ratio(self):
+        total = self.created + self.reused
+        return self.reused / total if total else 0.0
+
+    def stats_line(self):
+        return (f"pool {self.name}: reuse {self.reuse_ratio * 100:.0f}% "
+                f"(new {self.created}, reused {self.reused}) free {self.free}")
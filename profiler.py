@@ -0,0 +1,155 @@
+import csv
+import json
+import time
+from collections import deque
+
+# Named, nestable timing scopes for the hot path.
+#
+#     from profiler import profiler
+#     with profiler.scope('enemies.move'):
+#         ...
+#
+# Nested scopes are reported by path ('move/enemies.move'). While the profiler
+# is disabled scope() hands back a shared no-op context, so instrumented code
+# costs one attribute check per scope.
+
+_perf_counter = time.perf_counter
+
+
+class _NullScope:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SCOPE = _NullScope()
+
+
+class _Scope:
+    __slots__ = ('profiler', 'name', 'path', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        stack = self.profiler._stack
+        self.path = stack[-1] + '/' + self.name if stack else self.name
+        stack.append(self.path)
+        self.start = _perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = _perf_counter()
+        profiler = self.profiler
+        profiler._stack.pop()
+        profiler._record(self.path, self.start, end)
+        return False
+
+
+class Profiler:
+    def __init__(self, history_frames=120, max_events=50000):
+        self.enabled = False
+        self.history_frames = history_frames
+        self._stack = []
+        self._frame = {}       # path -> ms accumulated in the current frame
+        self._order = {}       # path -> first-seen index
+        self.history = {}      # path -> deque of per-frame ms
+        self.last_frame = {}
+        self.frame_count = 0
+        # Raw (path, start_s, end_s) spans for Chrome trace dumps
+        self.events = deque(maxlen=max_events)
+
+    def scope(self, name):
+        if not self.enabled:
+            return _NULL_SCOPE
+        return _Scope(self, name)
+
+    def set_enabled(self, enabled):
+        self.enabled = enabled
+        self._stack.clear()
+        self._frame = {}
+
+    def _record(self, path, start, end):
+        ms = (end - start) * 1000.0
+        frame = self._frame
+        if path in frame:
+            frame[path] += ms
+        else:
+            frame[path] = ms
+            if path not in self.history:
+                self.history[path] = deque(maxlen=self.history_frames)
+                self._order[path] = len(self._order)
+        self.events.append((path, start, end))
+
+    def end_frame(self):
+        """Close the current frame; returns its {path: ms} totals."""
+        if not self.enabled:
+            return {}
+        frame = self._frame
+        for path, samples in self.history.items():
+            samples.append(frame.get(path, 0.0))
+        self.last_frame = frame
+        self._frame = {}
+        self.frame_count += 1
+        return frame
+
+    def reset(self):
+        self._frame = {}
+        self._order = {}
+        self.history = {}
+        self.last_frame = {}
+        self.frame_count = 0
+        self.events.clear()
+
+    def breakdown(self):
+        """Rolling per-scope stats as (path, depth, avg_ms, max_ms), parents before children."""
+        rows = []
+        for path in sorted(self._order, key=self._sort_key):
+            samples = self.history[path]
+            if not samples:
+                continue
+            rows.append((path, path.count('/'), sum(samples) / len(samples), max(samples)))
+        return rows
+
+    def _sort_key(self, path):
+        # Group children under their parent, keep first-seen order otherwise
+        parts = path.split('/')
+        return [self._order.get('/'.join(parts[:i + 1]), 0) for i in range(len(parts))]
+
+    def dump_csv(self, path):
+        """Write the rolling per-frame history (one row per frame, one column per scope)."""
+        columns = sorted(self._order, key=self._sort_key)
+        frames = max((len(self.history[c]) for c in columns), default=0)
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['frame'] + columns)
+            for i in range(frames):
+                row = [i]
+                for c in columns:
+                    samples = self.history[c]
+                    offset = frames - len(samples)
+                    row.append(f"{samples[i - offset]:.4f}" if i >= offset else '')
+                writer.writerow(row)
+
+    def dump_chrome_trace(self, path):
+        """Write recorded spans as Chrome trace JSON (chrome://tracing, Perfetto)."""
+        trace = [{
+            'name': span_path.rsplit('/', 1)[-1],
+            'cat': span_path,
+            'ph': 'X',
+            'ts': start * 1e6,
+            'dur': (end - start) * 1e6,
+            'pid': 0,
+            'tid': 0,
+        } for span_path, start, end in self.events]
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': trace, 'displayTimeUnit': 'ms'}, f)
+
+
+# Shared instance the game's modules instrument themselves with
+profiler = Profiler()
@@ -0,0 +1,43 @@
+# World sprites are collected as (surface, dest) pairs per layer and submitted
+# with one Surface.blits call per layer, so drawing thousands of entities
+# costs one C call per layer instead of one blit (plus a Vector2) per entity.
+# Layers draw in ascending order; within a layer, in the order queued.
+
+LAYER_PLAYER = 10
+LAYER_ENEMIES = 20
+LAYER_WEAPONS = 30
+LAYER_DROPS = 40
+LAYER_SLASH = 50
+LAYER_DAMAGE_NUMBERS = 60
+
+
+class RenderQueue:
+    def __init__(self):
+        self._layers = {}
+        # Pairs submitted by the last flush
+        self.last_count = 0
+
+    def add(self, layer, image, dest):
+        self.batch(layer).append((image, dest))
+
+    def extend(self, layer, pairs):
+        self.batch(layer).extend(pairs)
+
+    def batch(self, layer):
+        """The pair list for `layer`; callers may append to it directly."""
+        batch = self._layers.get(layer)
+        if batch is None:
+            batch = self._layers[layer] = []
+        return batch
+
+    def flush(self, surface):
+        """Blit every queued layer onto `surface` in layer order and empty the queue."""
+        count = 0
+        for layer in sorted(self._layers):
+            batch = self._layers[layer]
+            if batch:
+                surface.blits(batch, doreturn=False)
+                count += len(batch)
+                batch.clear()
+        self.last_count = count
+        return count
@@ -0,0 +1,206 @@
+import sys
+import time
+import struct
+import hashlib
+import argparse
+
+import game_clock
+import game_random
+from settings import SIM_STEP
+
+# Binary replay log
+#
+#   header: magic, format version, gameplay RNG seed, clock at run start (ms),
+#   fixed simulation step (s)
+#   records: one tag byte followed by a fixed payload; times are stored as the
+#   delta in ms from the previous record so a fixed-step tick costs 4 bytes.
+#
+# Playback rebuilds a fresh headless Level, seeds game_random with the same
+# seed and re-applies every record on a ManualClock, so the run repeats
+# bit-for-bit at whatever speed the CPU allows.
+
+MAGIC = b'VSRP'
+VERSION = 2
+_HEADER = struct.Struct('<4sBQId')
+
+TAG_TICK = 0        # input mask, time delta; one step of the header's fixed step
+TAG_TICK_DT = 1     # input mask, time delta, explicit step dt (s)
+TAG_UPGRADE = 2     # index of the chosen level-up card
+# 3 was TAG_RESUME in version 1 (pause no longer touches the simulation)
+TAG_CHEAT_XP = 4    # debug 'P' key: XP to next level
+TAG_CLOCK = 5       # absolute clock value for gaps that do not fit a delta
+TAG_END = 0xFF      # end of run: final clock + state digest
+
+_TICK = struct.Struct('<BBH')
+_TICK_DT = struct.Struct('<BBHd')
+_EVENT = struct.Struct('<BBH')
+_CLOCK = struct.Struct('<BI')
+_END = struct.Struct('<BI32s')
+
+
+def state_digest(level):
+    """SHA-256 over the simulation state that a faithful replay must reproduce."""
+    h = hashlib.sha256()
+    player = level.player
+    h.update(repr((player.position.x, player.position.y, player.current_health, player.max_health,
+                   player.current_xp, player.level, player.speed)).encode())
+    for enemy in level.enemy_manager.enemy_list:
+        h.update(repr((enemy.enemy_type, enemy.center_x, enemy.center_y, enemy.health,
+                       enemy.knockback_vx, enemy.knockback_vy, enemy.is_dying)).encode())
+    for drop in level.drops:
+        h.update(repr((drop.drop_type, drop.pos_x, drop.pos_y, drop.state)).encode())
+    h.update(repr(sorted(level.taken_upgrades.items())).encode())
+    h.update(repr(game_random.rng.getstate()).encode())
+    h.update(repr(game_random.sample_rng.getstate()).encode())
+    return h.digest()
+
+
+class ReplayRecorder:
+    """Collects a run's seed, per-tick input and upgrade choices into a compact log."""
+
+    def __init__(self, seed, start_ms, step=SIM_STEP):
+        self.seed = seed
+        self.start_ms = start_ms
+        self.step = step
+        self.ticks = 0
+        self._last_ms = start_ms
+        self._buffer = bytearray(_HEADER.pack(MAGIC, VERSION, seed, start_ms, step))
+        self._finished = False
+
+    def _delta(self, now_ms):
+        delta = now_ms - self._last_ms
+        if delta < 0 or delta > 0xFFFF:
+            self._buffer += _CLOCK.pack(TAG_CLOCK, now_ms)
+            delta = 0
+        self._last_ms = now_ms
+        return delta
+
+    def record_tick(self, now_ms, input_mask, dt=None):
+        """One Level.step at clock `now_ms`; dt (s) defaults to the fixed step."""
+        delta = self._delta(now_ms)
+        if dt is None or dt == self.step:
+            self._buffer += _TICK.pack(TAG_TICK, input_mask, delta)
+        else:
+            self._buffer += _TICK_DT.pack(TAG_TICK_DT, input_mask, delta, dt)
+        self.ticks += 1
+
+    def _record_event(self, tag, now_ms, arg=0):
+        self._buffer += _EVENT.pack(tag, arg, self._delta(now_ms))
+
+    def record_upgrade(self, now_ms, choice_index):
+        self._record_event(TAG_UPGRADE, now_ms, choice_index)
+
+    def record_cheat_xp(self, now_ms):
+        self._record_event(TAG_CHEAT_XP, now_ms)
+
+    def finish(self, level):
+        """Append the end marker with a digest of the final state and return the log."""
+        if not self._finished:
+            self._buffer += _END.pack(TAG_END, self._last_ms, state_digest(level))
+            self._finished = True
+        return bytes(self._buffer)
+
+    def save(self, path, level):
+        with open(path, 'wb') as f:
+            f.write(self.finish(level))
+
+
+class ReplayResult:
+    def __init__(self, level, ticks, expected_digest):
+        self.level = level
+        self.ticks = ticks
+        self.expected_digest = expected_digest
+        self.digest = state_digest(level)
+
+    @property
+    def matches(self):
+        """True if the final state equals the recorded one (None if the log has no end marker)."""
+        if self.expected_digest is None:
+            return None
+        return self.digest == self.expected_digest
+
+
+def play(data, level=None, on_tick=None):
+    """Re-run a recorded log on a headless Level as fast as possible.
+
+    `data` is the log bytes; on_tick(level) is called after every step, e.g.
+    to time or inspect late-game states. Returns a ReplayResult.
+    """
+    magic, version, seed, start_ms, step = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("not a replay log (or unsupported version)")
+
+    if level is None:
+        from headless import create_headless_level
+        level = create_headless_level(start_ms)
+    clock = game_clock.get_clock()
+    clock.set(start_ms)
+    game_random.seed(seed)
+    level.reset()
+
+    now_ms = start_ms
+    ticks = 0
+    expected_digest = None
+    offset = _HEADER.size
+    size = len(data)
+    while offset < size:
+        tag = data[offset]
+        if tag == TAG_TICK or tag == TAG_TICK_DT:
+            if tag == TAG_TICK:
+                _, input_mask, delta = _TICK.unpack_from(data, offset)
+                offset += _TICK.size
+                dt = step
+            else:
+                _, input_mask, delta, dt = _TICK_DT.unpack_from(data, offset)
+                offset += _TICK_DT.size
+            now_ms += delta
+            clock.set(now_ms)
+            level.player.input_override = input_mask
+            level.step(dt)
+            ticks += 1
+            if on_tick is not None:
+                on_tick(level)
+        elif tag == TAG_CLOCK:
+            _, now_ms = _CLOCK.unpack_from(data, offset)
+            offset += _CLOCK.size
+        elif tag == TAG_END:
+            _, end_ms, expected_digest = _END.unpack_from(data, offset)
+            offset += _END.size
+            clock.set(end_ms)
+            break
+        else:
+            _, arg, delta = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            now_ms += delta
+            clock.set(now_ms)
+            if tag == TAG_UPGRADE:
+                level.choose_upgrade(arg)
+            elif tag == TAG_CHEAT_XP:
+                level.player.increase_xp(max(1, level.player.xp_to_next_level - level.player.current_xp))
+            else:
+                raise ValueError(f"unknown replay record tag {tag}")
+    return ReplayResult(level, ticks, expected_digest)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Play back a recorded run headless at unlimited speed.')
+    parser.add_argument('path', help='replay log written by main.py --record')
+    args = parser.parse_args(argv)
+
+    with open(args.path, 'rb') as f:
+        data = f.read()
+    started = time.perf_counter()
+    result = play(data)
+    elapsed = time.perf_counter() - started
+    level = result.level
+    print(f"{result.ticks} ticks in {elapsed:.2f} s; player level {level.player.level}, "
+          f"enemies {len(level.enemy_manager.enemy_list)}, drops {len(level.drops)}")
+    if result.matches is None:
+        print("no end marker: final state not verified")
+        return 0
+    print("final state matches recording" if result.matches else "final state DIVERGED from recording")
+    return 0 if result.matches else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
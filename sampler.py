@@ -0,0 +1,133 @@
+from enemy_config import ENEMY_TYPES, ENEMY_SPAWN_WEIGHTS, LEVEL_UNLOCKS, DROP_TYPES, DEFAULT_DROP
+
+# Weighted choices compiled once into alias tables (Vose's alias method), so
+# every spawn or drop roll is one random() call and two list lookups no matter
+# how many outcomes there are. Draws take the RNG explicitly; gameplay passes
+# game_random.sample_rng, the stream reserved for spawn and drop selection.
+
+
+class AliasTable:
+    """O(1) weighted sampling over a fixed list of items."""
+
+    __slots__ = ('items', 'prob', 'alias')
+
+    def __init__(self, items, weights):
+        pairs = [(item, float(w)) for item, w in zip(items, weights) if w > 0]
+        if not pairs:
+            raise ValueError("alias table needs at least one positive weight")
+        n = len(pairs)
+        total = sum(w for _, w in pairs)
+        self.items = [item for item, _ in pairs]
+        scaled = [w * n / total for _, w in pairs]
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.prob[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            (small if scaled[more] < 1.0 else large).append(more)
+        # Leftovers are 1.0 up to rounding error and keep prob 1.0
+
+    def __len__(self):
+        return len(self.items)
+
+    def sample(self, rng):
+        x = rng.random() * len(self.items)
+        i = int(x)
+        return self.items[i] if x - i < self.prob[i] else self.items[self.alias[i]]
+
+    def sample_many(self, rng, count):
+        """`count` independent draws in one call."""
+        items, prob, alias, n, random = self.items, self.prob, self.alias, len(self.items), rng.random
+        out = []
+        for _ in range(count):
+            x = random() * n
+            i = int(x)
+            out.append(items[i] if x - i < prob[i] else items[alias[i]])
+        return out
+
+
+class SpawnTables:
+    """Enemy type tables per player level, from spawn weights and level unlocks.
+
+    A level's table is compiled the first time it is asked for, i.e. once per
+    level change, instead of re-filtering the weights on every spawn.
+    """
+
+    def __init__(self, spawn_weights=ENEMY_SPAWN_WEIGHTS, level_unlocks=LEVEL_UNLOCKS, default='rat'):
+        self.spawn_weights = spawn_weights
+        self.level_unlocks = level_unlocks
+        self.default = default
+        self._types = {}
+        self._tables = {}
+
+    def available_types(self, player_level):
+        types = self._types.get(player_level)
+        if types is None:
+            types = [self.default]  # Always available
+            for unlock_level, enemy_types in self.level_unlocks.items():
+                if player_level >= unlock_level:
+                    types = enemy_types
+            self._types[player_level] = types
+        return types
+
+    def table(self, player_level):
+        """Alias table for the level, or None if no unlocked type has a weight."""
+        if player_level not in self._tables:
+            available = self.available_types(player_level)
+            weighted = [(name, w) for name, w in self.spawn_weights.items() if name in available and w > 0]
+            self._tables[player_level] = (AliasTable([n for n, _ in weighted], [w for _, w in weighted])
+                                          if weighted else None)
+        return self._tables[player_level]
+
+    def sample(self, rng, player_level):
+        table = self.table(player_level)
+        return self.default if table is None else table.sample(rng)
+
+    def sample_many(self, rng, player_level, count):
+        table = self.table(player_level)
+        return [self.default] * count if table is None else table.sample_many(rng, count)
+
+
+class DropTables:
+    """Per enemy type: drop chance plus an alias table over its drop types."""
+
+    def __init__(self, enemy_types=ENEMY_TYPES):
+        self._tables = {}
+        for name, config in enemy_types.items():
+            weights = config.get('drop_weights', DEFAULT_DROP['weights'])
+            types = config.get('drop_types', list(weights.keys()))
+            self._tables[name] = (config.get('drop_chance', DEFAULT_DROP['chance']),
+                                  self._compile(types, weights))
+        self._fallback = (DEFAULT_DROP['chance'], self._compile(None, None))
+
+    @staticmethod
+    def _compile(drop_types, drop_weights):
+        # drop_types[i] gets the i-th value of drop_weights (dict order). Without
+        # weights the types are equally likely; without types, all of DROP_TYPES are
+        if drop_types and drop_weights:
+            return AliasTable(drop_types, list(drop_weights.values()))
+        if drop_types:
+            return AliasTable(drop_types, [1] * len(drop_types))
+        return AliasTable(list(DROP_TYPES.keys()), [1] * len(DROP_TYPES))
+
+    def roll(self, rng, enemy_type, drop_chance=None):
+        """Drop type for one kill of `enemy_type`, or None if nothing drops."""
+        chance, table = self._tables.get(enemy_type, self._fallback)
+        if drop_chance is not None:
+            chance = drop_chance
+        if rng.random() >= chance:
+            return None
+        return table.sample(rng)
+
+    def roll_many(self, rng, enemy_type, count, drop_chance=None):
+        """Drop types for `count` kills of `enemy_type` (misses are left out)."""
+        chance, table = self._tables.get(enemy_type, self._fallback)
+        if drop_chance is not None:
+            chance = drop_chance
+        random = rng.random
+        hits = sum(1 for _ in range(count) if random() < chance)
+        return table.sample_many(rng, hits)
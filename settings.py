@@ -8,3 +8,74 @@ FONT_SIZE = 28
 
 # Movement factors
 DIAGONAL_SPEED_FACTOR = math.sqrt(2) / 2
+
+# Enemy simulation: keep enemy state in NumPy arrays and step it in bulk
+# (ignored when NumPy is not installed)
+ENEMY_ARRAY_STORE = True
+
+# Drops: keep position and collect-animation state in NumPy arrays and step
+# the idle -> bounce -> returning pickup in bulk (ignored without NumPy)
+DROP_ARRAY_STORE = True
+
+# Decode and convert every image at startup (see assets.py); with
+# ASSET_PRELOAD_BACKGROUND the decoding runs on a thread while the menu is up
+ASSET_PRELOAD = True
+ASSET_PRELOAD_BACKGROUND = True
+
+# How often (ms of game time) crowded idle drops are fused; see drop_merge.py
+# and the 'merge' entries in enemy_config.DROP_TYPES
+DROP_MERGE_INTERVAL = 500
+
+# Enemy level of detail: enemies farther than ENEMY_LOD_RADIUS px from the
+# player are stepped every ENEMY_LOD_INTERVAL ticks (the skipped time is
+# applied on their next step) and keep their facing. Enemies beyond
+# ENEMY_DESPAWN_RADIUS are recycled (None disables despawning).
+ENEMY_LOD_RADIUS = 1600
+ENEMY_LOD_INTERVAL = 4
+ENEMY_DESPAWN_RADIUS = None
+
+# Crowd separation: enemies push away from neighbours counted on a grid of
+# this cell size (px); strength is per type ('separation' in ENEMY_TYPES).
+# It changes enemy movement and contact rates, so it is off by default
+# (None); opt in with e.g. 40.
+ENEMY_SEPARATION_CELL = None
+
+# Optional flow-field pathing (see flow_field.py): enemies within
+# FLOW_FIELD_RADIUS cells of FLOW_FIELD_CELL px around the player steer by
+# looking up their cell's direction instead of aiming at the player themselves
+ENEMY_FLOW_FIELD = False
+FLOW_FIELD_CELL = 64
+FLOW_FIELD_RADIUS = 24
+
+# Fixed simulation step in seconds. Level.run advances gameplay in whole steps
+# and interpolates drawing between them; a single frame contributes at most
+# SIM_MAX_FRAME seconds so a long stall cannot queue up a burst of steps.
+SIM_STEP = 1 / 60
+SIM_MAX_FRAME = 0.25
+
+# Enemy spawning (see spawn_scheduler.py). Spawns come due at one per spawn
+# delay and are released by the current wave, cycling through SPAWN_WAVES as
+# (pattern, duration ms, release interval ms):
+#   'trickle' - as they come due, at random points on the off-screen spawn ring
+#   'burst'   - everything owed every interval, clumped at one ring point
+#   'ring'    - everything owed every interval, in a circle around the view
+# The default is a steady trickle, the game's original spawning. Bursts and
+# rings change the balance; opt in with e.g.
+#   (('trickle', 20000, 0), ('burst', 6000, 1500), ('trickle', 20000, 0), ('ring', 4000, 2000))
+SPAWN_WAVES = (
+    ('trickle', 20000, 0),
+)
+SPAWN_MAX_BATCH = 32    # spawns released per tick at most
+SPAWN_MAX_OWED = 64     # owed spawns kept while held back by the live cap
+SPAWN_BURST_RADIUS = 80  # px along a burst's ring point, and up to twice that outward
+ENEMY_LIVE_CAP = None   # no spawns while this many enemies are alive (None: no cap)
+
+# Max released instances kept for reuse per object pool
+POOL_CAPACITY = {
+    'enemy': 2048,
+    'drop': 1024,
+    'damage_number': 256,
+}
+
+# Rendered text surfaces kept by the shared LRU text cache (see text_cache.py)
+TEXT_CACHE_CAPACITY = 512
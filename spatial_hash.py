@@ -0,0 +1,96 @@
+class SpatialHash:
+    """Uniform grid that buckets sprites by the cell containing their rect center.
+
+    With a cell size at least as large as the biggest sprite, a rect query only
+    has to look at the cells overlapping the query rect grown by one sprite
+    extent, instead of testing every sprite in the group.
+    """
+
+    def __init__(self, cell_size):
+        self.cell_size = max(1, int(cell_size))
+        self.cells = {}
+        self._cell_of = {}
+        # Largest sprite extent seen, used to grow queries so edge overlaps are not missed
+        self.max_width = 0
+        self.max_height = 0
+
+    def __len__(self):
+        return len(self._cell_of)
+
+    def _key(self, x, y):
+        size = self.cell_size
+        return (x // size, y // size)
+
+    def clear(self):
+        self.cells = {}
+        self._cell_of = {}
+
+    def insert(self, sprite):
+        rect = sprite.rect
+        key = self._key(rect.centerx, rect.centery)
+        self.cells.setdefault(key, []).append(sprite)
+        self._cell_of[sprite] = key
+        if rect.width > self.max_width:
+            self.max_width = rect.width
+        if rect.height > self.max_height:
+            self.max_height = rect.height
+
+    def remove(self, sprite):
+        key = self._cell_of.pop(sprite, None)
+        if key is None:
+            return
+        bucket = self.cells.get(key)
+        if bucket is not None:
+            bucket.remove(sprite)
+            if not bucket:
+                del self.cells[key]
+
+    def move(self, sprite):
+        """Re-bucket a sprite after its rect moved outside the regular rebuild."""
+        old_key = self._cell_of.get(sprite)
+        if old_key is None:
+            return
+        rect = sprite.rect
+        key = self._key(rect.centerx, rect.centery)
+        if key != old_key:
+            self.remove(sprite)
+            self.insert(sprite)
+
+    def rebuild(self, sprites):
+        """Re-bucket every sprite from its current rect (once per tick)."""
+        cells = {}
+        cell_of = {}
+        size = self.cell_size
+        max_w, max_h = self.max_width, self.max_height
+        for sprite in sprites:
+            rect = sprite.rect
+            key = (rect.centerx // size, rect.centery // size)
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [sprite]
+            else:
+                bucket.append(sprite)
+            cell_of[sprite] = key
+            if rect.width > max_w:
+                max_w = rect.width
+            if rect.height > max_h:
+                max_h = rect.height
+        self.cells = cells
+        self._cell_of = cell_of
+        self.max_width, self.max_height = max_w, max_h
+
+    def query(self, rect):
+        """Return sprites whose rect may overlap `rect` (a superset of the true hits)."""
+        size = self.cell_size
+        cells = self.cells
+        x0 = (rect.left - self.max_width) // size
+        x1 = (rect.right + self.max_width) // size
+        y0 = (rect.top - self.max_height) // size
+        y1 = (rect.bottom + self.max_height) // size
+        found = []
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.extend(bucket)
+        return found
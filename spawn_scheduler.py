@@ -0,0 +1,61 @@
+from settings import SPAWN_WAVES, SPAWN_MAX_BATCH, SPAWN_MAX_OWED, ENEMY_LIVE_CAP
+
+# Spawns are owed at a rate (one per spawn delay) and paid out of a budget,
+# so the spawn rate holds no matter how time is sliced into steps. The
+# current wave's pattern only decides when owed spawns are released and where
+# they appear; the optional live-enemy cap holds them back (back-pressure)
+# and at most SPAWN_MAX_OWED are kept owed meanwhile, so freeing room never
+# dumps a backlog of a whole stall at once.
+
+
+class SpawnScheduler:
+    def __init__(self, waves=SPAWN_WAVES, live_cap=ENEMY_LIVE_CAP, max_batch=SPAWN_MAX_BATCH,
+                 max_owed=SPAWN_MAX_OWED):
+        self.waves = waves            # cycle of (pattern, duration ms, release interval ms)
+        self.live_cap = live_cap
+        self.max_batch = max_batch    # spawns released per tick at most
+        self.max_owed = max_owed
+        self.budget = 0.0
+        self.spawned = 0
+        self.held_back = 0            # ticks the live cap blocked owed spawns
+        self.reset(None)
+
+    def reset(self, now):
+        self.budget = 0.0
+        self._last_tick = now
+        self._wave_index = 0
+        self._wave_start = now
+        self._last_release = now
+
+    def wave(self, now):
+        """Current (pattern, duration, release interval), advancing the wave cycle."""
+        pattern, duration, interval = self.waves[self._wave_index]
+        while now - self._wave_start >= duration:
+            self._wave_start += duration
+            self._wave_index = (self._wave_index + 1) % len(self.waves)
+            pattern, duration, interval = self.waves[self._wave_index]
+        return pattern, duration, interval
+
+    def plan(self, now, spawn_delay, live):
+        """Accrue spawns owed since the last tick; returns (pattern, count) to spawn now."""
+        if self._last_tick is None:
+            self.reset(now)
+        elapsed = now - self._last_tick
+        self._last_tick = now
+        self.budget = min(self.budget + elapsed / spawn_delay, self.max_owed)
+
+        pattern, _, interval = self.wave(now)
+        if interval and now - self._last_release < interval:
+            return pattern, 0
+        count = min(int(self.budget), self.max_batch)
+        if self.live_cap is not None and count > self.live_cap - live:
+            count = max(0, self.live_cap - live)
+            self.held_back += 1
+        if count:
+            self.budget -= count
+            self.spawned += count
+            self._last_release = now
+        return pattern, count
+
+    def stats_line(self):
+        return f"spawns: {self.spawned} (owed {self.budget:.1f}, capped {self.held_back} ticks)"
@@ -1,5 +1,6 @@
 import pygame
 import math
+import animation_cache
 
 class SpinningOrb(pygame.sprite.Sprite):
     def __init__(self, player, radius, rotation_speed, damage):
@@ -10,7 +11,7 @@ class SpinningOrb(pygame.sprite.Sprite):
         self.damage = damage
         self.angle = 0
         # Use provided sprite for the orb (cached)
-        self.image = _load_image_cached('orb.png')
+        self.image = animation_cache.load_sheet('orb.png')
         self.rect = self.image.get_rect(center=self.calculate_orb_position())
 
     def calculate_orb_position(self):
@@ -29,17 +30,5 @@ class SpinningOrb(pygame.sprite.Sprite):
 
     def draw(self, surface, offset):
         # Adjust position by the camera's offset
-        draw_pos = self.rect.topleft - pygame.Vector2(offset)
-        surface.blit(self.image, draw_pos)
-
-
-# --- Module-local image cache ---
-_IMAGE_CACHE = {}
-
-def _load_image_cached(path: str) -> pygame.Surface:
-    surf = _IMAGE_CACHE.get(path)
-    if surf is None:
-        surf = pygame.image.load(path).convert_alpha()
-        _IMAGE_CACHE[path] = surf
-    return surf
+        surface.blit(self.image, (self.rect.x - offset[0], self.rect.y - offset[1]))
 
@@ -0,0 +1,32 @@
+import time
+
+# Cold-start milestones, in ms since this module was first imported (main.py
+# imports it before anything else). Each milestone is kept the first time it
+# is marked, so marking inside the main loop is free after startup:
+#
+#     from startup_trace import trace
+#     trace.mark('first_frame')
+
+
+class StartupTrace:
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.marks = {}
+
+    def mark(self, name):
+        if name not in self.marks:
+            self.marks[name] = (time.perf_counter() - self.origin) * 1000.0
+
+    def get(self, name):
+        return self.marks.get(name)
+
+    def report(self):
+        lines = ['startup trace:']
+        previous = 0.0
+        for name, at in sorted(self.marks.items(), key=lambda item: item[1]):
+            lines.append(f"  {name:<24} {at:8.1f} ms  (+{at - previous:.1f})")
+            previous = at
+        return lines
+
+
+trace = StartupTrace()
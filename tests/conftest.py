@@ -0,0 +1,21 @@
+import os
+import sys
+
+# The game modules live flat in the repository root; run pygame without a window or audio
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import pytest
+
+from settings import DISPLAY_WIDTH, DISPLAY_HEIGHT
+
+
+@pytest.fixture(scope='session')
+def display():
+    pygame.init()
+    surface = pygame.display.set_mode((DISPLAY_WIDTH, DISPLAY_HEIGHT))
+    yield surface
+    pygame.quit()
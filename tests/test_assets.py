@@ -0,0 +1,31 @@
+import os
+import time
+from collections import Counter
+
+import pygame
+
+from assets import AssetManager
+
+
+def test_preload_thread_and_main_thread_decode_each_file_once(display, monkeypatch):
+    manager = AssetManager()
+    decodes = Counter()
+    load = pygame.image.load
+
+    def slow_load(path):
+        decodes[os.path.basename(path)] += 1
+        time.sleep(0.005)
+        return load(path)
+
+    monkeypatch.setattr(pygame.image, 'load', slow_load)
+    names = manager.discover()
+    manager.preload(background=True)
+    # The main thread asks for everything in the opposite order meanwhile
+    images = {name: manager.image(name) for name in reversed(names)}
+    manager.finish_preload()
+
+    assert decodes == Counter(names)
+    for name in names:
+        assert manager.image(name) is images[name]
+        assert manager.stats[name]['bytes'] > 0
+    assert not manager._decoded and not manager._decoding
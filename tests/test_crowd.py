@@ -0,0 +1,39 @@
+import math
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from crowd import separation_velocity, separation_velocity_py
+
+CELL = 32
+STRENGTH = 60.0
+
+
+def pushes(neighbours):
+    """Separation velocity of an enemy at the origin with `neighbours` at (20, 0)."""
+    positions = [(0.0, 0.0)] + [(20.0, 0.0)] * neighbours
+    strengths = [STRENGTH] * len(positions)
+    seqs = list(range(len(positions)))
+    fast = separation_velocity(np.array(positions), np.array(strengths), np.array(seqs), CELL)
+    slow = separation_velocity_py(positions, strengths, seqs, CELL)
+    assert np.allclose(fast, slow)
+    return fast[0]
+
+
+def test_one_neighbour_pushes_by_overlap():
+    push_x, push_y = pushes(1)
+    overlap = 1.0 - 20.0 / (CELL * 1.5)
+    assert push_x == pytest.approx(-STRENGTH * overlap)
+    assert push_y == pytest.approx(0.0)
+
+
+def test_crowd_push_is_capped_at_strength():
+    one = math.hypot(*pushes(1))
+    many = math.hypot(*pushes(8))
+    assert one < many
+    assert many == pytest.approx(STRENGTH)
+
+
+def test_no_neighbours_no_push():
+    assert tuple(pushes(0)) == (0.0, 0.0)
@@ -0,0 +1,21 @@
+import pygame
+
+from glyph_atlas import GlyphAtlas
+
+
+def test_outlines_do_not_cover_the_previous_glyph(display):
+    font = pygame.font.Font(None, 32)
+    atlas = GlyphAtlas(font, thickness=2)
+    for scale in (1.0, atlas.min_scale):
+        placed = atlas.layout('808', 200, 100, scale=scale)
+        index = atlas.scale_index(scale)
+        t = atlas.thickness * atlas.scales[index]
+        for (image, (x, _)), (_, (next_x, _)) in zip(placed, placed[1:]):
+            # The previous fill ends one outline thickness before its surface does
+            fill_right = x + image.get_width() - t
+            assert next_x >= int(fill_right) - 1
+            assert next_x + t <= x + image.get_width() + 1
+        first_x = placed[0][1][0]
+        last_image, (last_x, _) = placed[-1]
+        width, _ = atlas.size('808', index)
+        assert abs((last_x + last_image.get_width() - first_x) - width) <= 1
@@ -0,0 +1,17 @@
+import pytest
+
+import game_clock
+import game_random
+from headless import create_headless_level, simulate
+from settings import SIM_STEP
+
+
+def test_simulate_stops_when_the_player_dies():
+    level = create_headless_level(1000)
+    game_random.seed(3)
+    level.reset()
+    # Standing still, the player is overrun well within two minutes
+    steps = simulate(level, 120.0)
+    assert steps < round(120.0 / SIM_STEP)
+    assert level.player.current_health <= 0
+    assert game_clock.get_ticks() == pytest.approx(1000 + steps * SIM_STEP * 1000.0, abs=1)
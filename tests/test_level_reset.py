@@ -0,0 +1,53 @@
+import game_clock
+import game_random
+from headless import create_headless_level, simulate
+from player import INPUT_LEFT, INPUT_UP, INPUT_RIGHT, INPUT_DOWN
+from replay import state_digest
+
+START_MS = 1000
+
+
+def zigzag(now_ms):
+    return (INPUT_LEFT, INPUT_UP, INPUT_RIGHT, INPUT_DOWN)[(now_ms // 2000) % 4]
+
+
+def play_run(level, seed=5):
+    game_clock.get_clock().set(START_MS)
+    game_random.seed(seed)
+    level.reset()
+    for _ in range(3):
+        simulate(level, 5, input_script=zigzag)
+        # Level up (and take an upgrade) like the debug 'P' key
+        level.player.increase_xp(level.player.xp_to_next_level - level.player.current_xp)
+    simulate(level, 5, input_script=zigzag)
+    return state_digest(level)
+
+
+def test_reset_repeats_a_run_and_keeps_resources():
+    level = create_headless_level(START_MS)
+    atlas = level.damage_numbers.atlas
+    title_font = level.level_up_screen.title_font
+    pools = (level.enemy_manager.enemy_pool, level.drop_pool, level.damage_numbers.pool)
+    weapons = level.weapons
+
+    first = play_run(level)
+    assert level.player.level > 1 and level.taken_upgrades
+    second = play_run(level)
+
+    assert first == second
+    assert level.damage_numbers.atlas is atlas
+    assert level.level_up_screen.title_font is title_font
+    assert (level.enemy_manager.enemy_pool, level.drop_pool, level.damage_numbers.pool) == pools
+    assert level.weapons is weapons
+    assert level.enemy_manager.enemy_pool.reused > 0
+
+
+def test_reset_restores_start_state():
+    level = create_headless_level(START_MS)
+    play_run(level)
+    level.reset()
+    assert level.player.level == 1
+    assert level.player.current_health == level.player.max_health
+    assert not level.weapons.get_weapon('orb').enabled
+    assert len(level.enemy_manager.enemy_list) == 0 and len(level.drops) == 0
+    assert level.taken_upgrades == {} and level.kills == 0
@@ -0,0 +1,56 @@
+import pygame
+
+from level_up_screen import LevelUpScreen
+
+CHOICES = [{'name': 'Vitality', 'description': '+20 max health'},
+           {'name': 'Swiftness', 'description': '+10% speed'}]
+
+
+def test_first_frame_is_full_then_partial(display):
+    screen = LevelUpScreen(display)
+    screen.show_upgrades(CHOICES)
+    assert screen.draw() is None
+    for _ in range(5):
+        dirty = screen.draw()
+        assert isinstance(dirty, list)
+        assert all(display.get_rect().contains(rect) for rect in dirty)
+
+
+def test_rain_keeps_falling_while_open(display):
+    screen = LevelUpScreen(display)
+    screen.show_upgrades(CHOICES)
+    rain = screen._exp_rain
+    for _ in range(600):
+        rain.update(0.05)
+    # Fallen drops are replaced for as long as the screen is open
+    assert len(rain.particles) > rain.max_count // 2
+    assert len(rain.particles) <= rain.max_count
+
+
+def test_steady_state_frame_is_window_only(display):
+    screen = LevelUpScreen(display, particles=False)
+    screen.show_upgrades(CHOICES)
+    screen.draw()
+    screen.draw()
+    window = (screen.window_x, screen.window_y, screen.window_width, screen.window_height)
+    assert screen.draw() == [window]
+
+
+def test_partial_frames_erase_old_drops(display):
+    display.fill((40, 90, 40))
+    screen = LevelUpScreen(display)
+    screen.show_upgrades(CHOICES)
+    screen.draw()
+    backdrop = screen._backdrop.copy()
+    for _ in range(10):
+        screen._last_tick -= 50  # let the drops fall 50 ms per frame
+        screen.draw()
+    # Stop the rain: this frame only erases the drops drawn last frame
+    screen._exp_rain = None
+    screen.draw()
+    # Apart from the window, the display is the dimmed scene again
+    window = pygame.Rect(screen.window_x, screen.window_y, screen.window_width, screen.window_height)
+    shown = display.copy()
+    for surface in (shown, backdrop):
+        surface.fill((0, 0, 0), window)
+    assert pygame.image.tobytes(shown, 'RGB') == pygame.image.tobytes(backdrop, 'RGB')
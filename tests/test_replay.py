@@ -0,0 +1,71 @@
+import pygame
+import pytest
+
+import game_clock
+import replay
+from headless import create_headless_level
+from player import INPUT_LEFT, INPUT_UP, INPUT_RIGHT, INPUT_DOWN
+from settings import SIM_STEP
+
+STEP_MS = SIM_STEP * 1000.0
+
+
+def record_run(seconds=40, seed=1234):
+    """Record a headless run the way Level.advance does; returns (level, log bytes)."""
+    level = create_headless_level(5000)
+    clock = game_clock.get_clock()
+    recorder = level.start_recording(seed=seed)
+    for tick in range(int(seconds / SIM_STEP)):
+        if tick == 600:
+            # A long pause: the clock jumps further than a tick delta can hold
+            clock.advance(70000)
+        clock.advance(STEP_MS)
+        level.player.input_override = (0, INPUT_LEFT, INPUT_UP | INPUT_RIGHT, INPUT_DOWN)[(tick // 90) % 4]
+        recorder.record_tick(clock.get_ticks(), level.player.read_input())
+        level.step(SIM_STEP)
+        if tick % 500 == 250:
+            # Debug 'P' key: straight to the next level
+            level.handle_events([pygame.event.Event(pygame.KEYDOWN, key=pygame.K_p)])
+        if level.level_up_screen.is_active:
+            choices = level.level_up_screen.upgrade_choices
+            level.choose_upgrade(tick % len(choices))
+    return level, recorder.finish(level)
+
+
+@pytest.fixture(scope='module')
+def recorded():
+    return record_run()
+
+
+def test_round_trip_reproduces_the_run(recorded):
+    level, data = recorded
+    assert level.taken_upgrades
+    result = replay.play(data)
+    assert result.ticks == int(40 / SIM_STEP)
+    assert result.matches
+    assert result.digest == replay.state_digest(level)
+    assert result.level.player.level == level.player.level
+
+
+def test_replay_on_a_used_level_matches(recorded):
+    _, data = recorded
+    first = replay.play(data)
+    # The same Level again, after a whole run: reset() must restore everything
+    again = replay.play(data, level=first.level)
+    assert again.matches
+    assert again.digest == first.digest
+
+
+def test_changed_input_changes_the_digest(recorded):
+    _, data = recorded
+    tampered = bytearray(data)
+    offset = replay._HEADER.size
+    assert tampered[offset] == replay.TAG_TICK
+    tampered[offset + 1] = INPUT_RIGHT  # first tick's input mask
+    result = replay.play(bytes(tampered))
+    assert result.matches is False
+
+
+def test_rejects_other_files():
+    with pytest.raises(ValueError):
+        replay.play(b'PNG\x00' + bytes(32))
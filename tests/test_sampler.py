@@ -0,0 +1,58 @@
+import random
+from collections import Counter
+
+import pytest
+
+from sampler import AliasTable, SpawnTables
+
+WEIGHTS = {'rat': 50, 'zombie': 25, 'ghost': 15, 'skeleton': 9, 'boss': 1}
+
+
+def exact_distribution(table):
+    # Column i is hit with 1/n; it yields its own item with prob[i], else its alias
+    n = len(table)
+    mass = Counter()
+    for i in range(n):
+        mass[table.items[i]] += table.prob[i] / n
+        mass[table.items[table.alias[i]]] += (1.0 - table.prob[i]) / n
+    return mass
+
+
+def test_table_encodes_the_weights_exactly():
+    table = AliasTable(list(WEIGHTS), list(WEIGHTS.values()))
+    total = sum(WEIGHTS.values())
+    mass = exact_distribution(table)
+    for item, weight in WEIGHTS.items():
+        assert mass[item] == pytest.approx(weight / total, abs=1e-12)
+
+
+def test_samples_follow_the_weights():
+    table = AliasTable(list(WEIGHTS), list(WEIGHTS.values()))
+    draws = 200000
+    counts = Counter(table.sample_many(random.Random(42), draws))
+    total = sum(WEIGHTS.values())
+    for item, weight in WEIGHTS.items():
+        expected = weight / total
+        # Well inside 5 standard deviations of a binomial count
+        sigma = (expected * (1 - expected) / draws) ** 0.5
+        assert abs(counts[item] / draws - expected) < 5 * sigma
+
+
+def test_sample_many_matches_repeated_sample():
+    table = AliasTable(list(WEIGHTS), list(WEIGHTS.values()))
+    one_by_one = random.Random(7)
+    assert table.sample_many(random.Random(7), 500) == [table.sample(one_by_one) for _ in range(500)]
+
+
+def test_zero_weights_never_drawn():
+    table = AliasTable(['a', 'b', 'c'], [0, 3, 1])
+    assert table.items == ['b', 'c']
+    assert 'a' not in table.sample_many(random.Random(1), 1000)
+    with pytest.raises(ValueError):
+        AliasTable(['a'], [0])
+
+
+def test_spawn_tables_only_offer_unlocked_types():
+    tables = SpawnTables(WEIGHTS, {1: ['rat'], 5: ['rat', 'zombie', 'ghost']})
+    assert set(tables.sample_many(random.Random(3), 1, 300)) == {'rat'}
+    assert set(tables.sample_many(random.Random(3), 5, 3000)) == {'rat', 'zombie', 'ghost'}
@@ -0,0 +1,67 @@
+import random
+
+import pygame
+
+from spatial_hash import SpatialHash
+
+CELL = 64
+
+
+class Box:
+    def __init__(self, x, y, w, h):
+        self.rect = pygame.Rect(x, y, w, h)
+
+
+def true_hits(boxes, rect):
+    return {box for box in boxes if box.rect.colliderect(rect)}
+
+
+def query_hits(grid, rect):
+    return {box for box in grid.query(rect) if box.rect.colliderect(rect)}
+
+
+def test_query_finds_sprites_across_cell_borders():
+    # Centers sit exactly on cell corners and edges, including negative ones
+    boxes = [Box(cx * CELL - 10, cy * CELL - 10, 20, 20)
+             for cx in range(-2, 3) for cy in range(-2, 3)]
+    grid = SpatialHash(CELL)
+    grid.rebuild(boxes)
+    for x in range(-2 * CELL - 12, 2 * CELL + 12, 7):
+        for y in (-CELL - 1, -1, 0, CELL - 1, CELL):
+            rect = pygame.Rect(x, y, 3, 3)
+            assert query_hits(grid, rect) == true_hits(boxes, rect)
+
+
+def test_query_finds_the_largest_sprite_from_far_cells():
+    rng = random.Random(5)
+    boxes = [Box(rng.randint(-600, 600), rng.randint(-600, 600), 20, 20) for _ in range(300)]
+    # Much larger than a cell: its center cell is far from most of its area
+    giant = Box(-40, -300, 5 * CELL, 3 * CELL)
+    boxes.append(giant)
+    grid = SpatialHash(CELL)
+    grid.rebuild(boxes)
+    for corner in (giant.rect.topleft, giant.rect.topright, giant.rect.bottomleft, giant.rect.bottomright):
+        rect = pygame.Rect(0, 0, 4, 4)
+        rect.center = corner
+        assert giant in query_hits(grid, rect)
+    for _ in range(500):
+        rect = pygame.Rect(rng.randint(-700, 700), rng.randint(-700, 700), rng.randint(1, 90), rng.randint(1, 90))
+        assert query_hits(grid, rect) == true_hits(boxes, rect)
+
+
+def test_insert_move_remove_match_rebuild():
+    rng = random.Random(9)
+    boxes = [Box(rng.randint(-500, 500), rng.randint(-500, 500), 24, 24) for _ in range(100)]
+    grid = SpatialHash(CELL)
+    for box in boxes:
+        grid.insert(box)
+    for box in boxes[::3]:
+        box.rect.move_ip(rng.randint(-200, 200), rng.randint(-200, 200))
+        grid.move(box)
+    for box in boxes[::5]:
+        grid.remove(box)
+    alive = [box for i, box in enumerate(boxes) if i % 5]
+    assert len(grid) == len(alive)
+    for _ in range(300):
+        rect = pygame.Rect(rng.randint(-700, 700), rng.randint(-700, 700), 60, 60)
+        assert query_hits(grid, rect) == true_hits(alive, rect)
@@ -0,0 +1,22 @@
+import pygame
+
+import game_random
+from enemy_manager import EnemyManager
+
+
+def test_burst_spawns_stay_off_screen(display):
+    manager = EnemyManager(display, 20, 20)
+    game_random.seed(11)
+    camera = (-300, 450)
+    view = pygame.Rect(camera, display.get_size())
+    for _ in range(200):
+        for point in manager.spawn_positions('burst', camera, 16):
+            assert not view.collidepoint(point)
+
+
+def test_default_spawning_is_an_uncapped_trickle():
+    from spawn_scheduler import SpawnScheduler
+    scheduler = SpawnScheduler()
+    scheduler.reset(0)
+    pattern, count = scheduler.plan(5000, 500, live=100000)
+    assert (pattern, count) == ('trickle', 10)
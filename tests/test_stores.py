@@ -0,0 +1,95 @@
+import random
+
+import pygame
+import pytest
+
+pytest.importorskip('numpy')
+
+from drop_store import DropStore, StoredDrop
+from enemy_store import EnemyStore, StoredEnemy
+
+
+def enemy_state(enemy):
+    return (enemy.center_x, enemy.center_y, enemy.health, enemy.spawn_seq, enemy.enemy_type)
+
+
+def drop_state(drop):
+    return (drop.pos_x, drop.pos_y, drop.value, drop.drop_type)
+
+
+def check_packed(store, live):
+    assert store.count == len(live) == len(store.views)
+    for view in live:
+        assert store.views[view._slot] is view
+
+
+def test_enemy_views_keep_their_state_through_swap_remove(display):
+    rng = random.Random(4)
+    # Starts at 16 slots, so this also grows the arrays twice
+    store = EnemyStore(capacity=16)
+    types = ('rat', 'zombie', 'ghost', 'skeleton')
+    enemies = []
+    for seq in range(60):
+        enemy = StoredEnemy(store, rng.randint(-500, 500), rng.randint(-500, 500), rng.choice(types))
+        enemy.spawn_seq = seq
+        enemy.health = 10 + seq
+        enemies.append(enemy)
+    expected = {enemy: enemy_state(enemy) for enemy in enemies}
+
+    # Remove from the front, the middle and the very end
+    removed = [enemies[0], enemies[59], enemies[30]] + rng.sample(enemies[1:30], 10)
+    for enemy in removed:
+        enemy.kill()
+    live = [enemy for enemy in enemies if enemy not in removed]
+
+    check_packed(store, live)
+    for enemy in enemies:
+        # Killed views keep a detached snapshot of their last state
+        assert enemy_state(enemy) == expected[enemy]
+    assert all(enemy._slot is None for enemy in removed)
+
+    # A recycled view claims a fresh slot at the end
+    reused = removed[0]
+    reused.reset(5, 6, 'rat')
+    check_packed(store, live + [reused])
+    assert reused._slot == store.count - 1
+
+
+def test_drop_views_keep_their_state_through_swap_remove(display):
+    rng = random.Random(8)
+    store = DropStore(capacity=16)
+    drops = [StoredDrop(store, display, (rng.uniform(-800, 800), rng.uniform(-800, 800)), 'exp', 2, value=i + 1)
+             for i in range(50)]
+    expected = {drop: drop_state(drop) for drop in drops}
+
+    removed = [drops[-1], drops[0]] + rng.sample(drops[1:-1], 20)
+    for drop in removed:
+        drop.kill()
+    live = [drop for drop in drops if drop not in removed]
+
+    check_packed(store, live)
+    for drop in drops:
+        assert drop_state(drop) == expected[drop]
+
+    store.clear()
+    assert store.count == 0
+    for drop in live:
+        assert drop._slot is None and drop_state(drop) == expected[drop]
+
+
+
+
+def test_drop_rects_and_draw_list_follow_positions(display):
+    store = DropStore(capacity=16)
+    first = StoredDrop(store, display, (0, 0), 'exp', 2)
+    last = StoredDrop(store, display, (100, 100), 'exp', 2)
+    far = StoredDrop(store, display, (5000, 5000), 'exp', 2)
+    first.kill()
+    store.force_return((0, 0))
+    for _ in range(5):
+        store.update((0, 0), 1 / 60, 0)
+    for drop in (last, far):
+        assert drop.rect.center == (int(drop.pos_x), int(drop.pos_y))
+    # Only drops overlapping the view are listed, at their rect's screen position
+    view = pygame.Rect(-200, -200, 400, 400)
+    assert store.draw_list(view) == [(last.image, (last.rect.x - view.x, last.rect.y - view.y))]
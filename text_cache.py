@@ -0,0 +1,72 @@
+from collections import OrderedDict
+
+from settings import TEXT_CACHE_CAPACITY
+
+# Rendered text shared by every widget, keyed by (font, text, antialias,
+# color, background) and evicted least recently used first. HUD labels change
+# at most once a second and menu labels never, so almost every frame is a
+# hit and font.render only runs when a value actually changes. Returned
+# surfaces are shared: blit them, never draw on them.
+
+
+class TextCache:
+    def __init__(self, capacity=TEXT_CACHE_CAPACITY):
+        self.capacity = capacity
+        self._surfaces = OrderedDict()
+        self._wrapped = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _lookup(self, store, key, build):
+        value = store.get(key)
+        if value is not None:
+            store.move_to_end(key)
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = store[key] = build()
+        if len(store) > self.capacity:
+            store.popitem(last=False)
+            self.evictions += 1
+        return value
+
+    def render(self, font, text, antialias, color, background=None):
+        """Cached font.render(text, antialias, color, background)."""
+        key = (font, text, antialias, color, background)
+        return self._lookup(self._surfaces, key,
+                            lambda: font.render(text, antialias, color, background))
+
+    def wrap(self, font, text, max_width, max_lines=None):
+        """`text` split at spaces into lines at most max_width px wide (cached, as a tuple)."""
+        key = (font, text, max_width, max_lines)
+        return self._lookup(self._wrapped, key, lambda: _wrap(font, text, max_width, max_lines))
+
+    def clear(self):
+        self._surfaces.clear()
+        self._wrapped.clear()
+
+    def stats_line(self):
+        total = self.hits + self.misses
+        rate = self.hits / total * 100 if total else 0.0
+        return (f"text cache: {rate:.0f}% hits ({self.hits} hit, {self.misses} miss) "
+                f"{len(self._surfaces)} cached, {self.evictions} evicted")
+
+
+def _wrap(font, text, max_width, max_lines):
+    lines = []
+    current = ""
+    for word in text.split():
+        test = (current + " " + word).strip()
+        if font.size(test)[0] <= max_width:
+            current = test
+        else:
+            if current:
+                lines.append(current)
+            current = word
+    if current:
+        lines.append(current)
+    return tuple(lines[:max_lines] if max_lines is not None else lines)
+
+
+text_cache = TextCache()
@@ -3,6 +3,8 @@ import math
 from typing import List, Tuple, Dict
 
 from spinning_orb import SpinningOrb
+from profiler import profiler
+from render_queue import LAYER_WEAPONS
 
 
 class BaseWeapon:
@@ -10,6 +12,10 @@ class BaseWeapon:
         self.player = player
         self.enabled = False
 
+    def reset(self) -> None:
+        """Locked and unupgraded again, as at the start of a run."""
+        self.enabled = False
+
     def enable(self) -> None:
         self.enabled = True
 
@@ -17,7 +23,11 @@ class BaseWeapon:
         pass
 
     def draw(self, surface: pygame.Surface, offset: Tuple[int, int]) -> None:
-        pass
+        surface.blits(self.blit_pairs(offset), doreturn=False)
+
+    def blit_pairs(self, offset: Tuple[int, int]) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """(image, screen position) for everything this weapon draws this frame."""
+        return []
 
     def get_hit_sprites(self) -> List[Tuple[pygame.sprite.Sprite, int]]:
         return []
@@ -27,6 +37,10 @@ class OrbWeapon(BaseWeapon):
     def __init__(self, player: pygame.sprite.Sprite, display: pygame.Surface):
         super().__init__(player)
         self.display = display
+        self.reset()
+
+    def reset(self) -> None:
+        super().reset()
         self.orbs: List[SpinningOrb] = []
         self.orb_count = 1
         self.radius = 75
@@ -108,11 +122,11 @@ class OrbWeapon(BaseWeapon):
             for orb in self.orbs:
                 orb.update(dt)
 
-    def draw(self, surface: pygame.Surface, offset: Tuple[int, int]) -> None:
+    def blit_pairs(self, offset: Tuple[int, int]) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
         if not (self.enabled and self.active):
-            return
-        for orb in self.orbs:
-            orb.draw(surface, offset)
+            return []
+        offset_x, offset_y = offset
+        return [(orb.image, (orb.rect.x - offset_x, orb.rect.y - offset_y)) for orb in self.orbs]
 
     def get_hit_sprites(self) -> List[Tuple[pygame.sprite.Sprite, int]]:
         if not (self.enabled and self.active):
@@ -127,6 +141,11 @@ class BackSlashWeapon(BaseWeapon):
         self.back_slash = slash_class(self.player, offset_x=75, offset_y=0,
                                       sprite_sheet_path='slash_anim.png',
                                       frame_dimensions=(50, 37), num_frames=4, scale=2)
+        self.reset()
+
+    def reset(self) -> None:
+        super().reset()
+        self.back_slash.reset()
         self.back_slash_damage_multiplier = 1.0
         self.cooldown_ms = 2000  # pause after a back slash finishes
         self._cooldown_until = 0
@@ -164,9 +183,11 @@ class BackSlashWeapon(BaseWeapon):
         # Set cooldown at the moment the slash deactivates
         # We cannot easily detect that here without extra state; track last state
 
-    def draw(self, surface: pygame.Surface, offset: Tuple[int, int]) -> None:
-        if self.back_slash.active:
-            self.back_slash.draw(surface, offset)
+    def blit_pairs(self, offset: Tuple[int, int]) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        slash = self.back_slash
+        if not slash.active:
+            return []
+        return [(slash.image, (slash.rect.x - offset[0], slash.rect.y - offset[1]))]
 
     def get_hit_sprites(self) -> List[Tuple[pygame.sprite.Sprite, int]]:
         if not self.enabled or not self.back_slash.active:
@@ -183,6 +204,10 @@ class WeaponManager:
         self.weapons['orb'] = OrbWeapon(player, display)
         self.weapons['back_slash'] = BackSlashWeapon(player, slash_class)
 
+    def reset(self) -> None:
+        for weapon in self.weapons.values():
+            weapon.reset()
+
     def enable_weapon(self, name: str) -> None:
         if name in self.weapons:
             self.weapons[name].enable()
@@ -191,12 +216,20 @@ class WeaponManager:
         return self.weapons.get(name)
 
     def update(self, dt: float, now_ms: int) -> None:
-        for weapon in self.weapons.values():
-            weapon.update(dt, now_ms)
-
-    def draw(self, surface: pygame.Surface, offset: Tuple[int, int]) -> None:
-        for weapon in self.weapons.values():
-            weapon.draw(surface, offset)
+        with profiler.scope('weapons.update'):
+            for weapon in self.weapons.values():
+                weapon.update(dt, now_ms)
+
+    def draw(self, surface: pygame.Surface, offset: Tuple[int, int], queue=None) -> None:
+        """Draw every weapon, or queue them on LAYER_WEAPONS of a RenderQueue."""
+        with profiler.scope('weapons.draw'):
+            batch = []
+            for weapon in self.weapons.values():
+                batch.extend(weapon.blit_pairs(offset))
+            if queue is not None:
+                queue.extend(LAYER_WEAPONS, batch)
+            else:
+                surface.blits(batch, doreturn=False)
 
     def get_hit_sprites(self) -> List[Tuple[pygame.sprite.Sprite, int]]:
         hits: List[Tuple[pygame.sprite.Sprite, int]] = []
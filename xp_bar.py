@@ -1,5 +1,7 @@
 import pygame
+import game_clock
 from settings import FONT_SIZE
+from text_cache import text_cache
 
 class XPBar:
     def __init__(self, display, player):
@@ -14,17 +16,20 @@ class XPBar:
         self.font = pygame.font.SysFont('Arial', 18, True)
         # Timer styling: exactly match scoreboard font
         self.timer_font = pygame.font.SysFont(None, FONT_SIZE)
-        self.timer_start_ms = pygame.time.get_ticks()
+        self.reset()
+
+    def reset(self):
+        self.timer_start_ms = game_clock.get_ticks()
         self.timer_surface = None
 
     def update(self, current_xp, max_xp):
-        # Render the level text only once in update
-        self.level_surface = self.font.render(f"L E V E L : {self.player.level}", True, 'white')
+        # Labels change at most once a second; the text cache renders them only then
+        self.level_surface = text_cache.render(self.font, f"L E V E L : {self.player.level}", True, 'white')
         # Timer text in m:ss format since session start
-        elapsed_ms = max(0, pygame.time.get_ticks() - self.timer_start_ms)
+        elapsed_ms = max(0, game_clock.get_ticks() - self.timer_start_ms)
         seconds = elapsed_ms // 1000
         m, s = divmod(seconds, 60)
-        self.timer_surface = self.timer_font.render(f"{m}:{s:02d}", False, 'white')
+        self.timer_surface = text_cache.render(self.timer_font, f"{m}:{s:02d}", False, 'white')
         self.draw(current_xp, max_xp)
 
     def draw(self, current_xp, max_xp):